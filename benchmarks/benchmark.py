@@ -0,0 +1,412 @@
+"""
+I Language lexer and parser benchmarks.
+Version: 0.1.3
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import gc
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "ilanguage"))
+from Main import _ast as ast  # pylint: disable=E0401, C0413
+from Main import lexer, parser  # pylint: disable=E0401, C0413
+
+import corpus  # pylint: disable=C0413
+
+
+#############
+# CONSTANTS #
+#############
+
+DEFAULT_SIZE: Final[int] = 200_000  # Characters per program
+DEFAULT_REPEAT: Final[int] = 5
+DEFAULT_TOLERANCE: Final[float] = 0.3  # Allowed relative growth of peak memory
+# Allowed relative slowdown, timings vary a lot more than the peak memory
+DEFAULT_SPEED_TOLERANCE: Final[float] = 0.5
+DEFAULT_ATTEMPTS: Final[int] = 3  # Benchmarks of a shape before a slowdown counts
+MEMORY_SLACK: Final[int] = 64 * 1024  # Bytes, small peaks vary a lot between runs
+BASELINE: Final[pathlib.Path] = pathlib.Path(__file__).parent / "baseline.json"
+
+# Metrics, which have to stay above (1) or below (-1) the baseline
+METRICS: Final[Dict[str, int]] = {
+    "lex_tokens_per_second": 1,
+    "lex_peak_memory": -1,
+    "parse_tokens_per_second": 1,
+    "parse_peak_memory": -1,
+    "parse_legacy_speedup": 1,
+}
+# Metrics comparing two measurements on this machine, which are not calibrated. The
+# speedup over the legacy parser keeps shapes of short statements (e.g. strings and
+# comments), where the parser is only about as fast as the legacy parser, from
+# getting slower unnoticed.
+RELATIVE_METRICS: Final[Tuple[str, ...]] = ("parse_legacy_speedup",)
+
+
+###########
+# MEASURE #
+###########
+
+
+def measure(function: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """Measures the run time and the peak memory of a function.
+
+    The time is measured without tracing memory allocations, as tracing slows
+    every allocation down.
+
+    Args:
+        function (Callable[[], Any]): Function to measure.
+        repeat (int): Number of runs, the fastest one is used.
+
+    Returns:
+        Tuple[float, int]: Seconds of the fastest run and peak memory in bytes.
+    """
+
+    seconds = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(seconds), peak
+
+
+def calibrate(repeat: int) -> float:
+    """Measures the speed of the machine with a fixed workload.
+
+    Throughput is scaled with the ratio of the calibrations, so a baseline can be
+    compared on other (e.g. slower CI) machines.
+
+    Args:
+        repeat (int): Number of runs, the fastest one is used.
+
+    Returns:
+        float: Seconds of the fastest run.
+    """
+
+    def workload() -> None:
+        names: Dict[str, int] = {}
+        for index in range(100_000):
+            names[f"name{index % 1000}"] = len(names) + index
+
+    return measure(workload, repeat)[0]
+
+
+def parse(tokens: List[Any]) -> ast.Main:
+    """Parses tokens.
+
+    Args:
+        tokens (List[Any]): Tokens to parse.
+
+    Returns:
+        ast.Main: Parse tree of the tokens.
+    """
+
+    return parser.Parser(tokens).parse(start=ast.Main())
+
+
+def parse_legacy(tokens: List[Any]) -> ast.Main:
+    """Parses tokens with the legacy parser.
+
+    Args:
+        tokens (List[Any]): Tokens to parse.
+
+    Returns:
+        ast.Main: Parse tree of the tokens.
+    """
+
+    return parser.LegacyParser(tokens).parse(start=ast.Main())
+
+
+def benchmark(shape: str, size: int, repeat: int) -> Dict[str, float]:
+    """Benchmarks the lexer and the parser on a generated program.
+
+    Args:
+        shape (str): Shape of the program.
+        size (int): Number of characters of the program.
+        repeat (int): Number of runs.
+
+    Returns:
+        Dict[str, float]: Measured metrics.
+    """
+
+    source = corpus.generate(shape, size)
+    tokens = lexer.lex(source)
+    lex_seconds, lex_peak = measure(lambda: lexer.lex(source), repeat)
+    parse_seconds, parse_peak = measure(lambda: parse(tokens), repeat)
+    legacy_seconds, _ = measure(lambda: parse_legacy(tokens), repeat)
+
+    return {
+        "characters": len(source),
+        "tokens": len(tokens),
+        "lex_seconds": lex_seconds,
+        "lex_tokens_per_second": len(tokens) / lex_seconds,
+        "lex_peak_memory": lex_peak,
+        "parse_seconds": parse_seconds,
+        "parse_tokens_per_second": len(tokens) / parse_seconds,
+        "parse_peak_memory": parse_peak,
+        "parse_legacy_speedup": legacy_seconds / parse_seconds,
+    }
+
+
+def best(*results: Dict[str, float]) -> Dict[str, float]:
+    """Combines the results of several benchmarks of a shape.
+
+    The highest throughput of every metric is used, so a slow run caused by other
+    processes does not count as a regression. The peak memory does not vary
+    between runs, it is taken from the first result.
+
+    Args:
+        *results (Dict[str, float]): Results of the same shape.
+
+    Returns:
+        Dict[str, float]: Combined result.
+    """
+
+    combined = dict(results[0])
+
+    for metric, direction in METRICS.items():
+        if direction > 0:
+            combined[metric] = max(result[metric] for result in results)
+
+    return combined
+
+
+def compare(  # pylint: disable=R0913
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+    speed: float = 1.0,
+    speed_tolerance: float = DEFAULT_SPEED_TOLERANCE,
+) -> List[str]:
+    """Compares results with a baseline.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): Results by shape.
+        baseline (Dict[str, Dict[str, float]]): Baseline results by shape.
+        tolerance (float): Allowed relative growth of the peak memory.
+        speed (float): Speed of this machine relative to the baseline machine.
+        speed_tolerance (float): Allowed relative slowdown.
+
+    Returns:
+        List[str]: Descriptions of all regressions.
+    """
+
+    regressions = []
+
+    for shape, result in results.items():
+        for metric, direction in METRICS.items():
+            if metric not in baseline.get(shape, {}):
+                continue
+
+            expected = baseline[shape][metric] * (
+                speed if direction > 0 and metric not in RELATIVE_METRICS else 1
+            )
+            allowed = (
+                speed_tolerance * expected
+                if direction > 0
+                else tolerance * expected + MEMORY_SLACK
+            )
+
+            if direction * (result[metric] - expected) < -allowed:
+                digits = 2 if metric in RELATIVE_METRICS else 0
+                regressions.append(
+                    f"{shape}: {metric} regressed from {expected:.{digits}f} to"
+                    f" {result[metric]:.{digits}f}"
+                )
+
+    return regressions
+
+
+###########
+# EXECUTE #
+###########
+
+if __name__ == "__main__":  # pylint: disable=R1260
+    options: Dict[str, Any] = {
+        "size": DEFAULT_SIZE,
+        "repeat": DEFAULT_REPEAT,
+        "tolerance": DEFAULT_TOLERANCE,
+        "speed-tolerance": DEFAULT_SPEED_TOLERANCE,
+        "attempts": DEFAULT_ATTEMPTS,
+        "baseline": BASELINE,
+        "update": False,
+        "shapes": list(corpus.SHAPES),
+    }
+    arguments = iter(sys.argv[1:])
+
+    for argument in arguments:
+        if argument.lower() in ["-h", "--help"]:
+            print(
+                "Usage: benchmark.py [-h] [--size N] [--repeat N] [--tolerance X]"
+                " [--speed-tolerance X] [--attempts N] [--baseline PATH] [--update]"
+                " [SHAPE ...]"
+            )
+            print("Benchmarks the lexer and the parser on generated programs.")
+            print(f"Shapes: {', '.join(corpus.SHAPES)}")
+            print("Options:")
+            print("    -h, --help             Shows this help and exits.")
+            print("    --size N               Number of characters per program.")
+            print("    --repeat N             Number of runs per measurement.")
+            print("    --tolerance X          Allowed growth of peak memory, e.g. 0.3.")
+            print("    --speed-tolerance X    Allowed slowdown, e.g. 0.5.")
+            print("    --attempts N           Benchmarks of slower shapes, the best")
+            print("                           throughput is compared.")
+            print("    --baseline PATH        Baseline to compare with.")
+            print("    --update               Writes the results as the new baseline.")
+            sys.exit(0)
+
+        elif argument.lower() in ["--size", "--repeat", "--attempts"]:
+            options[argument.lower()[2:]] = int(next(arguments, "0")) or 1
+
+        elif argument.lower() in ["--tolerance", "--speed-tolerance"]:
+            options[argument.lower()[2:]] = float(next(arguments, "0"))
+
+        elif argument.lower() == "--baseline":
+            options["baseline"] = pathlib.Path(next(arguments, BASELINE))
+
+        elif argument.lower() == "--update":
+            options["update"] = True
+
+        elif argument in corpus.SHAPES:
+            if options["shapes"] == list(corpus.SHAPES):
+                options["shapes"] = []
+            options["shapes"].append(argument)
+
+        else:
+            print(f"Error: Invalid argument: {argument!r}")
+            sys.exit(1)
+
+    RESULTS: Dict[str, Dict[str, float]] = {}
+    CALIBRATION = calibrate(options["repeat"])
+
+    print(
+        f"{'shape':<14}{'tokens':>10}{'lex tok/s':>14}{'lex peak':>12}"
+        f"{'parse tok/s':>14}{'parse peak':>12}{'vs legacy':>11}"
+    )
+
+    for SHAPE in options["shapes"]:
+        RESULTS[SHAPE] = benchmark(SHAPE, options["size"], options["repeat"])
+        print(
+            f"{SHAPE:<14}{RESULTS[SHAPE]['tokens']:>10.0f}"
+            f"{RESULTS[SHAPE]['lex_tokens_per_second']:>14.0f}"
+            f"{RESULTS[SHAPE]['lex_peak_memory'] / 1024 ** 2:>10.2f}MB"
+            f"{RESULTS[SHAPE]['parse_tokens_per_second']:>14.0f}"
+            f"{RESULTS[SHAPE]['parse_peak_memory'] / 1024 ** 2:>10.2f}MB"
+            f"{RESULTS[SHAPE]['parse_legacy_speedup']:>10.2f}x"
+        )
+
+    if options["update"]:
+        options["baseline"].write_text(
+            json.dumps(
+                {
+                    "size": options["size"],
+                    "calibration": CALIBRATION,
+                    "results": RESULTS,
+                },
+                indent=4,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        print(f"Wrote baseline to {options['baseline']}")
+        sys.exit(0)
+
+    if not options["baseline"].exists():
+        print(f"Error: No baseline at {options['baseline']}, run with --update.")
+        sys.exit(1)
+
+    BASELINE_DATA = json.loads(options["baseline"].read_text(encoding="utf-8"))
+    if BASELINE_DATA["size"] != options["size"]:
+        print(f"Warning: The baseline was measured with size {BASELINE_DATA['size']}.")
+
+    SPEED = BASELINE_DATA["calibration"] / CALIBRATION
+    REGRESSIONS = compare(
+        RESULTS,
+        BASELINE_DATA["results"],
+        options["tolerance"],
+        SPEED,
+        options["speed-tolerance"],
+    )
+
+    for ATTEMPT in range(1, options["attempts"]):  # Slowdowns may be noise
+        SLOWER = {
+            SHAPE: RESULTS[SHAPE]
+            for SHAPE in options["shapes"]
+            if compare(
+                {SHAPE: RESULTS[SHAPE]},
+                BASELINE_DATA["results"],
+                float("inf"),
+                SPEED,
+                options["speed-tolerance"],
+            )
+        }
+        if not SLOWER:
+            break
+
+        print(
+            f"Benchmarking {', '.join(SLOWER)} again"
+            f" ({ATTEMPT + 1}/{options['attempts']})"
+        )
+        for SHAPE, RESULT in SLOWER.items():
+            RESULTS[SHAPE] = best(
+                RESULT, benchmark(SHAPE, options["size"], options["repeat"])
+            )
+
+        REGRESSIONS = compare(
+            RESULTS,
+            BASELINE_DATA["results"],
+            options["tolerance"],
+            SPEED,
+            options["speed-tolerance"],
+        )
+
+    for REGRESSION in REGRESSIONS:
+        print(f"Regression: {REGRESSION}")
+
+    sys.exit(1 if REGRESSIONS else 0)
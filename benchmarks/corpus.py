@@ -0,0 +1,220 @@
+"""
+I Language benchmark corpus generator.
+Version: 0.1.0
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import random
+from typing import (
+    Callable,
+    Dict,
+    List,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+
+#############
+# CONSTANTS #
+#############
+
+NESTING_DEPTH: Final[int] = 32
+STRING_LENGTH: Final[int] = 512
+FLOATS_PER_LIST: Final[int] = 32
+_WORDS: Final[List[str]] = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]
+
+
+##############
+# STATEMENTS #
+##############
+
+# Every statement is a complete top level statement, names are unique by index.
+
+
+def _nesting(generator: random.Random, index: int) -> str:
+    """Generates deeply nested blocks.
+
+    Args:
+        generator (random.Random): Random number generator.
+        index (int): Index of the statement.
+
+    Returns:
+        str: Generated statement.
+    """
+
+    depth = generator.randint(NESTING_DEPTH // 2, NESTING_DEPTH)
+
+    return (
+        "".join(f"{'    ' * level}if (true) {{\n" for level in range(depth))
+        + f"{'    ' * depth}int nested{index} = {index};\n"
+        + "".join(f"{'    ' * level}}}\n" for level in reversed(range(depth)))
+        + ";\n"
+    )
+
+
+def _strings(generator: random.Random, index: int) -> str:
+    """Generates long string literals.
+
+    Args:
+        generator (random.Random): Random number generator.
+        index (int): Index of the statement.
+
+    Returns:
+        str: Generated statement.
+    """
+
+    text = " ".join(generator.choice(_WORDS) for _ in range(STRING_LENGTH // 6))
+
+    return f'string text{index} = "{text}";\n'
+
+
+def _comments(generator: random.Random, index: int) -> str:
+    """Generates single and multiline comments.
+
+    Args:
+        generator (random.Random): Random number generator.
+        index (int): Index of the statement.
+
+    Returns:
+        str: Generated statement.
+    """
+
+    lines = "\n".join(
+        f" * {' '.join(generator.choices(_WORDS, k=8))}" for _ in range(8)
+    )
+
+    return (
+        f"/*\n{lines}\n */\n"
+        f"// {' '.join(generator.choices(_WORDS, k=8))}\n"
+        f"int commented{index} = {index}; // {generator.choice(_WORDS)}\n"
+    )
+
+
+def _floats(generator: random.Random, index: int) -> str:
+    """Generates many float literals.
+
+    Args:
+        generator (random.Random): Random number generator.
+        index (int): Index of the statement.
+
+    Returns:
+        str: Generated statement.
+    """
+
+    values = ", ".join(
+        f"{generator.randint(0, 999)}.{generator.randint(0, 999)}"
+        for _ in range(FLOATS_PER_LIST)
+    )
+
+    value = f"{generator.randint(0, 999)}.{generator.randint(1, 9)}"
+
+    return f"float number{index} = {value};\nfloat[] numbers{index} = [{values}];\n"
+
+
+def _double_marks(generator: random.Random, index: int) -> str:
+    """Generates conditions full of double marks.
+
+    Args:
+        generator (random.Random): Random number generator.
+        index (int): Index of the statement.
+
+    Returns:
+        str: Generated statement.
+    """
+
+    names = generator.choices(_WORDS, k=8)
+    condition = " || ".join(
+        f"{names[offset]} == {names[offset + 1]} && {names[offset]} != {index}"
+        f" && {names[offset + 1]} <= {names[offset]}"
+        for offset in range(0, 8, 2)
+    )
+
+    return f"if ({condition}) {{\n    {names[0]}++;\n    {names[1]}--;\n}};\n"
+
+
+def _mixed(generator: random.Random, index: int) -> str:
+    """Generates all other statements in turn.
+
+    Args:
+        generator (random.Random): Random number generator.
+        index (int): Index of the statement.
+
+    Returns:
+        str: Generated statement.
+    """
+
+    statements = [_nesting, _strings, _comments, _floats, _double_marks]
+
+    return statements[index % len(statements)](generator, index)
+
+
+SHAPES: Final[Dict[str, Callable[[random.Random, int], str]]] = {
+    "nesting": _nesting,
+    "strings": _strings,
+    "comments": _comments,
+    "floats": _floats,
+    "double_marks": _double_marks,
+    "mixed": _mixed,
+}
+
+
+#############
+# GENERATOR #
+#############
+
+
+def generate(shape: str, size: int, seed: int = 0) -> str:
+    """Generates an I program.
+
+    Args:
+        shape (str): Shape of the program, one of SHAPES.
+        size (int): Minimum number of characters of the program.
+        seed (int): Seed of the random number generator, the same seed always
+                    generates the same program.
+
+    Returns:
+        str: Generated program.
+
+    Raises:
+        ValueError: If the shape does not exist.
+    """
+
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown shape: {shape!r}")
+
+    generator = random.Random(seed)
+    statement = SHAPES[shape]
+    parts: List[str] = []
+    length = 0
+
+    while length < size:
+        parts.append(statement(generator, len(parts)))
+        length += len(parts[-1])
+
+    return "".join(parts)
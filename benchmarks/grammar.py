@@ -0,0 +1,109 @@
+"""
+I Language grammar benchmark.
+Version: 0.1.1
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import sys
+from typing import (
+    Callable,
+    Dict,
+    Tuple,
+)
+
+from benchmark import (  # pylint: disable=C0413
+    DEFAULT_REPEAT,
+    lexer,
+    measure,
+)
+from Main import grammar  # pylint: disable=E0401, C0413
+
+
+#############
+# CONSTANTS #
+#############
+
+SIZES = [12_500, 25_000, 50_000, 100_000]  # Characters
+TOLERANCE = 3.0  # Allowed growth of the time per character
+
+
+def body(size: int) -> str:
+    """Returns the statements of a block.
+
+    Args:
+        size (int): Number of characters.
+
+    Returns:
+        str: Statements of the block.
+    """
+
+    return ("int a = 1;\n" * (size // 11 + 1))[:size]
+
+
+# Statements with the kind to match them as, the old patterns backtracked
+# quadratically on if_braces and try_catches and exponentially on params and import
+CASES: Dict[str, Tuple[str, Callable[[int], str]]] = {
+    "if": ("IF", lambda size: f"if (a) {{\n{body(size)}}};"),
+    "if_unclosed": ("IF", lambda size: f"if (a) {{\n{body(size)}"),
+    "if_braces": ("IF", lambda size: "if " + "{" * size),
+    "function": ("FUNCTION", lambda size: f"function f(a = 1) {{\n{body(size)}}};"),
+    "params": ("FUNCTION", lambda size: "function f(" + "a=1" * (size // 3) + " {"),
+    "try": ("TRY", lambda size: f"try {{\n{body(size)}}} catch (e) {{\n{body(size)}}}"),
+    "try_catches": ("TRY", lambda size: "try {" + "} catch x" * (size // 9)),
+    "import": ("IMPORT", lambda size: "import " + "a," * (size // 2) + "!"),
+}
+
+
+###########
+# EXECUTE #
+###########
+
+if __name__ == "__main__":
+    SLOW = []
+
+    print(f"{'case':<12}{'size':>10}{'match ms':>12}{'classify ms':>14}")
+
+    for CASE, (KIND, GENERATE) in CASES.items():
+        TIMES = []
+
+        for SIZE in SIZES:
+            SOURCE = GENERATE(SIZE)
+            TOKENS = lexer.lex(SOURCE)
+            MATCH, _ = measure(lambda: grammar.match(KIND, SOURCE), DEFAULT_REPEAT)
+            CLASSIFY, _ = measure(lambda: grammar.classify(TOKENS), DEFAULT_REPEAT)
+            TIMES.append((MATCH + CLASSIFY) / SIZE)
+
+            print(f"{CASE:<12}{SIZE:>10}{MATCH * 1000:>12.3f}{CLASSIFY * 1000:>14.3f}")
+
+        if TIMES[-1] > TIMES[0] * TOLERANCE:
+            SLOW.append(CASE)
+
+    if SLOW:
+        print(f"Error: Not linear in the size of the statement: {', '.join(SLOW)}")
+        sys.exit(1)
+
+    print(f"All statements are matched in linear time up to {SIZES[-1]} characters.")
@@ -0,0 +1,126 @@
+"""
+I Language AST memory benchmark.
+Version: 0.1.1
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import gc
+import sys
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Tuple,
+)
+
+from benchmark import (  # pylint: disable=C0413
+    lexer,
+    parser,
+)
+from Main import arena  # pylint: disable=E0401, C0413
+
+
+#############
+# CONSTANTS #
+#############
+
+SIZES = [1_000, 10_000, 100_000]  # Statements
+
+# The arena is converted from a finished tree, so only the memory retained after
+# the conversion shrinks, the peak while parsing still holds the whole tree
+
+
+def program(statements: int) -> str:
+    """Generates a program of definitions and imports.
+
+    Args:
+        statements (int): Number of statements.
+
+    Returns:
+        str: Generated program.
+    """
+
+    parts = [
+        "int a{0} = {0} + 2 * {0};\n",
+        "float[] b{0} = [1.5, {0}.5];\n",
+        "bool c{0} = a{0} < {0} && !d;\n",
+        "import module{0};\n",
+        '?string e{0} = "text";\n',
+    ]
+
+    return "".join(
+        parts[index % len(parts)].format(index) for index in range(statements)
+    )
+
+
+def retained(function: Callable[[], Any]) -> Tuple[Any, int]:
+    """Measures the memory still allocated after calling a function.
+
+    Args:
+        function (Callable[[], Any]): Function to measure.
+
+    Returns:
+        Tuple[Any, int]: Result of the function and the allocated bytes.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, current
+
+
+###########
+# EXECUTE #
+###########
+
+if __name__ == "__main__":
+    print("Retained memory after converting the parsed tree to an arena:")
+    print(
+        f"{'statements':>10}{'nodes':>10}{'tree bytes':>14}{'arena bytes':>14}"
+        f"{'tree/node':>11}{'arena/node':>12}{'saved':>8}"
+    )
+
+    for SIZE in SIZES:
+        TREE = parser.Parser(lexer.lex(program(SIZE))).parse()
+        ARENA, ARENA_BYTES = retained(lambda: arena.Arena.from_tree(TREE))
+        # The strings are shared by both representations, so the tree is created
+        # from the arena to only count the nodes
+        COPY, TREE_BYTES = retained(ARENA.to_tree)
+
+        if COPY != TREE:
+            print(f"Error: The arena creates another tree at {SIZE} statements")
+            sys.exit(1)
+
+        print(
+            f"{SIZE:>10}{len(ARENA):>10}{TREE_BYTES:>14}{ARENA_BYTES:>14}"
+            f"{TREE_BYTES / len(ARENA):>11.1f}{ARENA_BYTES / len(ARENA):>12.1f}"
+            f"{1 - ARENA_BYTES / TREE_BYTES:>8.0%}"
+        )
@@ -0,0 +1,113 @@
+"""
+I Language optimizer benchmark.
+Version: 0.1.0
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import sys
+
+from benchmark import (  # pylint: disable=C0413
+    DEFAULT_REPEAT,
+    lexer,
+    measure,
+    parser,
+)
+from memory import retained  # pylint: disable=C0413
+from Main import optimizer, visitor  # pylint: disable=E0401, C0413
+
+
+#############
+# CONSTANTS #
+#############
+
+SIZES = [1_000, 10_000, 100_000]  # Statements
+
+
+def program(statements: int) -> str:
+    """Generates a program, which declares many unused variables.
+
+    Args:
+        statements (int): Number of statements.
+
+    Returns:
+        str: Generated program.
+    """
+
+    parts = [
+        "int a{0} = {0} * 2 + 1;\n",  # Folded and used
+        "int b{0} = a{0} + c;\n",  # Kept, as it is no literal
+        "int u{0} = 3;\n",  # Unused
+        "float[] v{0} = [1.5, 2.5];\n",  # Unused
+        "import m{0};\n",
+    ]
+
+    return "".join(
+        parts[index % len(parts)].format(index - index % len(parts))
+        for index in range(statements)
+    )
+
+
+###########
+# EXECUTE #
+###########
+
+if __name__ == "__main__":
+    print(
+        f"{'statements':>10}{'nodes':>10}{'optimized':>11}{'tree bytes':>12}"
+        f"{'optimized':>11}{'walk s':>10}{'optimized':>11}{'optimize s':>12}"
+    )
+
+    for SIZE in SIZES:
+        SOURCE = program(SIZE)
+        TREE, TREE_BYTES = retained(lambda: parser.Parser(lexer.lex(SOURCE)).parse())
+        RESULT, OPTIMIZED_BYTES = retained(
+            lambda: optimizer.optimize(
+                parser.Parser(lexer.lex(SOURCE)).parse(), lexer.LineIndex(SOURCE)
+            )
+        )
+        NODES = sum(1 for _ in visitor.walk(TREE))
+        OPTIMIZED = sum(1 for _ in visitor.walk(RESULT.tree))
+
+        # Every folding replaces an operation and its two literals by one literal
+        if NODES - OPTIMIZED != RESULT.removed + RESULT.folded * 2:
+            print(f"Error: Wrong number of removed nodes at {SIZE} statements")
+            sys.exit(1)
+
+        WALK, _ = measure(lambda: sum(1 for _ in visitor.walk(TREE)), DEFAULT_REPEAT)
+        OPTIMIZED_WALK, _ = measure(
+            lambda: sum(1 for _ in visitor.walk(RESULT.tree)), DEFAULT_REPEAT
+        )
+        OPTIMIZE, _ = measure(
+            lambda: optimizer.optimize(parser.Parser(lexer.lex(SOURCE)).parse()), 1
+        )
+        PARSE, _ = measure(lambda: parser.Parser(lexer.lex(SOURCE)).parse(), 1)
+
+        print(
+            f"{SIZE:>10}{NODES:>10}{OPTIMIZED:>11}{TREE_BYTES:>12}"
+            f"{OPTIMIZED_BYTES:>11}{WALK:>10.4f}{OPTIMIZED_WALK:>11.4f}"
+            f"{OPTIMIZE - PARSE:>12.4f}"
+        )
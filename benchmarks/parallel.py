@@ -0,0 +1,93 @@
+"""
+I Language parallel parsing benchmark.
+Version: 0.1.0
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import concurrent.futures
+import os
+import sys
+
+from benchmark import (  # pylint: disable=C0413
+    DEFAULT_REPEAT,
+    lexer,
+    measure,
+    parser,
+)
+import corpus  # pylint: disable=C0413
+
+
+#############
+# CONSTANTS #
+#############
+
+SHAPE = "mixed"
+SIZES = [25_000, 100_000, 400_000, 1_600_000]  # Characters
+
+
+###########
+# EXECUTE #
+###########
+
+if __name__ == "__main__":
+    JOBS = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    CROSSOVER = None
+
+    print(f"Parsing {SHAPE!r} programs with {JOBS} jobs ({os.cpu_count()} CPUs)")
+    print(
+        f"{'size':>10}{'tokens':>10}{'serial s':>12}{'parallel s':>12}{'speedup':>10}"
+    )
+
+    # The pool is started once, like in batch runs with --parallel-parse
+    with concurrent.futures.ProcessPoolExecutor(JOBS) as EXECUTOR:
+        for SIZE in SIZES:
+            TOKENS = lexer.lex(corpus.generate(SHAPE, SIZE))
+
+            if parser.Parser(TOKENS).parse() != parser.Parser(TOKENS).parse_parallel(
+                JOBS, executor=EXECUTOR
+            ):
+                print(f"Error: The parallel parser creates another tree at {SIZE}")
+                sys.exit(1)
+
+            SERIAL, _ = measure(lambda: parser.Parser(TOKENS).parse(), DEFAULT_REPEAT)
+            PARALLEL, _ = measure(
+                lambda: parser.Parser(TOKENS).parse_parallel(JOBS, executor=EXECUTOR),
+                DEFAULT_REPEAT,
+            )
+
+            if CROSSOVER is None and PARALLEL < SERIAL:
+                CROSSOVER = SIZE
+
+            print(
+                f"{SIZE:>10}{len(TOKENS):>10}{SERIAL:>12.4f}{PARALLEL:>12.4f}"
+                f"{SERIAL / PARALLEL:>9.2f}x"
+            )
+
+    if CROSSOVER is None:
+        print(f"Parallel parsing is not faster up to {SIZES[-1]} characters.")
+    else:
+        print(f"Parallel parsing is faster from {CROSSOVER} characters.")
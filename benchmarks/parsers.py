@@ -0,0 +1,89 @@
+"""
+I Language parser comparison.
+Version: 0.1.0
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import sys
+from typing import (
+    Any,
+    List,
+)
+
+from benchmark import (  # pylint: disable=C0413
+    DEFAULT_REPEAT,
+    DEFAULT_SIZE,
+    ast,
+    lexer,
+    measure,
+    parser,
+)
+import corpus  # pylint: disable=C0413
+
+
+###########
+# COMPARE #
+###########
+
+
+def parse(parser_class: Any, tokens: List[Any]) -> ast.Main:
+    """Parses tokens.
+
+    Args:
+        parser_class (Any): Parser to use.
+        tokens (List[Any]): Tokens to parse.
+
+    Returns:
+        ast.Main: Parse tree of the tokens.
+    """
+
+    return parser_class(tokens).parse(start=ast.Main())
+
+
+###########
+# EXECUTE #
+###########
+
+if __name__ == "__main__":
+    SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+
+    print(f"{'shape':<14}{'tokens':>10}{'legacy tok/s':>15}{'tok/s':>15}{'speedup':>10}")
+
+    for SHAPE in corpus.SHAPES:
+        TOKENS = lexer.lex(corpus.generate(SHAPE, SIZE))
+
+        if parse(parser.LegacyParser, TOKENS) != parse(parser.Parser, TOKENS):
+            print(f"Error: The parsers create different trees for {SHAPE!r}")
+            sys.exit(1)
+
+        LEGACY, _ = measure(lambda: parse(parser.LegacyParser, TOKENS), DEFAULT_REPEAT)
+        CURSOR, _ = measure(lambda: parse(parser.Parser, TOKENS), DEFAULT_REPEAT)
+
+        print(
+            f"{SHAPE:<14}{len(TOKENS):>10}{len(TOKENS) / LEGACY:>15.0f}"
+            f"{len(TOKENS) / CURSOR:>15.0f}{LEGACY / CURSOR:>9.2f}x"
+        )
@@ -1,6 +1,6 @@
 """
 I Language core.
-Version: 0.1.0
+Version: 0.1.8
 
 Copyright (c) 2023-present I Language Development.
 
@@ -28,5 +28,14 @@ DEALINGS IN THE SOFTWARE.
 ###########
 
 from . import (
+    arena,
+    batch,
+    binary,
+    cache,
+    context,
     lexer,
+    optimizer,
+    parser,
+    symbols,
+    visitor,
 )
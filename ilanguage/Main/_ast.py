@@ -1,6 +1,6 @@
 """
 I Language AST.
-Version: 0.1.2
+Version: 0.1.10
 
 Copyright (c) 2023-present I Language Development.
 
@@ -45,7 +45,14 @@ from typing import (
     Optional,
 )
 
-import _types
+from . import _types
+
+
+#########
+# SETUP #
+#########
+
+__version__ = "0.1.10"
 
 
 #############
@@ -63,6 +70,7 @@ class Node:
     level: int
     below: List[Optional[Node]] = field(default_factory=list)
     arguments: Optional[Dict[str, str]] = None
+    line: int = 0
 
     def __lt__(self: Node, compare_to: Node) -> bool:
         return (
@@ -95,6 +103,21 @@ class BaseProgram(Node):
         return False
 
 
+@dataclass(init=False)
+class Main(BaseProgram):
+    """Main program node."""
+
+    def __init__(
+        self,
+        below: Optional[List[Optional[Node]]] = None,
+        arguments: Optional[Dict[str, str]] = None,
+    ) -> None:
+        super().__init__("main", below if below is not None else [], arguments)
+
+
+AST = Node
+
+
 ##########
 # IMPORT #
 ##########
@@ -193,3 +216,265 @@ class Variable(Node):
             self.conditions,
             arguments,
         )
+
+
+################
+# STATIC VALUE #
+################
+
+
+@dataclass(init=False)
+class StaticValue(Node):
+    """Literal value node."""
+
+    def __init__(
+        self,
+        _type: str,
+        value: str,
+        level: int = 0,
+        arguments: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.type = _type
+
+        super().__init__(_type, f"{_type}@StaticValue", value, level, [], arguments)
+
+
+@dataclass(init=False)
+class StaticList(Node):
+    """List literal node."""
+
+    def __init__(
+        self,
+        _type: Optional[str],
+        values: List[Optional[Node]],
+        dimension: int,
+        level: int = 0,
+        arguments: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.type = _type
+        self.values = values
+        self.dimension = dimension
+
+        super().__init__("list", "StaticList", None, level, self.values, arguments)
+
+
+##############
+# OPERATIONS #
+##############
+
+
+@dataclass(init=False)
+class Reference(Node):
+    """Variable reference node."""
+
+    def __init__(
+        self,
+        name: str,
+        level: int = 0,
+        arguments: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.type: Optional[str] = None  # Known after resolving the variable
+
+        super().__init__(name, "Reference", None, level, [], arguments)
+
+
+@dataclass(init=False)
+class UnaryOperation(Node):
+    """Unary operation node."""
+
+    def __init__(
+        self,
+        operator: str,
+        operand: Node,
+        _type: Optional[str],
+        level: int = 0,
+        arguments: Optional[Dict[str, str]] = None,
+        offset: int = -1,
+    ) -> None:
+        self.type = _type
+        self.operator = operator
+        self.operand = operand
+        self.offset = offset  # Of the operator in the source, -1 if unknown
+
+        super().__init__(
+            operator, f"{_type}@UnaryOperation", None, level, [operand], arguments
+        )
+
+
+@dataclass(init=False)
+class BinaryOperation(Node):
+    """Binary operation node."""
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        operator: str,
+        left: Node,
+        right: Node,
+        _type: Optional[str],
+        level: int = 0,
+        arguments: Optional[Dict[str, str]] = None,
+        offset: int = -1,
+    ) -> None:
+        self.type = _type
+        self.operator = operator
+        self.left = left
+        self.right = right
+        self.offset = offset  # Of the operator in the source, -1 if unknown
+
+        super().__init__(
+            operator, f"{_type}@BinaryOperation", None, level, [left, right], arguments
+        )
+
+
+###################
+# DEFINE VARIABLE #
+###################
+
+
+@dataclass(init=False)
+class DefineVariable(Node):
+    """Variable definition node."""
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        name: str,
+        _type: str,
+        list_dimension: int,
+        indefinite: bool,
+        value: Optional[Node],
+        level: int = 0,
+        line: int = 0,
+    ) -> None:
+        self.type = _type
+        self.list_dimension = list_dimension
+        self.indefinite = indefinite
+
+        super().__init__(
+            name,
+            f"{_type}@DefineVariable",
+            value,
+            level,
+            [value] if value is not None else [],
+            None,
+            line,
+        )
+
+
+@dataclass(init=False)
+class DefineVariableNovalue(DefineVariable):
+    """Variable definition node without a value."""
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        name: str,
+        _type: str,
+        list_dimension: int,
+        indefinite: bool,
+        level: int = 0,
+        line: int = 0,
+    ) -> None:
+        super().__init__(name, _type, list_dimension, indefinite, None, level, line)
+
+
+################
+# CONTROL FLOW #
+################
+
+
+@dataclass(init=False)
+class Block(Node):
+    """Block of statements node."""
+
+    def __init__(
+        self,
+        statements: Optional[List[Optional[Node]]] = None,
+        level: int = 0,
+        arguments: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.statements: List[Optional[Node]] = (
+            statements if statements is not None else []
+        )
+
+        super().__init__("block", "Block", None, level, self.statements, arguments)
+
+
+@dataclass(init=False)
+class If(Node):
+    """Conditional node."""
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        condition: Node,
+        body: Block,
+        orelse: Optional[Node] = None,
+        level: int = 0,
+        arguments: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.condition = condition
+        self.body = body
+        self.orelse = orelse  # Block or If of the else branch, None without one
+
+        super().__init__(
+            "if",
+            "If",
+            None,
+            level,
+            [condition, body, orelse] if orelse is not None else [condition, body],
+            arguments,
+        )
+
+
+@dataclass(init=False)
+class Return(Node):
+    """Return node."""
+
+    def __init__(
+        self,
+        value: Optional[Node] = None,
+        level: int = 0,
+        arguments: Optional[Dict[str, str]] = None,
+    ) -> None:
+        super().__init__(
+            "return",
+            "Return",
+            value,
+            level,
+            [value] if value is not None else [],
+            arguments,
+        )
+
+
+@dataclass(init=False)
+class Break(Node):
+    """Break node."""
+
+    def __init__(
+        self, level: int = 0, arguments: Optional[Dict[str, str]] = None
+    ) -> None:
+        super().__init__("break", "Break", None, level, [], arguments)
+
+
+@dataclass(init=False)
+class Continue(Node):
+    """Continue node."""
+
+    def __init__(
+        self, level: int = 0, arguments: Optional[Dict[str, str]] = None
+    ) -> None:
+        super().__init__("continue", "Continue", None, level, [], arguments)
+
+
+@dataclass(init=False)
+class Throw(Node):
+    """Throw node."""
+
+    def __init__(
+        self,
+        name: str,
+        cause: Optional[str] = None,
+        level: int = 0,
+        arguments: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.cause = cause  # Name after 'from'
+
+        super().__init__(name, "Throw", None, level, [], arguments)
@@ -1,6 +1,6 @@
 """
 I Language errors.
-Version: 0.1.2
+Version: 0.1.4
 
 Copyright (c) 2023-present I Language Development.
 
@@ -37,7 +37,7 @@ DEALINGS IN THE SOFTWARE.
 
 import sys
 
-from .options import options
+from .context import current
 
 
 #########
@@ -61,6 +61,8 @@ class Error:
     ) -> None:
         """Initializes a new error.
 
+        The exit_zero option is read from the current compilation context.
+
         Args:
             description (str): Error text.
             long_description (str, keyword only): Long, more detailed error text.
@@ -74,8 +76,9 @@ class Error:
         print(
             f"Error: {description}, in line {line} column {column}.{long_description}"
         )
-        if exit_code != 0 or options["exit_zero"]:
-            sys.exit(0 if options["exit_zero"] else exit_code)
+        exit_zero = current().options["exit_zero"]
+        if exit_code != 0 or exit_zero:
+            sys.exit(0 if exit_zero else exit_code)
 
 
 ##########
@@ -377,7 +380,7 @@ class OverflowError(Error):
         if hint:
             print(hint)
         super().__init__(
-            description=text, line=line, column=column, exit_code=exit_code
+            description=description, line=line, column=column, exit_code=exit_code
         )
 
 
@@ -1,6 +1,6 @@
 """
 I Language types.
-Version: 0.1.2
+Version: 0.1.5
 
 Copyright (c) 2023-present I Language Development.
 
@@ -36,18 +36,39 @@ DEALINGS IN THE SOFTWARE.
 
 import ast
 import builtins
+import functools
 from typing import (
-    List as _List,
     Optional,
 )
 
 from typing_extensions import (
     Any as _Any,
-    Self,
     Type,
 )
 
 
+###########
+# HELPERS #
+###########
+
+
+@functools.lru_cache(maxsize=4096)
+def literal(value: str) -> _Any:
+    """Converts the text of a literal to its Python value.
+
+    The values are cached, as types are created for the same literals again and
+    again. Returned values are shared, so they must not be changed.
+
+    Args:
+        value (str): Text of the literal.
+
+    Returns:
+        Any: Python value of the literal.
+    """
+
+    return ast.literal_eval(value)
+
+
 #############
 # BASE TYPE #
 #############
@@ -58,8 +79,6 @@ class BaseType:
     Represents a base type object.
     """
 
-    types: _List[Self] = []
-
     def __init__(self, value: str, python_type: Optional[Type]) -> None:
         """Initializes a new type.
 
@@ -79,7 +98,7 @@ class BaseType:
         """
 
         if self.python_type is not None:
-            self.python_type(ast.literal_eval(self.value))
+            self.python_type(literal(self.value))
 
 
 #########
@@ -250,3 +269,4 @@ class mdarray(BaseType):
         """
 
         super().__init__(value, _Any)  # TODO (ElBe): Add python type
+
@@ -0,0 +1,561 @@
+"""
+I Language AST arena.
+Version: 0.1.4
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import array
+import json
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+from . import _ast as ast
+from . import _types, visitor
+
+
+#############
+# CONSTANTS #
+#############
+
+# Classes of the nodes by kind, kind 0 stands for a missing node (e.g. a statement
+# no rule matched)
+NODE_CLASSES: Final[Tuple[Optional[Type[ast.Node]], ...]] = (
+    None,
+    ast.Main,
+    ast.Import,
+    ast.StaticValue,
+    ast.StaticList,
+    ast.DefineVariable,
+    ast.DefineVariableNovalue,
+    ast.Reference,
+    ast.UnaryOperation,
+    ast.BinaryOperation,
+    ast.Constant,
+    ast.Variable,
+    ast.Block,
+    ast.If,
+    ast.Return,
+    ast.Break,
+    ast.Continue,
+    ast.Throw,
+)
+KINDS: Final[Dict[Optional[Type[ast.Node]], int]] = {
+    node_class: kind for kind, node_class in enumerate(NODE_CLASSES)
+}
+NO_INDEX: Final[int] = -1  # Missing row, string or value
+
+
+#########
+# ARENA #
+#########
+
+
+class Arena:
+    """
+    Represents an AST as rows of parallel arrays.
+
+    Every node is a row of integers: its kind, the strings of its name and type,
+    its value, line, level, a kind specific number (the dimension of lists and
+    the offset of operators) and its attributes. The tree is linked by the
+    indices of the parent, first child and next sibling, so nodes take no objects
+    of their own. Names and types are stored once in the string table, literal
+    values in the value table. The attributes are the arguments of a node, the
+    conditions of constants and variables and the cause of throws, stored as
+    JSON in the string table. The columns are 32 bit, as the binary format.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty arena."""
+
+        self.kinds = array.array("B")
+        self.names = array.array("i")
+        self.types = array.array("i")
+        self.values = array.array("i")
+        self.lines = array.array("i")
+        self.levels = array.array("i")
+        self.extras = array.array("i")  # Dimension of lists, offset of operators
+        self.attributes = array.array("i")
+        self.parents = array.array("i")
+        self.first_children = array.array("i")
+        self.next_siblings = array.array("i")
+        self.strings: List[str] = []  # Names and types
+        self.constants: List[str] = []  # Literal values
+        self._string_indices: Dict[str, int] = {}
+        self._constant_indices: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def _string(self, string: Optional[str]) -> int:
+        """Returns the index of a string in the string table, adding it if needed.
+
+        Args:
+            string (Optional[str]): String to add.
+
+        Returns:
+            int: Index of the string, NO_INDEX for None.
+        """
+
+        if string is None:
+            return NO_INDEX
+
+        index = self._string_indices.get(string)
+        if index is None:
+            index = self._string_indices[string] = len(self.strings)
+            self.strings.append(string)
+
+        return index
+
+    def _constant(self, value: str) -> int:
+        """Returns the index of a literal value, adding it if needed.
+
+        Args:
+            value (str): Value to add.
+
+        Returns:
+            int: Index of the value.
+        """
+
+        index = self._constant_indices.get(value)
+        if index is None:
+            index = self._constant_indices[value] = len(self.constants)
+            self.constants.append(value)
+
+        return index
+
+    def _append(self, node: Optional[ast.Node], parent: int) -> int:
+        """Adds a row of a node without linking it to its siblings.
+
+        Args:
+            node (Optional[ast.Node]): Node to add, None for a missing node.
+            parent (int): Row of the parent, NO_INDEX for the root.
+
+        Returns:
+            int: Row of the node.
+
+        Raises:
+            TypeError: If the node is of a class, which can not be stored.
+        """
+
+        kind = KINDS.get(type(node)) if node is not None else KINDS[None]
+        if kind is None:
+            raise TypeError(f"Can not store {type(node).__name__} nodes in an arena")
+
+        attributes: Dict[str, Any] = {}
+        if node is not None and node.arguments:
+            attributes["arguments"] = node.arguments
+
+        _type = getattr(node, "type", None)
+        value = NO_INDEX
+
+        if isinstance(node, ast.StaticValue):
+            value = self._constant(node.value)
+        elif isinstance(node, visitor.DETACHED):
+            attributes["conditions"] = node.conditions
+            if isinstance(_type, _types.BaseType):  # A type of a value
+                attributes["type_value"] = _type.value
+                _type = type(_type)
+            if _type is not None:
+                _type = _type.__name__
+            if not isinstance(node.value, ast.Node):  # Otherwise it is a child
+                value = self._constant(_json(node.value, node))
+        elif isinstance(node, ast.Throw) and node.cause is not None:
+            attributes["cause"] = node.cause
+
+        index = len(self.kinds)
+        self.kinds.append(kind)
+        self.names.append(self._string(getattr(node, "name", None)))
+        self.types.append(self._string(_type))
+        self.values.append(value)
+        self.lines.append(node.line if node is not None else 0)
+        self.levels.append(node.level if node is not None else 0)
+
+        if isinstance(node, ast.StaticList):
+            self.extras.append(node.dimension)
+        elif isinstance(node, ast.DefineVariable):
+            self.extras.append(node.list_dimension << 1 | node.indefinite)
+        elif isinstance(node, (ast.UnaryOperation, ast.BinaryOperation)):
+            self.extras.append(node.offset)
+        else:
+            self.extras.append(0)
+
+        self.attributes.append(
+            self._string(_json(attributes, node)) if attributes else NO_INDEX
+        )
+
+        self.parents.append(parent)
+        self.first_children.append(NO_INDEX)
+        self.next_siblings.append(NO_INDEX)
+
+        return index
+
+    @classmethod
+    def from_tree(cls, tree: ast.Node) -> "Arena":
+        """Stores a tree in a new arena.
+
+        The nodes are added in preorder, so the root is row 0 and the rows of a
+        subtree follow its root.
+
+        Args:
+            tree (ast.Node): Tree of the nodes the parser creates.
+
+        Returns:
+            Arena: Arena of the tree.
+
+        Raises:
+            TypeError: If a node is of a class, which can not be stored.
+        """
+
+        arena = cls()
+        stack: List[Tuple[Optional[ast.Node], int]] = [(tree, NO_INDEX)]
+        last: Dict[int, int] = {}  # Row of the last child added, by parent row
+
+        while stack:
+            node, parent = stack.pop()
+            index = arena._append(node, parent)  # pylint: disable=W0212
+
+            if parent != NO_INDEX:
+                if parent in last:
+                    arena.next_siblings[last[parent]] = index
+                else:
+                    arena.first_children[parent] = index
+                last[parent] = index
+
+            children = visitor.children(node) if node is not None else []
+            if children:
+                stack.extend((child, index) for child in reversed(children))
+
+        # The tables are only looked up while adding
+        arena._string_indices.clear()  # pylint: disable=W0212
+        arena._constant_indices.clear()  # pylint: disable=W0212
+
+        return arena
+
+    def children(self, index: int) -> Iterator[int]:
+        """Returns the rows of the children of a row.
+
+        Args:
+            index (int): Row of the parent.
+
+        Yields:
+            int: Rows of the children in order.
+        """
+
+        child = self.first_children[index]
+
+        while child != NO_INDEX:
+            yield child
+            child = self.next_siblings[child]
+
+    def view(self, index: int = 0) -> "NodeView":
+        """Returns a view of a row.
+
+        Args:
+            index (int): Row of the node, defaults to the root.
+
+        Returns:
+            NodeView: View of the node.
+        """
+
+        return NodeView(self, index)
+
+    def to_tree(self, index: int = 0) -> Optional[ast.Node]:
+        """Creates the nodes of a subtree.
+
+        Args:
+            index (int): Row of the root of the subtree, defaults to the root.
+
+        Returns:
+            Optional[ast.Node]: Root node, None for a missing node.
+        """
+
+        # Rows in postorder, so the children are created before their parent
+        order: List[int] = []
+        stack = [index]
+
+        while stack:
+            row = stack.pop()
+            order.append(row)
+            stack.extend(self.children(row))
+
+        nodes: Dict[int, Optional[ast.Node]] = {}
+
+        for row in reversed(order):
+            nodes[row] = self._create(
+                row, [nodes.pop(child) for child in self.children(row)]
+            )
+
+        return nodes[index]
+
+    def _create(  # pylint: disable=R0911, R0912
+        self,
+        index: int,
+        below: List[Optional[ast.Node]],
+    ) -> Optional[ast.Node]:
+        """Creates the node of a row.
+
+        Args:
+            index (int): Row of the node.
+            below (List[Optional[ast.Node]]): Nodes of the children.
+
+        Returns:
+            Optional[ast.Node]: The node, None for a missing node.
+        """
+
+        node_class = NODE_CLASSES[self.kinds[index]]
+        if node_class is None:
+            return None
+
+        name = self.strings[self.names[index]]
+        _type = (
+            self.strings[self.types[index]]
+            if self.types[index] != NO_INDEX
+            else None
+        )
+        level = self.levels[index]
+        extra = self.extras[index]
+        attributes = (
+            json.loads(self.strings[self.attributes[index]])
+            if self.attributes[index] != NO_INDEX
+            else {}
+        )
+        node: ast.Node
+
+        if node_class is ast.Main:
+            node = ast.Main(below)
+        elif node_class is ast.Import:
+            node = ast.Import(name, level, below)
+        elif node_class is ast.StaticValue:
+            node = ast.StaticValue(
+                _type, self.constants[self.values[index]], level  # type: ignore
+            )
+        elif node_class is ast.StaticList:
+            node = ast.StaticList(_type, below, extra, level)
+        elif node_class is ast.DefineVariableNovalue:
+            node = ast.DefineVariableNovalue(
+                name, _type, extra >> 1, bool(extra & 1), level  # type: ignore
+            )
+        elif node_class is ast.DefineVariable:
+            node = ast.DefineVariable(
+                name, _type, extra >> 1, bool(extra & 1), below[0], level  # type: ignore
+            )
+        elif node_class is ast.Reference:
+            node = ast.Reference(name, level)
+        elif node_class is ast.UnaryOperation:
+            node = ast.UnaryOperation(
+                name, below[0], _type, level, offset=extra  # type: ignore
+            )
+        elif node_class is ast.BinaryOperation:
+            node = ast.BinaryOperation(
+                name, below[0], below[1], _type, level, offset=extra  # type: ignore
+            )
+        elif node_class is ast.Block:
+            node = ast.Block(below, level)
+        elif node_class is ast.If:
+            node = ast.If(
+                below[0],  # type: ignore[arg-type]
+                below[1],  # type: ignore[arg-type]
+                below[2] if len(below) > 2 else None,
+                level,
+            )
+        elif node_class is ast.Return:
+            node = ast.Return(below[0] if below else None, level)
+        elif node_class in (ast.Break, ast.Continue):
+            node = node_class(level)  # type: ignore[call-arg]
+        elif node_class is ast.Throw:
+            node = ast.Throw(name, attributes.get("cause"), level)
+        else:
+            type_class = getattr(_types, _type, None) if _type is not None else None
+            if _type is not None and not (
+                isinstance(type_class, type) and issubclass(type_class, _types.BaseType)
+            ):
+                raise ValueError(f"Unknown type {_type!r} in arena")
+
+            node = node_class(  # type: ignore[call-arg]
+                name,
+                below[0]
+                if self.values[index] == NO_INDEX
+                else json.loads(self.constants[self.values[index]]),
+                level,
+                type_class(attributes["type_value"])
+                if "type_value" in attributes
+                else type_class,
+                attributes["conditions"],
+            )
+
+        node.line = self.lines[index]
+        if "arguments" in attributes:
+            node.arguments = attributes["arguments"]
+
+        return node
+
+
+def _json(data: Any, node: ast.Node) -> str:
+    """Encodes data of a node as JSON.
+
+    Args:
+        data (Any): Data to encode.
+        node (ast.Node): Node of the data, for the error message.
+
+    Returns:
+        str: Encoded data.
+
+    Raises:
+        TypeError: If the data can not be encoded.
+    """
+
+    try:
+        return json.dumps(data, allow_nan=False)
+    except (TypeError, ValueError) as error:
+        raise TypeError(
+            f"Can not store the data of {type(node).__name__} nodes in an arena"
+        ) from error
+
+
+class NodeView:
+    """
+    Represents a node of an arena without creating it.
+    """
+
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: Arena, index: int) -> None:
+        """Initializes a view.
+
+        Args:
+            arena (Arena): Arena of the node.
+            index (int): Row of the node.
+        """
+
+        self.arena = arena
+        self.index = index
+
+    def __eq__(self, compare_to: object) -> bool:
+        return (
+            isinstance(compare_to, NodeView)
+            and self.arena is compare_to.arena
+            and self.index == compare_to.index
+        )
+
+    def __repr__(self) -> str:
+        return f"NodeView({self.kind}, {self.name!r}, row {self.index})"
+
+    @property
+    def kind(self) -> str:
+        """
+        Name of the class of the node, "None" for a missing node.
+        """
+
+        node_class = NODE_CLASSES[self.arena.kinds[self.index]]
+
+        return node_class.__name__ if node_class is not None else "None"
+
+    @property
+    def name(self) -> Optional[str]:
+        """
+        Name of the node.
+        """
+
+        index = self.arena.names[self.index]
+
+        return self.arena.strings[index] if index != NO_INDEX else None
+
+    @property
+    def type(self) -> Optional[str]:
+        """
+        Type of the node, None if it has no type.
+        """
+
+        index = self.arena.types[self.index]
+
+        return self.arena.strings[index] if index != NO_INDEX else None
+
+    @property
+    def value(self) -> Optional[str]:
+        """
+        Value of a literal value node.
+        """
+
+        index = self.arena.values[self.index]
+
+        return self.arena.constants[index] if index != NO_INDEX else None
+
+    @property
+    def line(self) -> int:
+        """
+        Line of the node.
+        """
+
+        return self.arena.lines[self.index]
+
+    @property
+    def level(self) -> int:
+        """
+        Block level of the node.
+        """
+
+        return self.arena.levels[self.index]
+
+    @property
+    def parent(self) -> Optional["NodeView"]:
+        """
+        View of the parent, None for the root.
+        """
+
+        index = self.arena.parents[self.index]
+
+        return NodeView(self.arena, index) if index != NO_INDEX else None
+
+    @property
+    def children(self) -> List["NodeView"]:
+        """
+        Views of the children.
+        """
+
+        return [
+            NodeView(self.arena, index) for index in self.arena.children(self.index)
+        ]
+
+    def node(self) -> Optional[ast.Node]:
+        """Creates the node of the view with its children.
+
+        Returns:
+            Optional[ast.Node]: The node, None for a missing node.
+        """
+
+        return self.arena.to_tree(self.index)
@@ -0,0 +1,321 @@
+"""
+I Language batch processing.
+Version: 0.1.6
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import concurrent.futures
+import dataclasses
+import functools
+import mmap
+import os
+import pathlib
+import time
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+from . import lexer, parser
+from .cache import Cache, CacheEntry
+from .context import CompilationContext
+
+
+#############
+# CONSTANTS #
+#############
+
+SOURCE_SUFFIX: Final[str] = ".ilang"
+
+
+###########
+# RESULTS #
+###########
+
+
+@dataclasses.dataclass
+class FileResult:
+    """
+    Represents the result of processing a single file.
+    """
+
+    path: str
+    token_count: int = 0
+    seconds: float = 0.0
+    tokens: Optional[List[str]] = None
+    error: Optional[str] = None
+    cached: bool = False
+    diagnostics: List[str] = dataclasses.field(default_factory=list)  # All errors
+
+
+@dataclasses.dataclass
+class BatchResult:
+    """
+    Represents the results of processing several files.
+    """
+
+    files: List[FileResult]
+    seconds: float
+    jobs: int
+
+    @property
+    def token_count(self) -> int:
+        """
+        Number of tokens in all files.
+        """
+
+        return sum(result.token_count for result in self.files)
+
+    @property
+    def failed(self) -> List[FileResult]:
+        """
+        Results of the files, which could not be processed or have errors.
+        """
+
+        return [
+            result
+            for result in self.files
+            if result.error is not None or result.diagnostics
+        ]
+
+    @property
+    def cached(self) -> List[FileResult]:
+        """
+        Results of the files, which were loaded from the cache.
+        """
+
+        return [result for result in self.files if result.cached]
+
+    def summary(self) -> str:
+        """Returns the timing summary of the batch.
+
+        The speedup compares the time spent in all files with the elapsed time.
+
+        Returns:
+            str: Summary of the batch.
+        """
+
+        busy = sum(result.seconds for result in self.files)
+        rate = self.token_count / self.seconds if self.seconds else 0.0
+        speedup = busy / self.seconds if self.seconds else 0.0
+
+        return (
+            f"Processed {len(self.files)} files ({self.token_count} tokens,"
+            f" {len(self.cached)} cached, {len(self.failed)} failed) in"
+            f" {self.seconds:.3f}s with {self.jobs} jobs: {rate:.0f} tokens/s,"
+            f" {busy:.3f}s busy, {speedup:.2f}x speedup"
+        )
+
+
+#########
+# BATCH #
+#########
+
+
+def collect_files(paths: Iterable[Union[str, os.PathLike]]) -> List[str]:
+    """Collects the files to process.
+
+    Directories are searched recursively for I sources. Every file is only
+    returned once, in the order it was first found.
+
+    Args:
+        paths (Iterable[Union[str, os.PathLike]]): Files and directories.
+
+    Returns:
+        List[str]: Paths of the files.
+    """
+
+    files: List[str] = []
+
+    for path in map(pathlib.Path, paths):
+        if path.is_dir():
+            files.extend(str(file) for file in sorted(path.rglob(f"*{SOURCE_SUFFIX}")))
+        else:
+            files.append(str(path))
+
+    return list(dict.fromkeys(files))
+
+
+def process_source(
+    source: Union[bytes, mmap.mmap],
+    parse: bool = True,
+    entry: Optional[CacheEntry] = None,
+    context: Optional[CompilationContext] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> CacheEntry:
+    """Lexes and parses a UTF-8 encoded source.
+
+    All parser errors are collected, invalid statements are left out of the tree.
+    Sources processed with different contexts do not share any state, so they can
+    be processed in parallel threads.
+
+    Args:
+        source (Union[bytes, mmap.mmap]): Source to process.
+        parse (bool): Parse the tokens, otherwise the source is only lexed.
+        entry (Optional[CacheEntry]): Output of only lexing the source before.
+        context (Optional[CompilationContext]): Context of the compilation,
+                                                defaults to a new context.
+        executor (Optional[concurrent.futures.Executor]): Process pool to parse the
+                                                          statements in parallel in.
+
+    Returns:
+        CacheEntry: Tokens, parse tree, lexer problems and parser errors of the
+                    source.
+    """
+
+    if context is None:
+        context = CompilationContext()
+    if entry is None:
+        tokens = lexer.lex_bytes(source, context.diagnostics)
+        entry = CacheEntry(tokens, None, context.diagnostics)
+    if not parse:
+        return entry
+
+    parser_ = parser.Parser(list(entry.tokens), context)
+    result = (
+        parser_.parse(recover=True)
+        if executor is None
+        else parser_.parse_parallel(recover=True, executor=executor)
+    )
+    entry.tree = result.tree  # type: ignore[union-attr]
+    entry.errors = [str(error) for error in result.errors]  # type: ignore[union-attr]
+
+    return entry
+
+
+def process_file(
+    path: str,
+    tokens: bool = False,
+    parse: bool = False,
+    cache: Optional[Cache] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> FileResult:
+    """Lexes and optionally parses a single file.
+
+    Args:
+        path (str): Path of the file.
+        tokens (bool): Return the tokens of the file as strings.
+        parse (bool): Parse the file, otherwise it is only lexed.
+        cache (Optional[Cache]): Cache to load and store the output in.
+        executor (Optional[concurrent.futures.Executor]): Process pool to parse the
+                                                          statements in parallel in.
+
+    Returns:
+        FileResult: Result of the file.
+    """
+
+    start = time.perf_counter()
+    result = FileResult(path)
+
+    try:
+        source = lexer.map_file(path)
+        entry = cache.load(source) if cache is not None else None
+        result.cached = entry is not None and (entry.tree is not None or not parse)
+
+        if not result.cached:
+            entry = process_source(source, parse, entry, executor=executor)
+            if cache is not None:
+                cache.store(source, entry)
+
+        result.token_count = len(entry.tokens)  # type: ignore[union-attr]
+        for diagnostic in entry.diagnostics:  # type: ignore[union-attr]
+            line, column = entry.tokens.lines.position(  # type: ignore[union-attr]
+                diagnostic.offset
+            )
+            result.diagnostics.append(
+                f"{diagnostic.message} in line {line}, column {column}"
+            )
+        result.diagnostics.extend(entry.errors)  # type: ignore[union-attr]
+        if tokens:
+            result.tokens = [str(token) for token in entry.tokens]  # type: ignore
+
+    except FileNotFoundError:
+        result.error = "The specified file does not exist."
+    except (OSError, UnicodeDecodeError):
+        result.error = "Can not read the specified file."
+
+    result.seconds = time.perf_counter() - start
+
+    return result
+
+
+def run_batch(
+    paths: Iterable[Union[str, os.PathLike]],
+    jobs: Optional[int] = None,
+    tokens: bool = False,
+    parse: bool = False,
+    cache: Optional[Cache] = None,
+    parallel_parse: bool = False,
+) -> BatchResult:
+    """Lexes and optionally parses files and directories in parallel.
+
+    The files are distributed over a process pool, but the results are always in
+    the order of collect_files. When parsing in parallel, the files are processed
+    one after another and the statements of every file are distributed instead,
+    which is only faster for very large files.
+
+    Args:
+        paths (Iterable[Union[str, os.PathLike]]): Files and directories.
+        jobs (Optional[int]): Number of processes, defaults to the number of CPUs.
+        tokens (bool): Return the tokens of the files as strings.
+        parse (bool): Parse the files, otherwise they are only lexed.
+        cache (Optional[Cache]): Cache to load and store the output in. Old entries
+                                 are evicted after all files are processed.
+        parallel_parse (bool): Parse the statements of every file in parallel.
+
+    Returns:
+        BatchResult: Results of the files.
+    """
+
+    files = collect_files(paths)
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    worker = functools.partial(
+        process_file, tokens=tokens, parse=parse, cache=cache
+    )
+    start = time.perf_counter()
+
+    if parallel_parse and jobs > 1 and parse:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = [worker(file, executor=executor) for file in files]
+    elif jobs == 1 or len(files) < 2:  # Starting processes would take longer
+        results = list(map(worker, files))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(
+                executor.map(worker, files, chunksize=max(1, len(files) // jobs // 4))
+            )
+
+    if cache is not None:
+        cache.evict()
+
+    return BatchResult(results, time.perf_counter() - start, jobs)
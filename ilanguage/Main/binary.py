@@ -0,0 +1,413 @@
+"""
+I Language binary AST format.
+Version: 0.1.2
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import array
+import mmap
+import os
+import struct
+import sys
+from typing import (
+    Dict,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+from . import _ast as ast
+from .arena import KINDS, Arena
+
+
+#############
+# CONSTANTS #
+#############
+
+MAGIC: Final[bytes] = b"IAST"
+# Has to be increased whenever the layout or arena.NODE_CLASSES changes
+FORMAT_VERSION: Final[int] = 3
+
+# Magic, format version, byte order of the tables (0 little, 1 big), reserved,
+# number of nodes, strings and constants
+HEADER: Final[struct.Struct] = struct.Struct("<4sBBHIII")
+BYTE_ORDERS: Final[Tuple[str, str]] = ("little", "big")
+ALIGNMENT: Final[int] = 8  # Of every table, so they can be cast in place
+
+# Integer columns of the node table, stored after the kinds
+COLUMNS: Final[Tuple[str, ...]] = (
+    "names",
+    "types",
+    "values",
+    "lines",
+    "levels",
+    "extras",
+    "parents",
+    "first_children",
+    "next_siblings",
+    "attributes",
+)
+INTEGER: Final[str] = "i"  # 32 bit signed, as every row is
+OFFSET: Final[str] = "I"  # 32 bit unsigned, as offsets into the string data are
+
+
+##########
+# TABLES #
+##########
+
+
+class StringTable(Sequence[str]):
+    """
+    Represents a string table in a loaded file.
+
+    Strings are decoded on first access, so only the strings of the nodes which
+    are looked at are ever created.
+    """
+
+    def __init__(self, offsets: Sequence[int], data: memoryview) -> None:
+        """Initializes a string table.
+
+        Args:
+            offsets (Sequence[int]): Start of every string and the end of the last.
+            data (memoryview): UTF-8 encoded strings.
+        """
+
+        self.offsets = offsets
+        self.data = data
+        self._strings: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(len(self))[index]]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("String index out of range")
+
+        string = self._strings.get(index)
+        if string is None:
+            string = self._strings[index] = str(
+                self.data[self.offsets[index] : self.offsets[index + 1]], "utf-8"
+            )
+
+        return string
+
+
+def _padding(size: int) -> bytes:
+    """Returns the padding to align a table after some bytes.
+
+    Args:
+        size (int): Number of bytes before the table.
+
+    Returns:
+        bytes: Zero bytes to add.
+    """
+
+    return bytes(-size % ALIGNMENT)
+
+
+def _aligned(data: bytes) -> bytes:
+    """Pads a table, which starts aligned, so the next table starts aligned too.
+
+    Args:
+        data (bytes): Data of the table.
+
+    Returns:
+        bytes: Padded data.
+    """
+
+    return data + _padding(len(data))
+
+
+def _string_table(strings: Sequence[str]) -> bytes:
+    """Encodes a string table.
+
+    Args:
+        strings (Sequence[str]): Strings of the table.
+
+    Returns:
+        bytes: The offsets and the UTF-8 encoded strings, both padded.
+    """
+
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = array.array(OFFSET, [0])
+
+    for string in encoded:
+        offsets.append(offsets[-1] + len(string))
+
+    return _aligned(offsets.tobytes()) + _aligned(b"".join(encoded))
+
+
+###########
+# WRITING #
+###########
+
+
+def dumps(tree: Union[ast.Node, Arena]) -> bytes:
+    """Encodes a tree.
+
+    Args:
+        tree (Union[ast.Node, Arena]): Tree or arena to encode.
+
+    Returns:
+        bytes: Encoded tree.
+
+    Raises:
+        TypeError: If a node is of a class, which can not be stored.
+    """
+
+    compact = tree if isinstance(tree, Arena) else Arena.from_tree(tree)
+    parts = [
+        HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            BYTE_ORDERS.index(sys.byteorder),
+            0,
+            len(compact),
+            len(compact.strings),
+            len(compact.constants),
+        ),
+        compact.kinds.tobytes(),
+        _padding(HEADER.size + len(compact)),
+    ]
+
+    for column in COLUMNS:
+        integers = array.array(INTEGER, getattr(compact, column))
+        parts.append(_aligned(integers.tobytes()))
+    parts.append(_string_table(compact.strings))
+    parts.append(_string_table(compact.constants))
+
+    return b"".join(parts)
+
+
+def dump(tree: Union[ast.Node, Arena], path: Union[str, os.PathLike]) -> None:
+    """Writes a tree to a file.
+
+    Args:
+        tree (Union[ast.Node, Arena]): Tree or arena to write.
+        path (Union[str, os.PathLike]): Path of the file.
+
+    Raises:
+        TypeError: If a node is of a class, which can not be stored.
+    """
+
+    data = dumps(tree)
+
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+###########
+# READING #
+###########
+
+
+class _Reader:  # pylint: disable=R0903
+    """
+    Represents the position in a file while reading its tables.
+    """
+
+    def __init__(self, data: memoryview, swap: bool) -> None:
+        """Initializes a reader.
+
+        Args:
+            data (memoryview): Data of the file.
+            swap (bool): Swap the byte order of the integers.
+        """
+
+        self.data = data
+        self.swap = swap
+        self.position = HEADER.size
+
+    def take(self, size: int) -> memoryview:
+        """Returns the next bytes and skips the padding after them.
+
+        Args:
+            size (int): Number of bytes.
+
+        Returns:
+            memoryview: The bytes.
+
+        Raises:
+            ValueError: If the file is too short.
+        """
+
+        end = self.position + size
+        if end > len(self.data):
+            raise ValueError("Truncated AST file")
+
+        data = self.data[self.position : end]
+        self.position = end + len(_padding(end))
+
+        return data
+
+    def integers(self, typecode: str, count: int) -> Sequence[int]:
+        """Returns the next integers.
+
+        The integers are used in place, unless their byte order has to be swapped.
+
+        Args:
+            typecode (str): Type of the integers.
+            count (int): Number of integers.
+
+        Returns:
+            Sequence[int]: The integers.
+        """
+
+        data = self.take(count * struct.calcsize(typecode))
+
+        if not self.swap:
+            return data.cast(typecode)
+
+        integers = array.array(typecode)
+        integers.frombytes(data)
+        integers.byteswap()
+
+        return integers
+
+    def strings(self, count: int) -> StringTable:
+        """Returns the next string table.
+
+        Args:
+            count (int): Number of strings.
+
+        Returns:
+            StringTable: The string table.
+
+        Raises:
+            ValueError: If the file is too short.
+        """
+
+        offsets = self.integers(OFFSET, count + 1)
+
+        return StringTable(offsets, self.take(offsets[-1]))
+
+
+def loads(data: Union[bytes, bytearray, memoryview, mmap.mmap]) -> Arena:
+    """Decodes a tree.
+
+    No node and no string is decoded yet, the columns of the returned arena refer
+    to the data directly. Nodes are created when they are accessed through views
+    or Arena.to_tree.
+
+    Args:
+        data (Union[bytes, bytearray, memoryview, mmap.mmap]): Encoded tree.
+
+    Returns:
+        Arena: Arena of the tree.
+
+    Raises:
+        ValueError: If the data is no encoded tree of this version.
+    """
+
+    view = memoryview(data).cast("B")
+    if len(view) < HEADER.size:
+        raise ValueError("Truncated AST file")
+
+    magic, version, byte_order, _, nodes, strings, constants = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not an AST file")
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported AST file version {version}, expected {FORMAT_VERSION}"
+        )
+    if byte_order >= len(BYTE_ORDERS):
+        raise ValueError(f"Invalid byte order {byte_order} in AST file")
+
+    reader = _Reader(view, BYTE_ORDERS[byte_order] != sys.byteorder)
+    compact = Arena()
+    compact.kinds = reader.take(nodes)  # type: ignore[assignment]
+
+    for column in COLUMNS:
+        setattr(compact, column, reader.integers(INTEGER, nodes))
+    compact.strings = reader.strings(strings)  # type: ignore[assignment]
+    compact.constants = reader.strings(constants)  # type: ignore[assignment]
+
+    return compact
+
+
+def load(path: Union[str, os.PathLike]) -> Arena:
+    """Maps a file and decodes its tree.
+
+    The file is mapped into memory, so only the pages of the accessed nodes are
+    read from the disk.
+
+    Args:
+        path (Union[str, os.PathLike]): Path of the file.
+
+    Returns:
+        Arena: Arena of the tree.
+
+    Raises:
+        ValueError: If the file contains no encoded tree of this version.
+    """
+
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            raise ValueError("Truncated AST file")
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return loads(data)
+
+
+def imports(compact: Arena) -> List[str]:
+    """Returns the names of the imported modules.
+
+    Only the rows of the statements and the names of the imports are decoded.
+
+    Args:
+        compact (Arena): Arena of a program.
+
+    Returns:
+        List[str]: Names of the imports in order.
+    """
+
+    kind = KINDS[ast.Import]
+
+    return [
+        compact.strings[compact.names[index]]
+        for index in compact.children(0)
+        if compact.kinds[index] == kind
+    ]
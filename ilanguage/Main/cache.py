@@ -0,0 +1,330 @@
+"""
+I Language cache.
+Version: 0.1.3
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import array
+import dataclasses
+import hashlib
+import json
+import mmap
+import os
+import pathlib
+import struct
+import sys
+from typing import (
+    List,
+    Optional,
+    Union,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+from . import _ast as ast
+from . import binary, lexer, parser
+from .options import options
+
+
+#############
+# CONSTANTS #
+#############
+
+DEFAULT_DIRECTORY: Final[str] = "__ilcache__"
+DEFAULT_MAX_SIZE: Final[int] = 64 * 1024 * 1024  # Bytes
+SUFFIX: Final[str] = ".cache"
+MAGIC: Final[bytes] = b"ILCC"
+FORMAT_VERSION: Final[int] = 1  # Of the entries, has to be increased on changes
+
+# Magic, format version, byte order of the token arrays (0 little, 1 big), reserved,
+# number of tokens, size of the metadata and size of the tree
+HEADER: Final[struct.Struct] = struct.Struct("<4sBBHIII")
+
+
+#########
+# CACHE #
+#########
+
+
+@dataclasses.dataclass
+class CacheEntry:
+    """
+    Represents the cached lexer and parser output of a source.
+    """
+
+    tokens: lexer.TokenBuffer
+    tree: Optional[ast.Main] = None  # None if the source was only lexed
+    diagnostics: List[lexer.Diagnostic] = dataclasses.field(default_factory=list)
+    errors: List[str] = dataclasses.field(default_factory=list)  # Parser errors
+
+
+class Cache:
+    """
+    Represents a directory of cached lexer and parser output.
+
+    Entries are addressed by a hash of the source and the versions of the language,
+    the lexer and the parser, so changed sources or a new version never hit an old
+    entry. The least recently used entries are evicted once the directory grows
+    larger than its maximum size.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike] = DEFAULT_DIRECTORY,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """Initializes a cache.
+
+        Args:
+            directory (Union[str, os.PathLike]): Directory to store the entries in.
+                                                 It is created on first use.
+            max_size (int): Maximum size of all entries in bytes.
+        """
+
+        self.directory = pathlib.Path(directory)
+        self.max_size = max_size
+
+    @staticmethod
+    def key(source: Union[bytes, mmap.mmap]) -> str:
+        """Returns the key of a source.
+
+        Args:
+            source (Union[bytes, mmap.mmap]): UTF-8 encoded source.
+
+        Returns:
+            str: Key of the source.
+        """
+
+        digest = hashlib.sha256()
+
+        for version in (
+            str(options["version"]),
+            lexer.__version__,
+            parser.__version__,
+            ast.__version__,
+            str(binary.FORMAT_VERSION),
+            str(FORMAT_VERSION),
+        ):
+            digest.update(version.encode() + b"\0")
+        digest.update(source)
+
+        return digest.hexdigest()
+
+    def path(self, key: str) -> pathlib.Path:
+        """Returns the path of an entry.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            pathlib.Path: Path of the entry.
+        """
+
+        return self.directory / f"{key}{SUFFIX}"
+
+    def load(self, source: Union[bytes, mmap.mmap]) -> Optional[CacheEntry]:
+        """Loads the entry of a source.
+
+        Entries only contain plain data, the token arrays, the tree in the binary
+        AST format and JSON, so loading an entry never runs any code of it.
+
+        Args:
+            source (Union[bytes, mmap.mmap]): UTF-8 encoded source.
+
+        Returns:
+            Optional[CacheEntry]: Entry of the source, None if it is not cached.
+        """
+
+        path = self.path(self.key(source))
+
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+
+            entry = _decode(source, data)
+            os.utime(path)  # Marks the entry as recently used
+        except (OSError, ValueError, TypeError, KeyError, IndexError, struct.error):
+            return None
+
+        return entry
+
+    def store(self, source: Union[bytes, mmap.mmap], entry: CacheEntry) -> None:
+        """Stores the entry of a source.
+
+        The entry is written to a temporary file first, so processes sharing the
+        cache never read incomplete entries.
+
+        Args:
+            source (Union[bytes, mmap.mmap]): UTF-8 encoded source.
+            entry (CacheEntry): Lexer and parser output of the source.
+        """
+
+        path = self.path(self.key(source))
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with open(temporary, "wb") as file:
+            file.write(_encode(entry))
+
+        os.replace(temporary, path)
+
+    def evict(self) -> int:
+        """Removes the least recently used entries until the cache is small enough.
+
+        Returns:
+            int: Number of removed entries.
+        """
+
+        entries: List[os.stat_result] = []
+        paths: List[pathlib.Path] = []
+
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            try:
+                entries.append(path.stat())
+                paths.append(path)
+            except OSError:  # Removed by another process
+                continue
+
+        size = sum(entry.st_size for entry in entries)
+        removed = 0
+
+        for entry, path in sorted(
+            zip(entries, paths), key=lambda item: item[0].st_mtime
+        ):
+            if size <= self.max_size:
+                break
+
+            try:
+                path.unlink()
+            except OSError:
+                continue
+
+            size -= entry.st_size
+            removed += 1
+
+        return removed
+
+
+############
+# ENCODING #
+############
+
+
+def _encode(entry: CacheEntry) -> bytes:
+    """Encodes a cache entry.
+
+    Args:
+        entry (CacheEntry): Entry to encode.
+
+    Returns:
+        bytes: Encoded entry.
+    """
+
+    tokens = entry.tokens
+    metadata = json.dumps(
+        {
+            "values": sorted(tokens.values.items()),
+            "diagnostics": [
+                [diagnostic.kind, diagnostic.message, diagnostic.offset]
+                for diagnostic in entry.diagnostics
+            ],
+            "errors": entry.errors,
+        }
+    ).encode("utf-8")
+
+    try:
+        tree = binary.dumps(entry.tree) if entry.tree is not None else b""
+    except TypeError:  # Only the tokens are cached, the source is parsed again
+        tree = b""
+
+    return b"".join(
+        (
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                binary.BYTE_ORDERS.index(sys.byteorder),
+                0,
+                len(tokens),
+                len(metadata),
+                len(tree),
+            ),
+            tokens.kinds.tobytes(),
+            tokens.starts.tobytes(),
+            tokens.ends.tobytes(),
+            metadata,
+            tree,
+        )
+    )
+
+
+def _decode(source: Union[bytes, mmap.mmap], data: bytes) -> CacheEntry:
+    """Decodes a cache entry.
+
+    Args:
+        source (Union[bytes, mmap.mmap]): UTF-8 encoded source of the entry.
+        data (bytes): Encoded entry.
+
+    Returns:
+        CacheEntry: The entry.
+
+    Raises:
+        ValueError: If the data is no entry of this version and byte order.
+    """
+
+    magic, version, byte_order, _, count, metadata_size, tree_size = (
+        HEADER.unpack_from(data)
+    )
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not a cache entry of this version")
+    if byte_order != binary.BYTE_ORDERS.index(sys.byteorder):
+        raise ValueError("Cache entry of another byte order")
+
+    tokens = lexer.TokenBuffer(source)
+    position = HEADER.size
+
+    for column in (tokens.kinds, tokens.starts, tokens.ends):
+        end = position + count * column.itemsize
+        column.frombytes(data[position:end])
+        position = end
+
+    end = position + metadata_size
+    metadata = json.loads(data[position:end].decode("utf-8"))
+    if len(data) != end + tree_size or len(tokens.ends) != count:
+        raise ValueError("Truncated cache entry")
+
+    tokens.values = dict(metadata["values"])
+    tree = binary.loads(data[end:]).to_tree() if tree_size else None
+
+    return CacheEntry(
+        tokens,
+        tree,  # type: ignore[arg-type]
+        [lexer.Diagnostic(*diagnostic) for diagnostic in metadata["diagnostics"]],
+        metadata["errors"],
+    )
@@ -0,0 +1,102 @@
+"""
+I Language compilation context.
+Version: 0.1.2
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import contextlib
+import contextvars
+import copy
+import dataclasses
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+from . import lexer
+from .options import options as global_options
+from .symbols import SymbolTable
+
+
+###########
+# CONTEXT #
+###########
+
+
+@dataclasses.dataclass
+class CompilationContext:
+    """
+    Represents the state of compiling a single program.
+
+    Contexts do not share any mutable state, so every thread can compile its own
+    program with its own context. The options are a copy of the global options.
+    """
+
+    options: Dict[str, Any] = dataclasses.field(
+        default_factory=lambda: copy.deepcopy(global_options)
+    )
+    symbols: SymbolTable = dataclasses.field(default_factory=SymbolTable)
+    diagnostics: List[lexer.Diagnostic] = dataclasses.field(default_factory=list)
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator["CompilationContext"]:
+        """Makes the context the current context of the running thread.
+
+        Yields:
+            CompilationContext: The context.
+        """
+
+        token = _CURRENT.set(self)
+
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+
+
+# Context of the compilation running in the current thread
+_CURRENT: Final[contextvars.ContextVar] = contextvars.ContextVar(
+    "context", default=None
+)
+
+
+def current() -> CompilationContext:
+    """Returns the current context of the running thread.
+
+    Returns:
+        CompilationContext: The current context, a new one if no context is active.
+    """
+
+    context = _CURRENT.get()
+
+    return context if context is not None else CompilationContext()
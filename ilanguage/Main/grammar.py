@@ -1,6 +1,6 @@
 """
 I Language grammar.
-Version: 0.1.1
+Version: 0.1.3
 
 Copyright (c) 2023-present I Language Development.
 
@@ -34,7 +34,14 @@ DEALINGS IN THE SOFTWARE.
 # IMPORTS #
 ###########
 
-from typing import List
+import re
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
 
 from typing_extensions import Final
 
@@ -42,6 +49,11 @@ from typing_extensions import Final
 # GRAMMAR #
 ###########
 
+# The patterns match in linear time: they have no nested repetitions, blocks start
+# at the first '{' of their line or the end of the statement is checked first, and
+# bodies are matched as [\s\S] instead of (.|\n), which backtracks per character.
+# Bodies still capture their last character, so the groups keep their numbers.
+
 # Base types
 
 BASE_TYPES: Final[List[str]] = [
@@ -65,12 +77,12 @@ USE_OPTIONS: Final[List[str]] = ["Python", "GarbageCollection"]
 
 # Comments
 COMMENT: Final[str] = r"// .* \n$"
-LONG_COMMENT: Final[str] = r"\/\*(.|\n)*\*\/"
+LONG_COMMENT: Final[str] = r"\/\*[\s\S]*\*\/"
 
 # Imports
 IMPORT: Final[
     str
-] = r"^import ([a-zA-Z0-9_]+,?)+( from [a-zA-Z0-9_]+)?( as [a-zA-Z0-9_]+)?;$"
+] = r"^import [a-zA-Z0-9_]+(,[a-zA-Z0-9_]+)*,?( from [a-zA-Z0-9_]+)?( as [a-zA-Z0-9_]+)?;$"
 
 # Constant
 CONSTANT: Final[str] = rf"^const( ({'|'.join(BASE_TYPES)}))? [a-zA-Z0-9-_]+( )?=.*;$"
@@ -79,29 +91,31 @@ CONSTANT: Final[str] = rf"^const( ({'|'.join(BASE_TYPES)}))? [a-zA-Z0-9-_]+( )?=
 VARIABLE: Final[str] = rf"^(var|({'|'.join(BASE_TYPES)}))( [a-zA-Z0-9-_]?)( )?=.*;$"
 
 # Class
-CLASS: Final[str] = r"^class [a-zA-Z1-9-_]+( )?\(([a-zA-Z1-9-_]*)\)( )?{(.|\n)*};$"
+CLASS: Final[
+    str
+] = r"^class [a-zA-Z1-9-_]+( )?\(([a-zA-Z1-9-_]*)\)( )?{(?:[\s\S]*([\s\S]))?};$"
 
 # Function
 FUNCTION: Final[
     str
-] = r"^(private )?(func(tion)?|(str|boolean)) [a-zA-Z0-9-_]+( )?\((((str|boolean) )?[a-zA-Z0-9-_]+( )?=( )?.*)*\)( )?{(.|\n)*};$"
+] = r"^(?=[\s\S]*};$)(private )?(func(tion)?|(str|boolean)) [a-zA-Z0-9-_]+( )?\((((str|boolean) )?[a-zA-Z0-9-_]+( )?=( )?.*)?\)( )?{(?:[\s\S]*([\s\S]))?};$"
 
 # Use
 USE: Final[str] = rf"^use ({'|'.join(USE_OPTIONS)});$"
 
 # If clauses
-IF: Final[str] = r"^if (\()?(.*)(\))?( )?{((.|\n)+)}(;)?$"
-ELSE: Final[str] = r"^} else {((.|\n)+)};$"
-ELIF: Final[str] = r"^} elif {((.|\n)+)}(;)?"
+IF: Final[str] = r"^if (\()?([^{\n]*)(\))?( )?{([\s\S]*([\s\S]))}(;)?$"
+ELSE: Final[str] = r"^} else {([\s\S]*([\s\S]))};$"
+ELIF: Final[str] = r"^} elif {([\s\S]*([\s\S]))}(;)?"
 
 # Match statements
-MATCH: Final[str] = r"^match (\))?(.*)(\))?( )?{((.|\n)+)};$"
-CASE: Final[str] = r"^case (\()?(.*)(\))?( )?{((.|\n)+)}(;)?$"
-DEFAULT: Final[str] = r"^default( )?{((.|\n)+)};$"
+MATCH: Final[str] = r"^match (\))?([^{\n]*)(\))?( )?{([\s\S]*([\s\S]))};$"
+CASE: Final[str] = r"^case (\()?([^{\n]*)(\))?( )?{([\s\S]*([\s\S]))}(;)?$"
+DEFAULT: Final[str] = r"^default( )?{([\s\S]*([\s\S]))};$"
 
 # Loops
-WHILE: Final[str] = r"^while (\()?(.*)(\))?( )?{((.|\n)+)};$"
-FOR: Final[str] = r"^for (\()?(.*)(\))?( )?{((.|\n)+)};$"
+WHILE: Final[str] = r"^while (\()?([^{\n]*)(\))?( )?{([\s\S]*([\s\S]))};$"
+FOR: Final[str] = r"^for (\()?([^{\n]*)(\))?( )?{([\s\S]*([\s\S]))};$"
 
 # Return
 RETURN: Final[str] = r"^return (.*);$"
@@ -118,7 +132,152 @@ CONTINIUE: Final[str] = r"^continue;$"
 # Try statements
 TRY: Final[
     str
-] = r"^try {((.|\n)+)} catch (\()?(.*)(\))?( )?{((.|\n)+)}(;)?"  # Try statements have to have at least one catch statement
-CATCH: Final[str] = r"^} catch (\()?(.*)(\))?( )?{((.|\n)+)}(;)?"
+] = r"^try {(?=([\s\S]*([\s\S]))} catch )\1} catch (\()?([^{\n]*)(\))?( )?{([\s\S]*([\s\S]))}(;)?"  # Try statements have to have at least one catch statement
+CATCH: Final[str] = r"^} catch (\()?([^{\n]*)(\))?( )?{([\s\S]*([\s\S]))}(;)?"
 THROW: Final[str] = r"^throw ([a-zA-Z0-9-_])+( from ([a-zA-Z0-9-_])+)?;$"
-FINALLY: Final[str] = r"^} finally {((.|\n)+)};"
+FINALLY: Final[str] = r"^} finally {([\s\S]*([\s\S]))};"
+
+# Compiled patterns of the statements, by statement kind
+PATTERNS: Final[Dict[str, "re.Pattern[str]"]] = {
+    kind: re.compile(pattern)
+    for kind, pattern in {
+        "IMPORT": IMPORT,
+        "CONSTANT": CONSTANT,
+        "VARIABLE": VARIABLE,
+        "CLASS": CLASS,
+        "FUNCTION": FUNCTION,
+        "USE": USE,
+        "IF": IF,
+        "ELSE": ELSE,
+        "ELIF": ELIF,
+        "MATCH": MATCH,
+        "CASE": CASE,
+        "DEFAULT": DEFAULT,
+        "WHILE": WHILE,
+        "FOR": FOR,
+        "RETURN": RETURN,
+        "DELETE": DELETE,
+        "BREAK": BREAK,
+        "CONTINUE": CONTINIUE,
+        "TRY": TRY,
+        "CATCH": CATCH,
+        "THROW": THROW,
+        "FINALLY": FINALLY,
+    }.items()
+}
+
+# Statement kinds by the type of their first token
+STATEMENT_KEYWORDS: Final[Dict[str, str]] = {
+    "IMPORT": "IMPORT",
+    "USE": "USE",
+    "CLASS": "CLASS",
+    "FUNCTION": "FUNCTION",
+    "IF": "IF",
+    "MATCH": "MATCH",
+    "CASE": "CASE",
+    "DEFAULT": "DEFAULT",
+    "WHILE": "WHILE",
+    "FOR": "FOR",
+    "RETURN": "RETURN",
+    "DELETE": "DELETE",
+    "BREAK": "BREAK",
+    "CONTINUE": "CONTINUE",
+    "TRY": "TRY",
+    "THROW": "THROW",
+    "BASETYPE": "VARIABLE",
+    "INDEFINITE": "VARIABLE",
+}
+# Statement kinds continuing the block of the statement before, e.g. '} else {'
+CONTINUATION_KEYWORDS: Final[Dict[str, str]] = {
+    "ELSE": "ELSE",
+    "ELIF": "ELIF",
+    "CATCH": "CATCH",
+    "FINALLY": "FINALLY",
+}
+# Statement kinds of names used like keywords
+STATEMENT_NAMES: Final[Dict[str, str]] = {
+    "const": "CONSTANT",
+    "var": "VARIABLE",
+}
+# Statement kinds, which need a block
+BLOCK_STATEMENTS: Final[List[str]] = [
+    "CLASS",
+    "FUNCTION",
+    "IF",
+    "ELSE",
+    "ELIF",
+    "MATCH",
+    "CASE",
+    "DEFAULT",
+    "WHILE",
+    "FOR",
+    "TRY",
+    "CATCH",
+    "FINALLY",
+]
+
+
+def match(kind: str, statement: str) -> Optional["re.Match[str]"]:
+    """Matches the source of a statement with the pattern of a statement kind.
+
+    Args:
+        kind (str): Kind of the statement, a key of PATTERNS.
+        statement (str): Source of the statement.
+
+    Returns:
+        Optional[re.Match[str]]: The match, None if the statement is of another
+                                 kind.
+    """
+
+    return PATTERNS[kind].match(statement)
+
+
+def classify(statement_tokens: Sequence[Any]) -> Optional[str]:
+    """Returns the kind of a statement.
+
+    The kind is found by the first tokens of the statement and block statements
+    are checked to have balanced blocks, so every token is only looked at once.
+
+    Args:
+        statement_tokens (Sequence[Any]): Tokens of the statement, e.g. lexer tokens
+                                          or the views of a token buffer.
+
+    Returns:
+        Optional[str]: Kind of the statement, a key of PATTERNS, None if the
+                       statement is of no known kind.
+    """
+
+    tokens = [token for token in statement_tokens if token.type != "NEWLINE"]
+    if not tokens:
+        return None
+
+    types = [token.type for token in tokens]
+    first = 0
+    kind = STATEMENT_KEYWORDS.get(types[0])
+
+    if types[0] == "NAME":
+        kind = STATEMENT_NAMES.get(tokens[0].value)
+        if tokens[0].value == "private" and types[1:2] == ["FUNCTION"]:
+            kind = "FUNCTION"
+    elif types[0] == "BLOCK_CLOSE" and len(types) > 1:
+        kind = CONTINUATION_KEYWORDS.get(types[1])
+        first = 1  # The '}' closes the block of the statement before
+
+    if kind is None or kind not in BLOCK_STATEMENTS:
+        return kind
+    if types[-1] == "SEMICOLON":
+        types.pop()
+    if "BLOCK_OPEN" not in types or types[-1] != "BLOCK_CLOSE":
+        return None
+
+    depth = 0
+
+    for token_type in types[first:]:
+        if token_type == "BLOCK_OPEN":
+            depth += 1
+        elif token_type == "BLOCK_CLOSE":
+            depth -= 1
+            if depth < 0:
+                return None
+
+    return kind if depth == 0 else None
@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 """
 I Language lexer.
-Version: 0.1.5
+Version: 0.1.14
 
 Copyright (c) 2023-present I Language Development.
 
@@ -30,20 +30,30 @@ DEALINGS IN THE SOFTWARE.
 #########
 
 __author__ = "I-language Development"
-__version__ = "0.1.5"
+__version__ = "0.1.14"
 
 
 ###########
 # IMPORTS #
 ###########
 
+import array
+import bisect
 import dataclasses
 import io
+import itertools
+import mmap
+import os
+import re
 import sys
 from typing import (
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    TextIO,
+    Tuple,
     Union,
 )
 
@@ -135,6 +145,25 @@ BASE_TYPES: Final[List[str]] = [
     "null",
     "mdarray",
 ]
+TOKEN_TYPES: Final[List[str]] = [
+    "NEWLINE",
+    "NAME",
+    "BUILTIN_CONST",
+    "BOOL",
+    "BASETYPE",
+    "INT",
+    "FLOAT",
+    "STRING",
+    *KEYWORDS.values(),
+    *MARKS.values(),
+    *DOUBLE_MARKS.values(),
+]
+TOKEN_KINDS: Final[Dict[str, int]] = {
+    token_type: kind for kind, token_type in enumerate(TOKEN_TYPES)
+}
+
+_NEWLINE_PATTERN: Final[re.Pattern] = re.compile("\n")
+_BYTES_NEWLINE_PATTERN: Final[re.Pattern] = re.compile(b"\n")
 
 
 #################
@@ -150,6 +179,59 @@ class LexerToken:
 
     type: str
     value: str
+    # Offset of the first character in the source, -1 if unknown (e.g. legacy lexer)
+    offset: int = dataclasses.field(default=-1, repr=False, compare=False)
+
+
+class LineIndex:
+    """
+    Represents the start offsets of all lines of a source.
+
+    Lines and columns of an offset are looked up with a binary search, so tokens only
+    have to store their offset.
+    """
+
+    def __init__(self, source: Union[str, bytes, mmap.mmap] = "") -> None:
+        """Initializes a line index.
+
+        Args:
+            source (Union[str, bytes, mmap.mmap]): Source to index. More text can be
+                                                   added with add.
+        """
+
+        self.starts = array.array("I", [0])
+        self.length = 0
+
+        self.add(source)
+
+    def add(self, text: Union[str, bytes, mmap.mmap]) -> None:
+        """Adds the next chunk of the source.
+
+        Args:
+            text (Union[str, bytes, mmap.mmap]): Text to add. Offsets of bytes are
+                                                 counted in bytes.
+        """
+
+        pattern = _NEWLINE_PATTERN if isinstance(text, str) else _BYTES_NEWLINE_PATTERN
+
+        self.starts.extend(
+            self.length + match.end() for match in pattern.finditer(text)
+        )
+        self.length += len(text)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """Returns the line and column of an offset.
+
+        Args:
+            offset (int): Offset in the source.
+
+        Returns:
+            Tuple[int, int]: Line and column, both starting at 1.
+        """
+
+        line = bisect.bisect_right(self.starts, offset)
+
+        return line, offset - self.starts[line - 1] + 1
 
 
 class LexerError:  # pylint: disable=R0903
@@ -171,6 +253,261 @@ class LexerError:  # pylint: disable=R0903
         sys.exit(code)
 
 
+@dataclasses.dataclass
+class Diagnostic:
+    """
+    Represents a problem found while lexing, which does not stop the lexer.
+    """
+
+    kind: str  # One of UNRECOGNIZED_PATTERN, UNCLOSED_STRING and UNCLOSED_COMMENT
+    message: str
+    offset: int
+
+
+class TokenBuffer:
+    """
+    Represents lexed tokens stored in compact arrays.
+
+    Token kinds are stored as indices into TOKEN_TYPES and the start and end offsets
+    point into the source. Values are only created when they are accessed. Sources
+    can also be UTF-8 encoded bytes, then offsets are byte offsets and values are
+    decoded on access.
+    """
+
+    def __init__(self, source: Union[str, bytes, mmap.mmap]) -> None:
+        """Initializes an empty token buffer.
+
+        Args:
+            source (Union[str, bytes, mmap.mmap]): Text the tokens are lexed from.
+        """
+
+        self.source = source
+        self.encoded = not isinstance(source, str)
+        self.kinds = array.array("B")
+        self.starts = array.array("I")
+        self.ends = array.array("I")
+        self.values: Dict[int, str] = {}  # Values, which are not a slice of the source
+        self._lines: Optional[LineIndex] = None
+
+    @property
+    def lines(self) -> LineIndex:
+        """
+        Line index of the source, created on first use.
+        """
+
+        if self._lines is None:
+            self._lines = LineIndex(self.source)
+
+        return self._lines
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> "TokenView":
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("token index out of range")
+
+        return TokenView(self, index)
+
+    def __iter__(self) -> Iterator["TokenView"]:
+        for index in range(len(self.kinds)):
+            yield TokenView(self, index)
+
+    def append(
+        self,
+        token_type: str,
+        value: Union[str, bytes],
+        start: int,
+        end: int,
+    ) -> None:
+        """Appends a token.
+
+        Args:
+            token_type (str): Type of the token.
+            value (Union[str, bytes]): Value of the token, encoded like the source.
+            start (int): Offset of the first character of the token.
+            end (int): Offset after the last character of the token.
+        """
+
+        first, last = start, end
+        if token_type == "STRING":  # The quotes are not part of the value
+            first += 1
+            last -= 1
+
+        # find is bounded to the token, so checking the source does not copy it
+        sliced = (
+            last - first == len(value)
+            and self.source.find(value, first, last) == first  # type: ignore[arg-type]
+        )
+
+        if not sliced:
+            self.values[len(self.kinds)] = (
+                value.decode() if isinstance(value, bytes) else value
+            )
+
+        self.kinds.append(TOKEN_KINDS[token_type])
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def type(self, index: int) -> str:
+        """Returns the type of a token.
+
+        Args:
+            index (int): Index of the token.
+
+        Returns:
+            str: Type of the token.
+        """
+
+        return TOKEN_TYPES[self.kinds[index]]
+
+    def value(self, index: int) -> str:
+        """Returns the value of a token.
+
+        Args:
+            index (int): Index of the token.
+
+        Returns:
+            str: Value of the token.
+        """
+
+        value = self.values.get(index)
+
+        if value is None:
+            if self.kinds[index] == TOKEN_KINDS["STRING"]:
+                value = self.source[self.starts[index] + 1 : self.ends[index] - 1]
+            else:
+                value = self.source[self.starts[index] : self.ends[index]]
+
+            if self.encoded:
+                return value.decode()  # type: ignore[union-attr]
+
+        return value  # type: ignore[return-value]
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Returns the line and column of a token.
+
+        Args:
+            index (int): Index of the token.
+
+        Returns:
+            Tuple[int, int]: Line and column, both starting at 1.
+        """
+
+        return self.lines.position(self.starts[index])
+
+
+class TokenView:
+    """
+    Represents a token of a token buffer, which can be used like a lexer token.
+    """
+
+    __slots__ = ("buffer", "index")
+
+    def __init__(self, buffer: TokenBuffer, index: int) -> None:
+        """Initializes a token view.
+
+        Args:
+            buffer (TokenBuffer): Buffer containing the token.
+            index (int): Index of the token in the buffer.
+        """
+
+        self.buffer = buffer
+        self.index = index
+
+    @property
+    def type(self) -> str:
+        """
+        Type of the token.
+        """
+
+        return self.buffer.type(self.index)
+
+    @property
+    def value(self) -> str:
+        """
+        Value of the token.
+        """
+
+        return self.buffer.value(self.index)
+
+    @property
+    def offset(self) -> int:
+        """
+        Offset of the first character of the token in the source.
+        """
+
+        return self.buffer.starts[self.index]
+
+    @property
+    def line(self) -> int:
+        """
+        Line of the token, starting at 1.
+        """
+
+        return self.buffer.position(self.index)[0]
+
+    @property
+    def column(self) -> int:
+        """
+        Column of the token, starting at 1.
+        """
+
+        return self.buffer.position(self.index)[1]
+
+    def __eq__(self, compare_to: object) -> bool:
+        if isinstance(compare_to, (LexerToken, TokenView)):
+            return self.type == compare_to.type and self.value == compare_to.value
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LexerToken(type={self.type!r}, value={self.value!r})"
+
+
+@dataclasses.dataclass
+class LexResult:
+    """
+    Represents lexed tokens together with all problems found while lexing them.
+    """
+
+    tokens: Union[List[Optional[LexerToken]], TokenBuffer]
+    diagnostics: List[Diagnostic]
+    source: str = dataclasses.field(default="", repr=False)
+    _lines: Optional[LineIndex] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def lines(self) -> LineIndex:
+        """Returns the lines of the source, which are only indexed once.
+
+        Returns:
+            LineIndex: Lines of the source.
+        """
+
+        if self._lines is None:
+            self._lines = LineIndex(self.source)
+
+        return self._lines
+
+    def format(self, diagnostic: Diagnostic) -> str:
+        """Formats a diagnostic like a lexer error.
+
+        Args:
+            diagnostic (Diagnostic): Diagnostic to format.
+
+        Returns:
+            str: Formatted diagnostic.
+        """
+
+        line, column = self.lines.position(diagnostic.offset)
+
+        return f"Error: {diagnostic.message} in line {line}, column {column}"
+
+
 def validate_float(string: str) -> bool:
     """Validates if a string is a valid float.
 
@@ -259,16 +596,750 @@ def gettoken(string: str, line: int, column: int) -> Optional[LexerToken]:
     return result
 
 
+###############
+# TABLE LEXER #
+###############
+
+# The table lexer matches whole runs of characters with precompiled patterns instead of
+# looking at every character on its own. It keeps the quirks of the legacy lexer (e.g.
+# comments not ending a name, "//" starting a comment inside strings).
+
+_COMMENT_MARKS: Final[Dict[str, str]] = {value: key for key, value in COMMENTS.items()}
+_WORD_TOKENS: Final[Dict[str, str]] = {
+    **{base_type: "BASETYPE" for base_type in BASE_TYPES},
+    "true": "BOOL",
+    "false": "BOOL",
+    **KEYWORDS,
+}
+# Characters only ending a name if they start a double mark, e.g. "&" in "&&"
+_DOUBLE_MARK_STARTS: Final[Dict[str, str]] = {
+    mark[0]: "".join(sorted(other[1] for other in DOUBLE_MARKS if other[0] == mark[0]))
+    for mark in DOUBLE_MARKS
+    if mark[0] not in MARKS
+}
+_SPECIAL_CHARACTERS: Final[str] = "".join(
+    re.escape(character)
+    for character in sorted(
+        set(SEPARATORS) | set(MARKS) | set(_DOUBLE_MARK_STARTS) | {'"', "'"}
+    )
+)
+_WORD: Final[str] = (
+    f"(?:[^{_SPECIAL_CHARACTERS}]"
+    + "".join(
+        f"|{re.escape(start)}(?![{re.escape(ends)}])"
+        for start, ends in _DOUBLE_MARK_STARTS.items()
+    )
+    + ")+"
+)
+_SEPARATORS: Final[str] = "".join(
+    re.escape(separator) for separator in SEPARATORS if separator != "\n"
+)
+_DOUBLE_MARKS: Final[str] = "|".join(re.escape(mark) for mark in DOUBLE_MARKS)
+_MARKS: Final[str] = "".join(re.escape(mark) for mark in MARKS)
+_COMMENT: Final[str] = re.escape(_COMMENT_MARKS["COMMENT"])
+_COMMENT_OPEN: Final[str] = re.escape(_COMMENT_MARKS["COMMENT_OPEN"])
+_COMMENT_CLOSE: Final[str] = re.escape(_COMMENT_MARKS["COMMENT_CLOSE"])
+
+_TABLE_PATTERN: Final[re.Pattern] = re.compile(
+    f"(?P<WORD>{_WORD})"
+    f"|(?P<SEPARATOR>[{_SEPARATORS}]+)"
+    r"|(?P<NEWLINE>\n)"
+    r"|(?P<STRING>[\"'][^\"'/\n]*[\"'])"
+    r"|(?P<QUOTE>[\"'])"
+    f"|(?P<COMMENT>{_COMMENT})"
+    f"|(?P<COMMENT_OPEN>{_COMMENT_OPEN})"
+    f"|(?P<DOUBLE_MARK>{_DOUBLE_MARKS})"
+    f"|(?P<MARK>[{_MARKS}])"
+)
+_STRING_PATTERN: Final[re.Pattern] = re.compile(
+    r"(?P<WORD>[^\"'/\n]+|/(?![/*]))"
+    r"|(?P<NEWLINE>\n)"
+    r"|(?P<QUOTE>[\"'])"
+    f"|(?P<COMMENT>{_COMMENT})"
+    f"|(?P<COMMENT_OPEN>{_COMMENT_OPEN})"
+)
+_COMMENT_END_PATTERN: Final[re.Pattern] = re.compile(f"{_COMMENT}|{_COMMENT_CLOSE}")
+_INTEGER_PATTERN: Final[re.Pattern] = re.compile("-?[0-9]*")
+# Characters, which can have a different meaning depending on the next character
+_LOOKAHEAD_CHARACTERS: Final[str] = "".join(
+    sorted(
+        {mark[0] for mark in DOUBLE_MARKS}
+        | {mark[0] for mark in COMMENTS}
+        | {mark[-1] for mark in COMMENTS}
+    )
+)
+
+# Modes of the table lexer
+_CODE: Final[int] = 0
+_LINE_COMMENT: Final[int] = 1
+_MULTILINE_COMMENT: Final[int] = 2
+_NESTED_LINE_COMMENT: Final[int] = 3  # Single line comment in a multiline comment
+_COMMENT_END: Final[int] = 4  # At the "/" ending a multiline comment
+
+DEFAULT_CHUNK_SIZE: Final[int] = 65536
+
+# Token type, value, start offset and end offset. Values are bytes when lexing bytes.
+_RawToken = Tuple[str, Union[str, bytes], int, int]
+
+
+@dataclasses.dataclass(frozen=True)
+class _Syntax:  # pylint: disable=R0902
+    """
+    Represents the patterns and marks of the table lexer for one type of text.
+    """
+
+    table: re.Pattern
+    string: re.Pattern
+    comment_end: re.Pattern
+    integer: re.Pattern
+    words: Dict
+    marks: Dict
+    empty: Union[str, bytes]
+    newline: Union[str, bytes]
+    space: Union[str, bytes]
+    dot: Union[str, bytes]
+    underscore: Union[str, bytes]
+    digits: Union[str, bytes]
+    comment: Union[str, bytes]
+    comment_open: Union[str, bytes]
+    lookahead: Union[str, bytes]
+
+    def encode(self) -> "_Syntax":
+        """Returns the same syntax for UTF-8 encoded bytes.
+
+        Returns:
+            _Syntax: Syntax matching bytes instead of strings.
+        """
+
+        fields = {}
+
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+
+            if isinstance(value, re.Pattern):
+                fields[field.name] = re.compile(value.pattern.encode())
+            elif isinstance(value, dict):
+                fields[field.name] = {key.encode(): item for key, item in value.items()}
+            else:
+                fields[field.name] = value.encode()
+
+        return _Syntax(**fields)
+
+
+_TEXT_SYNTAX: Final[_Syntax] = _Syntax(
+    table=_TABLE_PATTERN,
+    string=_STRING_PATTERN,
+    comment_end=_COMMENT_END_PATTERN,
+    integer=_INTEGER_PATTERN,
+    words=_WORD_TOKENS,
+    marks={**MARKS, **DOUBLE_MARKS},
+    empty="",
+    newline="\n",
+    space=" ",
+    dot=".",
+    underscore="_",
+    digits="".join(DIGITS_AS_STRINGS),
+    comment=_COMMENT_MARKS["COMMENT"],
+    comment_open=_COMMENT_MARKS["COMMENT_OPEN"],
+    lookahead=_LOOKAHEAD_CHARACTERS,
+)
+# Bytes never match a mark, so every non-ASCII UTF-8 sequence is part of a word
+_BYTES_SYNTAX: Final[_Syntax] = _TEXT_SYNTAX.encode()
+
+
+def _word_type(
+    word: Union[str, bytes],
+    syntax: _Syntax = _TEXT_SYNTAX,
+) -> Optional[str]:
+    """Returns the token type of a word, the same way gettoken does.
+
+    Args:
+        word (Union[str, bytes]): Word to get the token type for.
+        syntax (_Syntax): Syntax matching the type of the word.
+
+    Returns:
+        Optional[str]: Token type of the word, None if the word is not a valid token.
+    """
+
+    token_type = syntax.words.get(word)
+
+    if token_type is None:
+        if len(word) > 1 and word[:1] == syntax.underscore:
+            return "BUILTIN_CONST"
+
+        stripped = word.replace(syntax.space, syntax.empty)  # type: ignore[arg-type]
+
+        if not stripped:
+            return None
+        if syntax.integer.fullmatch(stripped):
+            return "INT"
+        if word[:1] not in syntax.digits:  # type: ignore[operator]
+            return "NAME"
+
+    return token_type
+
+
+def _fuse_floats(
+    tokens: Iterable[_RawToken],
+    dot: Union[str, bytes] = ".",
+) -> Iterator[_RawToken]:
+    """Joins "INT", "DOT", "INT" token sequences to float tokens.
+
+    Args:
+        tokens (Iterable[_RawToken]): Tokens to join.
+        dot (Union[str, bytes]): Dot matching the type of the values.
+
+    Yields:
+        _RawToken: Tokens with joined floats.
+    """
+
+    window: List[_RawToken] = []  # The last two tokens, which can still be joined
+    fused: Optional[_RawToken] = None
+
+    for token in tokens:
+        if (
+            token[0] == "INT"
+            and len(window) == 2
+            and window[1][0] == "DOT"
+            and window[0] is not fused
+        ):
+            value = window[0][1] + dot + token[1]  # type: ignore[operator]
+            fused = ("FLOAT", value, window[0][2], token[3])
+            window = [fused]
+            continue
+
+        window.append(token)
+        if len(window) > 2:
+            yield window.pop(0)
+
+    yield from window
+
+
+def _unrecognized(word: Union[str, bytes], offset: int) -> Diagnostic:
+    """Returns the diagnostic of a word, which is not a valid token.
+
+    Args:
+        word (Union[str, bytes]): Word, which is not a valid token.
+        offset (int): Offset of the word.
+
+    Returns:
+        Diagnostic: Diagnostic of the word.
+    """
+
+    if isinstance(word, bytes):
+        word = word.decode(errors="replace")
+
+    return Diagnostic("UNRECOGNIZED_PATTERN", f"Unrecognized Pattern: {word!r}", offset)
+
+
+def _scan_table(  # pylint: disable=R0912, R0913, R0914, R0915
+    chunks: Iterable,
+    start_position: int = 0,
+    syntax: _Syntax = _TEXT_SYNTAX,
+    diagnostics: Optional[List[Diagnostic]] = None,
+) -> Iterator[_RawToken]:
+    """Scans text chunks with the table lexer, without joining floats.
+
+    Only slices and methods shared by str, bytes and mmap are used, so bytes-like
+    chunks are scanned without decoding or copying them.
+
+    Args:
+        chunks (Iterable): Chunks of the text to lex.
+        start_position (int): Position in the first chunk to start scanning at.
+        syntax (_Syntax): Syntax matching the type of the chunks.
+        diagnostics (Optional[List[Diagnostic]]): List to add problems to. Invalid
+                                                  words are skipped either way.
+
+    Yields:
+        _RawToken: Scanned tokens.
+    """
+
+    empty = syntax.empty
+    lookahead = syntax.lookahead
+    buffer: List = []
+    buffer_start: int = 0  # Offset of the first character in the buffer
+    buffer_end: int = 0  # Offset after the last character in the buffer
+    string_start: int = 0  # Offset of the current string
+    comment_start: int = 0  # Offset of the current multiline comment
+    in_string: bool = False
+    mode: int = _CODE
+    carry = empty  # Unprocessed end of the last chunk
+    base: int = 0  # Offset of the first character of the current text
+    final: bool = False
+    chunk_iterator = iter(chunks)
+
+    while not final:
+        chunk = next(chunk_iterator, None)
+        final = chunk is None
+        if chunk is None:
+            text = carry
+        else:
+            text = carry + chunk if carry else chunk
+        position = start_position
+        start_position = 0
+        length = len(text)
+
+        while position < length:
+            if mode == _CODE:
+                match = (syntax.string if in_string else syntax.table).match(
+                    text, position
+                )
+                kind = match.lastgroup  # type: ignore[union-attr]
+                value = match.group()  # type: ignore[union-attr]
+                start = base + position
+
+                if (
+                    not final
+                    and match.end() == length  # type: ignore[union-attr]
+                    and kind in ("WORD", "MARK")
+                    and value[-1:] in lookahead
+                ):
+                    # The next chunk can change the meaning of the last character
+                    if len(value) > 1:
+                        if not buffer:
+                            buffer_start = start
+                        buffer.append(value[:-1])
+                        position = length - 1
+                        buffer_end = base + position
+                    break
+
+                position = match.end()  # type: ignore[union-attr]
+
+                if kind == "WORD":
+                    if not buffer:
+                        buffer_start = start
+                    buffer.append(value)
+                    buffer_end = base + position
+                    continue
+
+                if kind == "QUOTE":
+                    if in_string:
+                        value = empty.join(buffer)
+                        yield "STRING", value, string_start, base + position
+                        buffer.clear()
+                    else:
+                        string_start = buffer_start if buffer else start
+                    in_string = not in_string
+                    continue
+
+                if kind == "STRING":
+                    if not buffer:
+                        buffer_start = start
+                    buffer.append(value[1:-1])
+                    yield "STRING", empty.join(buffer), buffer_start, base + position
+                    buffer.clear()
+                    continue
+
+                if kind == "NEWLINE" and in_string:
+                    if not buffer:
+                        buffer_start = start
+                    buffer.append(value)
+                    buffer_end = base + position
+                    yield "NEWLINE", value, start, base + position
+                    continue
+
+                if kind == "COMMENT":
+                    mode = _LINE_COMMENT
+                    continue
+
+                if kind == "COMMENT_OPEN":
+                    # "/*/" is a complete comment, so the search starts at the "*"
+                    mode = _MULTILINE_COMMENT
+                    comment_start = start
+                    position -= 1
+                    continue
+
+                if buffer:
+                    word = empty.join(buffer)
+                    word_type = _word_type(word, syntax)
+                    if word_type is not None:
+                        yield word_type, word, buffer_start, buffer_end
+                    elif diagnostics is not None:
+                        diagnostics.append(_unrecognized(word, buffer_start))
+                    buffer.clear()
+
+                if kind == "NEWLINE":
+                    yield "NEWLINE", value, start, base + position
+                elif kind in ("DOUBLE_MARK", "MARK"):
+                    yield syntax.marks[value], value, start, base + position
+
+            elif mode in (_LINE_COMMENT, _NESTED_LINE_COMMENT):
+                newline = text.find(syntax.newline, position)
+                if newline == -1:
+                    position = length
+                    break
+
+                position = newline
+                mode = _CODE if mode == _LINE_COMMENT else _MULTILINE_COMMENT
+
+            elif mode == _MULTILINE_COMMENT:
+                match = syntax.comment_end.search(text, position)
+                if match is None:
+                    # A "*" or "/" at the end can start "*/" or "//" with the next chunk
+                    position = (
+                        length - 1
+                        if not final and text[-1:] in lookahead
+                        else length
+                    )
+                    break
+
+                if match.group() == syntax.comment:
+                    # Single line comments hide the end of the multiline comment
+                    mode = _NESTED_LINE_COMMENT
+                    position = match.end()
+                else:
+                    mode = _COMMENT_END
+                    position = match.end() - 1
+
+            else:
+                # The "/" ending a multiline comment can start the next comment
+                if not final and position + 1 == length:
+                    break
+
+                if text[position : position + 2] == syntax.comment:
+                    mode = _LINE_COMMENT
+                    position += 2
+                elif text[position : position + 2] == syntax.comment_open:
+                    mode = _MULTILINE_COMMENT
+                    comment_start = base + position
+                    position += 1
+                else:
+                    mode = _CODE
+                    position += 1
+
+        carry = text[position:]
+        base += position
+
+    if diagnostics is not None and in_string:
+        diagnostics.append(
+            Diagnostic("UNCLOSED_STRING", "Unclosed string", string_start)
+        )
+
+    if buffer:
+        word = empty.join(buffer)
+        word_type = _word_type(word, syntax)
+        if word_type is not None:
+            yield word_type, word, buffer_start, buffer_end
+        elif diagnostics is not None:
+            diagnostics.append(_unrecognized(word, buffer_start))
+
+    if diagnostics is not None and mode in (_MULTILINE_COMMENT, _NESTED_LINE_COMMENT):
+        diagnostics.append(
+            Diagnostic("UNCLOSED_COMMENT", "Unclosed multiline comment", comment_start)
+        )
+
+
+def _iter_table(
+    chunks: Iterable,
+    start_position: int = 0,
+    syntax: _Syntax = _TEXT_SYNTAX,
+    diagnostics: Optional[List[Diagnostic]] = None,
+) -> Iterator[_RawToken]:
+    """Lexes text chunks with the table lexer.
+
+    Args:
+        chunks (Iterable): Chunks of the text to lex.
+        start_position (int): Position in the first chunk to start lexing at. A
+                              newline at the start is only removed at position 0.
+        syntax (_Syntax): Syntax matching the type of the chunks.
+        diagnostics (Optional[List[Diagnostic]]): List to add problems to.
+
+    Yields:
+        _RawToken: Lexed tokens.
+    """
+
+    tokens = _scan_table(chunks, start_position, syntax, diagnostics)
+
+    if start_position == 0:
+        first = next(tokens, None)
+
+        if first is None:
+            return
+        if first[0] != "NEWLINE":
+            tokens = itertools.chain((first,), tokens)
+
+    yield from _fuse_floats(tokens, syntax.dot)
+
+
+######################
+# INCREMENTAL LEXING #
+######################
+
+
+@dataclasses.dataclass
+class TokenEdit:
+    """
+    Represents the result of re-lexing an edited source.
+
+    The tokens old_buffer[start:old_end] were replaced by buffer[start:new_end].
+    """
+
+    buffer: TokenBuffer
+    start: int
+    old_end: int
+    new_end: int
+
+
+def relex(  # pylint: disable=R0914
+    buffer: TokenBuffer,
+    offset: int,
+    removed: int,
+    inserted: str,
+) -> TokenEdit:
+    """Re-lexes the part of a token buffer changed by an edit.
+
+    Lexing restarts at a token boundary before the edit, which is outside of any
+    string or comment, and stops as soon as the new tokens match the old ones again.
+
+    Args:
+        buffer (TokenBuffer): Tokens of the source before the edit.
+        offset (int): Offset of the edit in the old source.
+        removed (int): Number of characters removed at the offset.
+        inserted (str): Text inserted at the offset.
+
+    Returns:
+        TokenEdit: Tokens of the edited source and the changed token range.
+
+    Raises:
+        ValueError: If the tokens are lexed from bytes, e.g. by lex_file.
+    """
+
+    if buffer.encoded:
+        raise ValueError("Token buffers of bytes can not be re-lexed")
+
+    source = buffer.source[:offset] + inserted + buffer.source[offset + removed :]
+    delta = len(inserted) - removed
+    edit_end = offset + len(inserted)  # End of the edit in the new source
+    newline = TOKEN_KINDS["NEWLINE"]
+
+    # Names can continue after a comment and floats join three tokens, so lexing
+    # restarts a few tokens earlier. Newlines in strings come before the string.
+    restart = bisect.bisect_left(buffer.ends, offset) - 3
+    while restart > 0 and (
+        buffer.kinds[restart] == newline
+        or buffer.starts[restart - 1] >= buffer.starts[restart]
+    ):
+        restart -= 1
+    restart = max(restart, 0)
+
+    tokens: List[_RawToken] = []
+    old_index = restart
+    matched = 0  # Number of new tokens in a row matching old tokens after the edit
+    old_end = len(buffer)
+
+    for token in _iter_table((source,), buffer.starts[restart] if restart else 0):
+        tokens.append(token)
+        token_type, value, start, end = token
+
+        while old_index < len(buffer) and buffer.ends[old_index] + delta < end:
+            old_index += 1
+
+        if (
+            start >= edit_end
+            and old_index < len(buffer)
+            and buffer.starts[old_index] + delta == start
+            and buffer.ends[old_index] + delta == end
+            and buffer.kinds[old_index] == TOKEN_KINDS[token_type]
+            and buffer.value(old_index) == value
+            and (matched or buffer.kinds[old_index] != newline)
+        ):
+            matched += 1
+            old_index += 1
+        else:
+            matched = 0
+
+        if matched == 3:
+            old_end = old_index - 3
+            del tokens[-3:]
+            break
+
+    # Tokens before the edit are lexed again the same way
+    unchanged = 0
+    while (
+        unchanged < len(tokens)
+        and restart + unchanged < old_end
+        and buffer.ends[restart + unchanged] <= offset
+        and tokens[unchanged][2] == buffer.starts[restart + unchanged]
+        and tokens[unchanged][3] == buffer.ends[restart + unchanged]
+        and TOKEN_KINDS[tokens[unchanged][0]] == buffer.kinds[restart + unchanged]
+        and tokens[unchanged][1] == buffer.value(restart + unchanged)
+    ):
+        unchanged += 1
+
+    result = TokenBuffer(source)
+    result.kinds = buffer.kinds[:restart]
+    result.starts = buffer.starts[:restart]
+    result.ends = buffer.ends[:restart]
+    result.values = {
+        index: value for index, value in buffer.values.items() if index < restart
+    }
+
+    for token in tokens:
+        result.append(*token)
+
+    new_end = len(result)
+    result.kinds.extend(buffer.kinds[old_end:])
+    result.starts.extend(map(delta.__add__, buffer.starts[old_end:]))
+    result.ends.extend(map(delta.__add__, buffer.ends[old_end:]))
+    result.values.update(
+        (index - old_end + new_end, value)
+        for index, value in buffer.values.items()
+        if index >= old_end
+    )
+
+    return TokenEdit(result, restart + unchanged, old_end, new_end)
+
+
 ##############
 # MAIN LEXER #
 ##############
 
 
-def lex(  # pylint: disable=R0912, R0915, R1260
+def lex(
     text: str,
-) -> List[Optional[LexerToken]]:
+    legacy: bool = False,
+    compact: bool = False,
+    recover: bool = False,
+) -> Union[List[Optional[LexerToken]], TokenBuffer, LexResult]:
     """Lexes the specified string.
 
+    Args:
+         text (str): Text to lex.
+         legacy (bool): Use the legacy lexer, which looks at every character on its
+                        own. It is a lot slower and does not keep the order of
+                        several floats.
+         compact (bool): Return the tokens as a token buffer instead of a list.
+         recover (bool): Return a lex result, which also contains all problems
+                         found while lexing. Lexing continues after every problem,
+                         so the tokens are the same as without recovering.
+
+    Returns:
+        Union[List[Optional[LexerToken]], TokenBuffer, LexResult]: Lexed tokens.
+
+    Raises:
+        ValueError: If the legacy lexer should create a token buffer or recover.
+    """
+
+    if legacy:
+        if compact:
+            raise ValueError("The legacy lexer can not create token buffers")
+        if recover:
+            raise ValueError("The legacy lexer can not recover from errors")
+
+        return _lex_legacy(text)
+
+    diagnostics: Optional[List[Diagnostic]] = [] if recover else None
+    tokens = _iter_table((text,), diagnostics=diagnostics)
+    result: Union[List[Optional[LexerToken]], TokenBuffer]
+
+    if compact:
+        result = TokenBuffer(text)
+        for token in tokens:
+            result.append(*token)
+    else:
+        result = [
+            LexerToken(token_type, value, start) for token_type, value, start, _ in tokens
+        ]
+
+    if diagnostics is None:
+        return result
+
+    return LexResult(result, diagnostics, text)
+
+
+def iter_lex(
+    stream: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    diagnostics: Optional[List[Diagnostic]] = None,
+) -> Iterator[LexerToken]:
+    """Lexes the specified text stream lazily.
+
+    The stream is read in chunks, so only the current chunk and the token being
+    built have to be kept in memory. Tokens, strings and comments can span chunks.
+
+    Args:
+         stream (TextIO): Stream to read the text from.
+         chunk_size (int): Number of characters to read at once.
+         diagnostics (Optional[List[Diagnostic]]): List to add all problems found
+                                                   while lexing to, lexing continues
+                                                   after every problem.
+
+    Yields:
+        LexerToken: Lexed tokens.
+    """
+
+    for token_type, value, start, _ in _iter_table(
+        iter(lambda: stream.read(chunk_size), ""), diagnostics=diagnostics
+    ):
+        yield LexerToken(token_type, value, start)
+
+
+def map_file(path: Union[str, os.PathLike]) -> Union[bytes, mmap.mmap]:
+    """Maps a file into memory read-only.
+
+    Args:
+         path (Union[str, os.PathLike]): Path of the file to map.
+
+    Returns:
+        Union[bytes, mmap.mmap]: Contents of the file, empty bytes for empty files.
+    """
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:  # Empty files can not be mapped
+            return b""
+
+        # The mapping stays valid after the file is closed
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def lex_bytes(
+    source: Union[bytes, mmap.mmap],
+    diagnostics: Optional[List[Diagnostic]] = None,
+) -> TokenBuffer:
+    """Lexes UTF-8 encoded bytes without decoding them.
+
+    The bytes are scanned directly, so comments and whitespace are only skipped by
+    offset and never copied. Only values of tokens, which are not a slice of the
+    source, are decoded while lexing; all other values are decoded from the source
+    when they are accessed.
+
+    Args:
+         source (Union[bytes, mmap.mmap]): Source to lex.
+         diagnostics (Optional[List[Diagnostic]]): List to add all problems found
+                                                   while lexing to, lexing continues
+                                                   after every problem.
+
+    Returns:
+        TokenBuffer: Lexed tokens. Offsets are byte offsets into the source.
+    """
+
+    buffer = TokenBuffer(source)
+    for token in _iter_table((source,), 0, _BYTES_SYNTAX, diagnostics):
+        buffer.append(*token)
+
+    return buffer
+
+
+def lex_file(path: Union[str, os.PathLike]) -> TokenBuffer:
+    """Lexes a UTF-8 encoded file without reading it into memory.
+
+    The file is memory-mapped and lexed with lex_bytes.
+
+    Args:
+         path (Union[str, os.PathLike]): Path of the file to lex.
+
+    Returns:
+        TokenBuffer: Lexed tokens. Offsets are byte offsets into the file.
+    """
+
+    return lex_bytes(map_file(path))
+
+
+def _lex_legacy(  # pylint: disable=R0912, R0915, R1260
+    text: str,
+) -> List[Optional[LexerToken]]:
+    """Lexes the specified string character by character.
+
     Args:
          text (str): Text to lex.
 
@@ -402,6 +1473,7 @@ if __name__ == "__main__":  # pylint: disable=R1260
         "types": False,
         "values": False,
         "no-split": False,
+        "legacy": False,
     }
 
     if len(sys.argv[1:]) > 0:
@@ -409,6 +1481,7 @@ if __name__ == "__main__":  # pylint: disable=R1260
             if argument.lower() in ["-h", "--help"]:
                 print(
                     "Usage: lexer.py [PATH] [-h] [-v] [--types] [--values] [--no-split]"
+                    " [--legacy]"
                 )
                 print("Lexer of the I-programming language.")
                 print("Options:")
@@ -419,6 +1492,7 @@ if __name__ == "__main__":  # pylint: disable=R1260
                 print("    --types                Only print the types of the tokens.")
                 print("    --values               Only print the values of the tokens.")
                 print("    --no-split             Prints the tokens in a list.")
+                print("    --legacy               Uses the legacy lexer.")
                 sys.exit(0)
 
             elif argument.lower() in ["-v", "--version"]:
@@ -434,6 +1508,9 @@ if __name__ == "__main__":  # pylint: disable=R1260
             elif argument.lower() == "--no-split":
                 options["no-split"] = True
 
+            elif argument.lower() == "--legacy":
+                options["legacy"] = True
+
             else:
                 print(
                     f"Error: Invalid argument: {argument!r}"
@@ -449,11 +1526,13 @@ if __name__ == "__main__":  # pylint: disable=R1260
         // Code goes here
         """
 
+    TOKENS = lex(DATA, options["legacy"])
+
     if options["types"] and not options["values"]:
-        RESULT = [str(token.type) for token in lex(DATA)]  # type: ignore[union-attr]
+        RESULT = [str(token.type) for token in TOKENS]  # type: ignore[union-attr]
     elif options["values"] and not options["types"]:
-        RESULT = [str(token.value) for token in lex(DATA)]  # type: ignore[union-attr]
+        RESULT = [str(token.value) for token in TOKENS]  # type: ignore[union-attr]
     else:
-        RESULT = [str(token) for token in lex(DATA)]
+        RESULT = [str(token) for token in TOKENS]
 
     print(RESULT if options["no-split"] else "\n".join(RESULT))
@@ -0,0 +1,738 @@
+"""
+I Language optimizer.
+Version: 0.1.3
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import collections
+import dataclasses
+import math
+import operator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+from . import _ast as ast
+from . import _errors, lexer
+from .visitor import NodeTransformer, NodeVisitor, walk
+
+
+#############
+# CONSTANTS #
+#############
+
+# Range of the int type
+INT_MIN: Final[int] = -(2**63)
+INT_MAX: Final[int] = 2**63 - 1
+
+# Python values of literals by type
+CONVERTERS: Final[Dict[str, Callable[[str], Any]]] = {
+    "bool": lambda text: text == "true",
+    "float": float,
+    "hex": lambda text: int(text, 16),
+    "int": int,
+    "null": lambda text: None,
+    "string": str,
+}
+NUMBER_TYPES: Final[Tuple[str, ...]] = ("int", "float", "hex")
+INTEGER_TYPES: Final[Tuple[str, ...]] = ("int", "hex")
+
+COMPARISONS: Final[Dict[str, Callable[[Any, Any], bool]]] = {
+    "EQUAL": operator.eq,
+    "NOT_EQUAL": operator.ne,
+    "LESS": operator.lt,
+    "LESS_EQUAL": operator.le,
+    "GREATER": operator.gt,
+    "GREATER_EQUAL": operator.ge,
+}
+ORDERED_TYPES: Final[Tuple[str, ...]] = NUMBER_TYPES + ("string",)
+
+# Statements after which the rest of a block is never executed
+TERMINATORS: Final[Tuple[type, ...]] = (ast.Return, ast.Break, ast.Continue, ast.Throw)
+# Nodes, which can be evaluated without side effects
+PURE_NODES: Final[Tuple[type, ...]] = (ast.StaticValue, ast.StaticList, ast.Reference)
+
+Declaration = Union[ast.DefineVariable, ast.Variable, ast.Constant]
+
+
+###########
+# HELPERS #
+###########
+
+
+class _DivisionByZero(Exception):
+    """
+    Raised by operations dividing by zero.
+    """
+
+
+def _divide(left: Any, right: Any) -> Any:
+    """Divides two numbers, integers are truncated towards zero.
+
+    Args:
+        left (Any): Dividend.
+        right (Any): Divisor.
+
+    Returns:
+        Any: Quotient.
+
+    Raises:
+        _DivisionByZero: If the divisor is zero.
+    """
+
+    if not right:
+        raise _DivisionByZero
+    if isinstance(left, int) and isinstance(right, int):
+        quotient = abs(left) // abs(right)
+        return quotient if (left < 0) == (right < 0) else -quotient
+
+    return left / right
+
+
+def _modulo(left: Any, right: Any) -> Any:
+    """Returns the remainder of a division, which has the sign of the dividend.
+
+    Args:
+        left (Any): Dividend.
+        right (Any): Divisor.
+
+    Returns:
+        Any: Remainder.
+
+    Raises:
+        _DivisionByZero: If the divisor is zero.
+    """
+
+    if not right:
+        raise _DivisionByZero
+    if isinstance(left, int) and isinstance(right, int):
+        return left - right * _divide(left, right)
+
+    return math.fmod(left, right)
+
+
+ARITHMETIC: Final[Dict[str, Callable[[Any, Any], Any]]] = {
+    "PLUS": operator.add,
+    "MINUS": operator.sub,
+    "MULTIPLY": operator.mul,
+    "DIVIDE": _divide,
+    "MODULO": _modulo,
+}
+
+
+def literal_value(node: ast.StaticValue) -> Any:
+    """Returns the Python value of a literal, converting it only once.
+
+    Args:
+        node (ast.StaticValue): Literal value node.
+
+    Returns:
+        Any: Python value of the literal.
+    """
+
+    try:
+        return node.constant  # type: ignore[attr-defined]
+    except AttributeError:
+        node.constant = CONVERTERS[node.type](node.value)  # type: ignore
+        return node.constant  # type: ignore[attr-defined]
+
+
+def _literal(_type: str, value: Any, level: int) -> ast.StaticValue:
+    """Creates the literal value node of a Python value.
+
+    Args:
+        _type (str): Type of the literal.
+        value (Any): Python value.
+        level (int): Block level of the node.
+
+    Returns:
+        ast.StaticValue: Literal value node with the converted value.
+    """
+
+    if _type == "bool":
+        text = "true" if value else "false"
+    elif _type == "float":
+        text = repr(value)
+    elif _type == "hex":
+        text = hex(value)
+    else:
+        text = str(value)
+
+    node = ast.StaticValue(_type, text, level)
+    node.constant = value  # type: ignore[attr-defined]
+
+    return node
+
+
+def _count(node: Optional[ast.Node]) -> int:
+    """Returns the number of nodes in a tree.
+
+    Args:
+        node (Optional[ast.Node]): Root of the tree.
+
+    Returns:
+        int: Number of nodes.
+    """
+
+    return sum(1 for _ in walk(node))
+
+
+def _declared_value(declaration: Declaration) -> Optional[ast.Node]:
+    """Returns the value node of a declaration.
+
+    Args:
+        declaration (Declaration): Declaration node.
+
+    Returns:
+        Optional[ast.Node]: Value node, None if the value is no node.
+    """
+
+    return declaration.value if isinstance(declaration.value, ast.Node) else None
+
+
+def _result_type(name: str, left: str, right: str) -> Optional[str]:
+    """Returns the type of the result of a binary operation on literals.
+
+    Args:
+        name (str): Token type of the operator.
+        left (str): Type of the left operand.
+        right (str): Type of the right operand.
+
+    Returns:
+        Optional[str]: Type of the result, None if it can not be computed at compile
+                       time.
+    """
+
+    numbers = left in NUMBER_TYPES and right in NUMBER_TYPES
+    if numbers and left != right and "float" not in (left, right):
+        return None  # Integers and hex numbers are only mixed dynamically
+
+    if name in ("AND", "OR"):
+        return "bool" if left == right == "bool" else None
+    if name in ("EQUAL", "NOT_EQUAL"):
+        return "bool" if left == right or numbers else None
+    if name in COMPARISONS:
+        return "bool" if numbers or left == right == "string" else None
+    if name == "PLUS" and left == right == "string":
+        return "string"
+    if numbers:
+        return "float" if "float" in (left, right) else left
+
+    return None
+
+
+##########
+# PASSES #
+##########
+
+
+class ConstantFolder(NodeTransformer):
+    """
+    Evaluates operations on literals at compile time.
+
+    Operations on literals are replaced by their result and references to
+    constants with literal values by the value. Constants are only known in the
+    block they are defined in. Numbers follow the semantics of the language: ints
+    are 64 bit and divisions of them are truncated towards zero. Operations
+    dividing by zero or with results out of the range of their type are kept,
+    their errors are only reported by report, so code which is never executed
+    does not stop the compilation.
+    """
+
+    def __init__(self, lines: Optional[lexer.LineIndex] = None) -> None:
+        """Initializes a constant folder.
+
+        Args:
+            lines (Optional[lexer.LineIndex]): Lines of the source, to report the
+                                               columns of errors.
+        """
+
+        self.lines = lines
+        self.line = 0  # Line of the current statement
+        self.constants: Dict[str, ast.StaticValue] = {}
+        self.folded = 0  # Number of replaced nodes
+        # Operations failing at runtime with the error and its arguments
+        self.failures: List[Tuple[ast.Node, Callable[..., Any], Tuple[Any, ...]]] = []
+        self._scopes: List[Dict[str, ast.StaticValue]] = []  # Constants of blocks
+
+    def _position(self, node: ast.Node) -> Tuple[int, int]:
+        """Returns the line and column of an operation.
+
+        Args:
+            node (ast.Node): Operation node.
+
+        Returns:
+            Tuple[int, int]: Line and column, both starting at 1. The column is 0
+                             if it is not known.
+        """
+
+        offset = getattr(node, "offset", -1)
+        if self.lines is not None and offset >= 0:
+            return self.lines.position(offset)
+
+        return self.line + 1, 0
+
+    def _fail(
+        self, node: ast.Node, error: Callable[..., Any], *arguments: Any
+    ) -> ast.Node:
+        """Remembers the error of an operation, which fails at runtime.
+
+        Args:
+            node (ast.Node): Operation node.
+            error (Callable[..., Any]): Error to report.
+            *arguments (Any): Arguments of the error.
+
+        Returns:
+            ast.Node: The operation node, which is kept.
+        """
+
+        self.failures.append((node, error, arguments))
+
+        return node
+
+    def _checked(self, node: ast.Node, _type: str, value: Any) -> ast.Node:
+        """Returns the result of an operation, if it fits into its type.
+
+        Args:
+            node (ast.Node): Operation node.
+            _type (str): Type of the result.
+            value (Any): Python value of the result.
+
+        Returns:
+            ast.Node: Literal value node of the result, the operation node if the
+                      result does not fit.
+        """
+
+        if (_type in INTEGER_TYPES and not INT_MIN <= value <= INT_MAX) or (
+            _type == "float" and not math.isfinite(value)
+        ):
+            return self._fail(
+                node, _errors.NumberOverflow, *self._position(node), _type
+            )
+
+        self.folded += 1
+
+        return _literal(_type, value, node.level)
+
+    def visit_Node(self, node: ast.Node) -> None:  # pylint: disable=C0103
+        """Remembers the line of statements."""
+
+        if node.line:
+            self.line = node.line
+
+    def report(self, tree: Optional[ast.Node]) -> None:
+        """Reports the first error of an operation, which is still in a tree.
+
+        Args:
+            tree (Optional[ast.Node]): Folded tree, after removing its dead code.
+        """
+
+        if not self.failures:
+            return
+
+        reachable = {id(node) for node in walk(tree)}
+
+        for node, error, arguments in self.failures:
+            if id(node) in reachable:
+                error(*arguments)
+
+    def visit_Block(self, node: ast.Block) -> None:  # pylint: disable=C0103
+        """Enters the scope of a block."""
+
+        self.visit_Node(node)
+        self._scopes.append(dict(self.constants))
+
+    def leave_Block(self, node: ast.Block) -> ast.Block:  # pylint: disable=C0103
+        """Forgets the constants of a block."""
+
+        self.constants = self._scopes.pop()
+
+        return node
+
+    def leave_Constant(  # pylint: disable=C0103
+        self, node: ast.Constant
+    ) -> ast.Constant:
+        """Remembers constants with literal values."""
+
+        if isinstance(node.value, ast.StaticValue):
+            self.constants[node.name] = node.value
+        else:
+            self.constants.pop(node.name, None)
+
+        return node
+
+    def leave_DefineVariable(  # pylint: disable=C0103
+        self, node: ast.Node
+    ) -> ast.Node:
+        """Forgets constants shadowed by a variable."""
+
+        self.constants.pop(node.name, None)
+
+        return node
+
+    leave_Variable = leave_DefineVariable
+
+    def leave_Reference(self, node: ast.Reference) -> ast.Node:  # pylint: disable=C0103
+        """Replaces references to constants by their value."""
+
+        value = self.constants.get(node.name)
+        if value is None:
+            return node
+
+        self.folded += 1
+
+        return _literal(value.type, literal_value(value), node.level)
+
+    def leave_UnaryOperation(  # pylint: disable=C0103
+        self, node: ast.UnaryOperation
+    ) -> ast.Node:
+        """Evaluates unary operations on literals."""
+
+        operand = node.operand
+        if not isinstance(operand, ast.StaticValue):
+            return node
+
+        value = literal_value(operand)
+        if node.operator == "NOT" and operand.type == "bool":
+            return self._checked(node, "bool", not value)
+        if node.operator in ("MINUS", "PLUS") and operand.type in NUMBER_TYPES:
+            return self._checked(
+                node, operand.type, -value if node.operator == "MINUS" else value
+            )
+
+        return node
+
+    def leave_BinaryOperation(  # pylint: disable=C0103
+        self, node: ast.BinaryOperation
+    ) -> ast.Node:
+        """Evaluates binary operations on literals."""
+
+        left, right = node.left, node.right
+        if not (
+            isinstance(left, ast.StaticValue) and isinstance(right, ast.StaticValue)
+        ):
+            return node
+
+        _type = _result_type(node.operator, left.type, right.type)
+        if _type is None or (
+            _type == "string" and left.value.endswith("\\")  # Would escape the quote
+        ):
+            return node
+
+        left_value, right_value = literal_value(left), literal_value(right)
+
+        if node.operator == "AND":
+            return self._checked(node, _type, left_value and right_value)
+        if node.operator == "OR":
+            return self._checked(node, _type, left_value or right_value)
+        if node.operator in COMPARISONS:
+            return self._checked(
+                node, _type, COMPARISONS[node.operator](left_value, right_value)
+            )
+
+        try:
+            value = ARITHMETIC[node.operator](left_value, right_value)
+        except _DivisionByZero:
+            return self._fail(
+                node, _errors.DivisionByZeroError, *self._position(node)
+            )
+
+        return self._checked(node, _type, value)
+
+
+def fold_constants(
+    tree: Optional[ast.Node], lines: Optional[lexer.LineIndex] = None
+) -> Optional[ast.Node]:
+    """Evaluates operations on literals in a tree.
+
+    Errors of operations are reported, even in code which is never executed. Use
+    optimize to only report errors of the code left after removing dead code.
+
+    Args:
+        tree (Optional[ast.Node]): Tree to optimize, it is changed in place.
+        lines (Optional[lexer.LineIndex]): Lines of the source, to report the
+                                           columns of errors.
+
+    Returns:
+        Optional[ast.Node]: The optimized tree.
+    """
+
+    folder = ConstantFolder(lines)
+    tree = folder.visit(tree)
+    folder.report(tree)
+
+    return tree
+
+
+class _Uses(NodeVisitor):
+    """
+    Collects the declarations and the number of references of every name.
+    """
+
+    def __init__(self) -> None:
+        self.declarations: List[Declaration] = []
+        self.uses: Dict[str, int] = collections.Counter()
+
+    def visit_Reference(self, node: ast.Reference) -> None:  # pylint: disable=C0103
+        """Counts a reference."""
+
+        self.uses[node.name] += 1
+
+    def visit_DefineVariable(self, node: Declaration) -> None:  # pylint: disable=C0103
+        """Remembers a declaration."""
+
+        self.declarations.append(node)
+
+    visit_Constant = visit_Variable = visit_DefineVariable
+
+
+def unused_declarations(tree: Optional[ast.Node]) -> List[Declaration]:
+    """Returns the declarations, which can be removed without changing the program.
+
+    Declarations are unused if their name is never referenced and their value has
+    no side effects. Removing a declaration removes the references in its value,
+    so declarations only used by unused declarations are unused too. Names are not
+    resolved by scope, so a reference keeps all declarations of its name.
+
+    Args:
+        tree (Optional[ast.Node]): Tree to analyze.
+
+    Returns:
+        List[Declaration]: Unused declarations.
+    """
+
+    collector = _Uses()
+    collector.visit(tree)
+    uses = collector.uses
+
+    by_name: Dict[str, List[Declaration]] = collections.defaultdict(list)
+    for declaration in collector.declarations:
+        by_name[declaration.name].append(declaration)
+
+    unused: Dict[int, Declaration] = {}
+    pending = [
+        declaration
+        for declaration in collector.declarations
+        if not uses[declaration.name]
+    ]
+
+    while pending:
+        declaration = pending.pop()
+        value = _declared_value(declaration)
+        nodes = list(walk(value))
+
+        if (
+            id(declaration) in unused
+            or uses[declaration.name]
+            or not all(isinstance(node, PURE_NODES) for node in nodes)
+        ):
+            continue
+
+        unused[id(declaration)] = declaration
+        for node in nodes:
+            if isinstance(node, ast.Reference):
+                uses[node.name] -= 1
+                if not uses[node.name]:
+                    pending.extend(by_name[node.name])
+
+    return list(unused.values())
+
+
+class DeadCodeEliminator(NodeTransformer):
+    """
+    Removes code, which is never executed or has no effect.
+
+    Statements after a return, break, continue or throw in the same block are
+    removed, just like unused declarations (see unused_declarations) and the
+    branches of ifs with a literal condition. Conditions are only literals after
+    folding the constants.
+    """
+
+    def __init__(self) -> None:
+        self.removed = 0  # Number of removed nodes
+        self._unused: Set[int] = set()
+        self._terminating: Set[int] = set()  # Blocks and ifs ending in a terminator
+
+    def visit(self, node: Optional[ast.Node]) -> Optional[ast.Node]:
+        """Removes the dead code of a tree.
+
+        The tree is traversed until nothing is removed anymore, as removing dead
+        code can leave declarations only used in it unused.
+
+        Args:
+            node (Optional[ast.Node]): Root of the tree.
+
+        Returns:
+            Optional[ast.Node]: New root of the tree.
+        """
+
+        while True:
+            removed = self.removed
+            self._unused = {
+                id(declaration) for declaration in unused_declarations(node)
+            }
+            self._terminating = set()
+            node = super().visit(node)
+
+            if self.removed == removed:
+                return node
+
+    def _terminates(self, node: Optional[ast.Node]) -> bool:
+        """Returns whether the statements after a statement are never executed.
+
+        Args:
+            node (Optional[ast.Node]): Statement node.
+
+        Returns:
+            bool: Whether the statement always terminates its block.
+        """
+
+        return isinstance(node, TERMINATORS) or id(node) in self._terminating
+
+    def leave_Main(self, node: ast.Main) -> ast.Main:  # pylint: disable=C0103
+        """Removes the dead statements of the program."""
+
+        self._remove_statements(node)
+
+        return node
+
+    def leave_Block(self, node: ast.Block) -> ast.Block:  # pylint: disable=C0103
+        """Removes the dead statements of a block."""
+
+        if self._remove_statements(node):
+            self._terminating.add(id(node))
+
+        return node
+
+    def leave_If(self, node: ast.If) -> Optional[ast.Node]:  # pylint: disable=C0103
+        """Replaces ifs with a literal condition by the branch taken."""
+
+        condition = node.condition
+        if not (isinstance(condition, ast.StaticValue) and condition.type == "bool"):
+            if node.orelse is None:  # Like ifs without an else branch
+                del node.below[2:]
+            if self._terminates(node.body) and self._terminates(node.orelse):
+                self._terminating.add(id(node))
+            return node
+
+        taken, skipped = (
+            (node.body, node.orelse)
+            if literal_value(condition)
+            else (node.orelse, node.body)
+        )
+        self.removed += 2 + _count(skipped)  # The if and its condition
+
+        return taken  # Blocks are kept, as they are a scope of their own
+
+    def _remove_statements(self, node: ast.Node) -> bool:
+        """Removes unused declarations and unreachable statements of a block.
+
+        Args:
+            node (ast.Node): Main or block node.
+
+        Returns:
+            bool: Whether the block ends with a terminating statement.
+        """
+
+        statements: List[Optional[ast.Node]] = []
+
+        for position, statement in enumerate(node.below):
+            if id(statement) in self._unused:
+                self.removed += _count(statement)
+                continue
+
+            statements.append(statement)
+            if self._terminates(statement):
+                self.removed += sum(map(_count, node.below[position + 1 :]))
+                node.below[:] = statements
+                return True
+
+        node.below[:] = statements
+
+        return False
+
+
+def eliminate_dead_code(tree: Optional[ast.Node]) -> Optional[ast.Node]:
+    """Removes code, which is never executed or has no effect, from a tree.
+
+    Args:
+        tree (Optional[ast.Node]): Tree to optimize, it is changed in place.
+
+    Returns:
+        Optional[ast.Node]: The optimized tree.
+    """
+
+    return DeadCodeEliminator().visit(tree)
+
+
+###########
+# RESULTS #
+###########
+
+
+@dataclasses.dataclass
+class OptimizeResult:
+    """
+    Represents the result of optimizing a tree.
+    """
+
+    tree: Optional[ast.Node]
+    folded: int  # Number of nodes replaced by literals
+    removed: int  # Number of removed nodes
+
+
+def optimize(
+    tree: Optional[ast.Node], lines: Optional[lexer.LineIndex] = None
+) -> OptimizeResult:
+    """Folds the constants of a tree and removes its dead code.
+
+    Args:
+        tree (Optional[ast.Node]): Tree to optimize, it is changed in place.
+        lines (Optional[lexer.LineIndex]): Lines of the source, to report the
+                                           columns of errors.
+
+    Returns:
+        OptimizeResult: The optimized tree and the number of changed nodes.
+    """
+
+    folder = ConstantFolder(lines)
+    eliminator = DeadCodeEliminator()
+    tree = eliminator.visit(folder.visit(tree))
+    folder.report(tree)  # Only errors of code, which may be executed
+
+    return OptimizeResult(tree, folder.folded, eliminator.removed)
@@ -1,9 +1,153 @@
-"""DOCSTRING"""
+"""
+I Language parser.
+Version: 0.1.17
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+#########
+# SETUP #
+#########
+
+__version__ = "0.1.17"
+
 
 # noqa
 # pylint: disable
 
-import _ast as ast
+import collections
+import concurrent.futures
+import dataclasses
+import bisect
+import itertools
+import os
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+from . import _ast as ast
+from . import _types
+from .context import CompilationContext
+from .symbols import SymbolTable
+
+
+# Token types of literal values and the types of their values
+LITERAL_TYPES: Final[Dict[str, str]] = {
+    "BOOL": "bool",
+    "STRING": "string",
+    "FLOAT": "float",
+    "INT": "int",
+    "HEX": "hex",
+}
+# Binding powers of the infix operators to their left and right operand. Operators
+# with a higher power bind stronger, the right power is higher to make operators
+# of the same precedence left associative.
+BINDING_POWERS: Final[Dict[str, Tuple[int, int]]] = {
+    "OR": (1, 2),
+    "AND": (3, 4),
+    "EQUAL": (5, 6),
+    "NOT_EQUAL": (5, 6),
+    "LESS": (7, 8),
+    "LESS_EQUAL": (7, 8),
+    "GREATER": (7, 8),
+    "GREATER_EQUAL": (7, 8),
+    "PLUS": (9, 10),
+    "MINUS": (9, 10),
+    "MULTIPLY": (11, 12),
+    "DIVIDE": (11, 12),
+    "MODULO": (11, 12),
+}
+# Binding powers of the prefix operators to their operand
+PREFIX_BINDING_POWERS: Final[Dict[str, int]] = {
+    "NOT": 13,
+    "MINUS": 13,
+    "PLUS": 13,
+}
+# Operators, which always return a bool
+BOOL_OPERATORS: Final[Tuple[str, ...]] = (
+    "OR",
+    "AND",
+    "EQUAL",
+    "NOT_EQUAL",
+    "LESS",
+    "LESS_EQUAL",
+    "GREATER",
+    "GREATER_EQUAL",
+    "NOT",
+)
+# Types of constants by the name of their base type
+CONSTANT_TYPES: Final[Dict[str, type]] = {
+    name.lower(): value
+    for name, value in vars(_types).items()
+    if isinstance(value, type)
+    and issubclass(value, _types.BaseType)
+    and value is not _types.BaseType
+}
+# Nodes defining a name
+DEFINITIONS: Final[Tuple[type, ...]] = (ast.DefineVariable, ast.Constant)
+DEFAULT_MAX_ERRORS: Final[int] = 100  # Errors to collect before parsing stops
+MEMO_LIMIT: Final[int] = 4096  # Lookups of a rule before its hit rate is checked
+MEMO_MIN_HIT_RATE: Final[float] = 0.1  # Hit rate of rules worth memoizing
+CHUNKS_PER_JOB: Final[int] = 4  # Chunks of statements per process when parallel
+STATEMENT_CHUNK: Final[int] = 256  # Statements per chunk of a statement list
+
+
+# Memoized results and the indices after them, by rule name and the start index and
+# variant of the rule they were parsed at
+Memo = Dict[str, Dict[Tuple[int, int], Tuple[ast.Node, int]]]
+
+
+@dataclasses.dataclass
+class MemoStats:
+    """
+    Represents the memoization counters of a rule.
+    """
+
+    lookups: int = 0
+    hits: int = 0
+    entries: int = 0  # Results stored since the last check
+    disabled: bool = False
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of the lookups, which were answered from the memo.
+        """
+
+        return self.hits / self.lookups if self.lookups else 0.0
 
 
 class ParserError(BaseException):
@@ -13,6 +157,9 @@ class ParserError(BaseException):
         self.line = line + 1
         self.errcode = errcode
 
+    def __reduce__(self):
+        return ParserError, (self.name, self.help, self.line - 1, self.errcode)
+
     def __str__(self):
         return (
             "Parser error: "
@@ -26,9 +173,1693 @@ class ParserError(BaseException):
         )
 
 
+class Instruction(NamedTuple):
+    """
+    Represents an instruction of an expression in postfix order.
+
+    Values and variables push their value, operators pop their operands and push
+    their result, so an expression is evaluated with a single stack.
+    """
+
+    opcode: str  # "VALUE", "NAME" or the token type of an operator
+    argument: Any  # Value node, name of the variable or number of operands
+    offset: int = -1  # Of the operator in the source, -1 if unknown
+
+
+class _Chunk(list):
+    """
+    Represents a chunk of a statement list.
+    """
+
+    __slots__ = ("delta",)
+
+    def __init__(self, statements: Iterable["ParsedStatement"] = ()) -> None:
+        super().__init__(statements)
+        self.delta = 0  # Added to the token indices of the statements
+
+
+class ParsedStatement:
+    """
+    Represents a top level statement of a parse result.
+
+    The token indices are stored without the shift of the chunk of the statement
+    list the statement is in, so shifting a chunk shifts all of its statements.
+    """
+
+    __slots__ = ("_first", "_end", "chunk", "line", "node", "error", "name", "memo")
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        first: int,
+        end: int,
+        line: int,
+        node: Optional[ast.Node],
+        error: Optional[ParserError] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        """Initializes a statement.
+
+        Args:
+            first (int): Index of the first token.
+            end (int): Index after the last token.
+            line (int): Line of the statement.
+            node (Optional[ast.Node]): Parsed statement, None if it is invalid.
+            error (Optional[ParserError]): Error of the statement if it is invalid.
+            name (Optional[str]): Variable defined, also if it is overlapping.
+        """
+
+        self.chunk = _UNSHIFTED
+        self._first = first
+        self._end = end
+        self.line = line
+        self.node = node
+        self.error = error
+        self.name = name
+        # Index of the first token when parsed and the results memoized meanwhile
+        self.memo: Optional[Tuple[int, Memo]] = None
+
+    @property
+    def first(self) -> int:
+        """
+        Index of the first token.
+        """
+
+        return self._first + self.chunk.delta
+
+    @first.setter
+    def first(self, value: int) -> None:
+        self._first = value - self.chunk.delta
+
+    @property
+    def end(self) -> int:
+        """
+        Index after the last token.
+        """
+
+        return self._end + self.chunk.delta
+
+    @end.setter
+    def end(self, value: int) -> None:
+        self._end = value - self.chunk.delta
+
+    def move(self, chunk: _Chunk) -> None:
+        """Moves the statement to a chunk, keeping its token indices.
+
+        Args:
+            chunk (_Chunk): Chunk to move to.
+        """
+
+        delta = chunk.delta - self.chunk.delta
+        self._first -= delta
+        self._end -= delta
+        self.chunk = chunk
+
+    def __repr__(self) -> str:
+        return (
+            f"ParsedStatement({self.first}, {self.end}, {self.line}, {self.node!r},"
+            f" {self.error!r}, {self.name!r})"
+        )
+
+
+_UNSHIFTED: Final[_Chunk] = _Chunk()  # Chunk of the statements in no list
+
+
+class StatementList:
+    """
+    Represents the top level statements of a parse result in source order.
+
+    The statements are kept in chunks of up to STATEMENT_CHUNK statements. The
+    token indices of the statements in a chunk are shifted by the delta of the
+    chunk, so shifting the statements after an edit only changes the deltas of the
+    chunks after it and replacing statements only copies the chunks they are in.
+    """
+
+    def __init__(self, statements: Iterable[ParsedStatement] = ()) -> None:
+        """Initializes a statement list.
+
+        Args:
+            statements (Iterable[ParsedStatement]): Statements to add.
+        """
+
+        self.chunks: List[_Chunk] = []
+        self.length = 0
+
+        for statement in statements:
+            self.append(statement)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[ParsedStatement]:
+        return itertools.chain.from_iterable(self.chunks)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[ParsedStatement, List[ParsedStatement]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                return list(self)[index]
+            return list(itertools.islice(self.iterate(start), max(stop - start, 0)))
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("statement index out of range")
+
+        number, offset = self._locate(index)
+
+        return self.chunks[number][offset]
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """Returns the chunk of a statement and the index of it in the chunk.
+
+        Args:
+            index (int): Index of the statement, the length for the end of the list.
+
+        Returns:
+            Tuple[int, int]: Index of the chunk and of the statement in the chunk.
+        """
+
+        for number, chunk in enumerate(self.chunks):
+            if index < len(chunk):
+                return number, index
+            index -= len(chunk)
+
+        if not self.chunks:
+            return 0, 0
+
+        return len(self.chunks) - 1, len(self.chunks[-1]) + index
+
+    def iterate(self, start: int = 0) -> Iterator[ParsedStatement]:
+        """Iterates the statements from an index on.
+
+        Args:
+            start (int): Index of the first statement.
+
+        Yields:
+            ParsedStatement: Statements.
+        """
+
+        number, offset = self._locate(start)
+
+        for chunk in itertools.islice(self.chunks, number, None):
+            yield from itertools.islice(chunk, offset, None)
+            offset = 0
+
+    def bisect(self, index: int) -> int:
+        """Returns the number of statements starting at or before a token.
+
+        Args:
+            index (int): Index of the token.
+
+        Returns:
+            int: Number of statements.
+        """
+
+        chunks = self.chunks
+        number = _count_before(chunks, index + 1, lambda chunk: chunk[0].first)
+
+        if not number:
+            return 0
+
+        return sum(len(chunk) for chunk in chunks[: number - 1]) + _count_before(
+            chunks[number - 1], index + 1
+        )
+
+    def append(self, statement: ParsedStatement) -> None:
+        """Adds a statement to the end of the list.
+
+        Args:
+            statement (ParsedStatement): Statement to add.
+        """
+
+        chunks = self.chunks
+        if not chunks or len(chunks[-1]) >= STATEMENT_CHUNK:
+            chunks.append(_Chunk())
+
+        statement.move(chunks[-1])
+        chunks[-1].append(statement)
+        self.length += 1
+
+    def replace(
+        self,
+        begin: int,
+        stop: int,
+        statements: Iterable[ParsedStatement],
+        delta: int,
+    ) -> None:
+        """Replaces statements and shifts the token indices of the statements after.
+
+        Args:
+            begin (int): Index of the first statement to replace.
+            stop (int): Index after the last statement to replace.
+            statements (Iterable[ParsedStatement]): Statements to insert instead.
+            delta (int): Number of tokens to shift the statements after by.
+        """
+
+        chunks = self.chunks
+        first, offset = self._locate(begin)
+        last, end = self._locate(stop)
+        after = chunks[last][end:] if chunks else []
+
+        for statement in after:
+            statement.first += delta
+            statement.end += delta
+
+        merged = (chunks[first][:offset] if chunks else []) + list(statements) + after
+        self.length += len(merged) - sum(len(chunk) for chunk in chunks[first : last + 1])
+        replaced = []
+
+        for index in range(0, len(merged), STATEMENT_CHUNK):
+            chunk = _Chunk(merged[index : index + STATEMENT_CHUNK])
+            for statement in chunk:
+                statement.move(chunk)
+            replaced.append(chunk)
+
+        chunks[first : last + 1] = replaced
+
+        for chunk in itertools.islice(chunks, first + len(replaced), None):
+            chunk.delta += delta
+
+
+@dataclasses.dataclass
+class ParseResult:
+    """
+    Represents a parse tree together with all errors found while parsing it.
+    """
+
+    tree: ast.AST
+    errors: List[ParserError]
+    complete: bool = True  # False if parsing stopped at the maximum error count
+    statements: StatementList = dataclasses.field(default_factory=StatementList)
+    # Statements defining the variables, by name
+    definitions: Dict[str, ParsedStatement] = dataclasses.field(default_factory=dict)
+    # Statements of the nodes added to the tree and of the errors, in source order
+    valid: List[ParsedStatement] = dataclasses.field(
+        default_factory=list, repr=False, compare=False
+    )
+    failed: List[ParsedStatement] = dataclasses.field(
+        default_factory=list, repr=False, compare=False
+    )
+    # Statements, which define or overlap a variable, by name
+    named: Dict[str, List[ParsedStatement]] = dataclasses.field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.base = len(self.tree.below)  # Nodes in the tree before the statements
+
+    def add(self, statement: ParsedStatement) -> None:
+        """Adds a statement to the tree or its error to the errors.
+
+        Args:
+            statement (ParsedStatement): Statement to add.
+        """
+
+        self.statements.append(statement)
+        if statement.name is not None:
+            self.named.setdefault(statement.name, []).append(statement)
+
+        if statement.error is not None:
+            self.failed.append(statement)
+            self.errors.append(statement.error)
+            return
+
+        self.valid.append(statement)
+        self.tree.below.append(statement.node)
+        if statement.name is not None:
+            self.definitions[statement.name] = statement
+
+    def replace(
+        self,
+        begin: int,
+        stop: int,
+        statements: List[ParsedStatement],
+        delta: int,
+    ) -> None:
+        """Replaces statements together with their nodes and errors.
+
+        The tree and the errors are changed in place, only the definitions are
+        left to the caller. The token indices of the statements after are shifted.
+
+        Args:
+            begin (int): Index of the first statement to replace.
+            stop (int): Index after the last statement to replace.
+            statements (List[ParsedStatement]): Statements to insert instead.
+            delta (int): Number of tokens to shift the statements after by.
+        """
+
+        removed = self.statements[begin:stop]
+        low = self.statements[begin].first if begin < len(self.statements) else None
+        high = self.statements[stop].first if stop < len(self.statements) else None
+
+        first = _count_before(self.valid, low)
+        last = _count_before(self.valid, high)
+        added = [item for item in statements if item.error is None]
+        self.valid[first:last] = added
+        self.tree.below[self.base + first : self.base + last] = [
+            item.node for item in added
+        ]
+
+        first = _count_before(self.failed, low)
+        last = _count_before(self.failed, high)
+        added = [item for item in statements if item.error is not None]
+        self.failed[first:last] = added
+        self.errors[first:last] = [item.error for item in added]  # type: ignore
+
+        for item in removed:
+            if item.name is not None:
+                named = self.named[item.name]
+                named.remove(item)
+                if not named:
+                    del self.named[item.name]
+
+        self.statements.replace(begin, stop, statements, delta)
+
+        for item in statements:
+            if item.name is not None:
+                named = self.named.setdefault(item.name, [])
+                named.insert(_count_before(named, item.first), item)
+
+    def change(
+        self,
+        statement: ParsedStatement,
+        node: Optional[ast.Node],
+        error: Optional[ParserError] = None,
+    ) -> None:
+        """Changes the node or the error of a statement in place.
+
+        Args:
+            statement (ParsedStatement): Statement of this result.
+            node (Optional[ast.Node]): New node, None if the statement is invalid.
+            error (Optional[ParserError]): New error if the statement is invalid.
+        """
+
+        below = self.tree.below
+
+        if statement.error is None:
+            index = _count_before(self.valid, statement.first)
+            if error is None:
+                below[self.base + index] = node
+            else:
+                del self.valid[index], below[self.base + index]
+        else:
+            index = _count_before(self.failed, statement.first)
+            if error is not None:
+                self.errors[index] = error
+            else:
+                del self.failed[index], self.errors[index]
+
+        if statement.error is None and error is not None:
+            index = _count_before(self.failed, statement.first)
+            self.failed.insert(index, statement)
+            self.errors.insert(index, error)
+        elif statement.error is not None and error is None:
+            index = _count_before(self.valid, statement.first)
+            self.valid.insert(index, statement)
+            below.insert(self.base + index, node)
+
+        statement.node = node
+        statement.error = error
+
+
 class Parser:
+    """
+    Represents a recursive descent parser.
+
+    The parser walks the token sequence with a cursor. Statements are never copied:
+    every rule looks at the tokens through lookahead helpers, which stop at the end
+    of the current statement and skip newlines, so only the resulting nodes are
+    created. Token types are read at the cursor, no per token data is copied.
+    """
+
+    def __init__(
+        self,
+        tokens: Sequence[Any] = (),
+        context: Optional[CompilationContext] = None,
+        memoize: bool = False,
+        memo_limit: int = MEMO_LIMIT,
+    ) -> None:
+        """Initializes a parser.
+
+        Args:
+            tokens (Sequence[Any]): Tokens to parse, e.g. a list of lexer tokens or
+                                    a token buffer. Not needed to parse a stream
+                                    of tokens with iter_statements.
+            context (Optional[CompilationContext]): Context of the compilation,
+                                                    defaults to a new context.
+            memoize (bool): Memoize the list values of the statements of parse
+                            results, so reparse reuses the lists an edit did not
+                            change.
+            memo_limit (int): Number of lookups of a rule before checking its hit
+                              rate. Rules hit too rarely are no longer memoized.
+        """
+
+        self.tokens = tokens
+        self.index = 0  # Cursor
+        self.end = 0  # Index of the semicolon ending the current statement
+        self.line = 0  # Line of the current statement
+        self.level = 0  # Block level of the current statement
+        self.declared: Optional[str] = None  # Variable the statement defines
+        self.context = context if context is not None else CompilationContext()
+        self.symbols = self.context.symbols  # Variables known at the cursor
+        self.memoize = memoize
+        self.memo_limit = memo_limit
+        self.memo: Memo = {}  # Results of the current statement
+        self.recalled: Memo = {}  # Results of the previous parse, which are valid
+        self.memo_stats: Dict[str, MemoStats] = {}
+
+    def peek(self, offset: int = 0) -> Optional[str]:
+        """Returns the type of a token after the cursor.
+
+        Args:
+            offset (int): Number of tokens to look past, newlines are not counted.
+
+        Returns:
+            Optional[str]: Type of the token, None at the end of the statement.
+        """
+
+        tokens = self.tokens
+        index = self.index
+        end = self.end
+
+        while index < end:
+            token_type = tokens[index].type
+
+            if token_type != "NEWLINE":
+                if not offset:
+                    return token_type
+                offset -= 1
+
+            index += 1
+
+        return None
+
+    def advance(self) -> Any:
+        """Returns the token at the cursor and moves the cursor past it.
+
+        Returns:
+            Any: Token at the cursor.
+        """
+
+        index = self.index
+        tokens = self.tokens
+
+        while tokens[index].type == "NEWLINE":
+            index += 1
+
+        self.index = index + 1
+
+        return tokens[index]
+
+    def accept(self, token_type: str) -> Optional[Any]:
+        """Moves the cursor past the next token, if it has a type.
+
+        Args:
+            token_type (str): Type of the token.
+
+        Returns:
+            Optional[Any]: The token, None if it has another type.
+        """
+
+        tokens = self.tokens
+        index = self.index
+        end = self.end
+
+        while index < end:
+            token = tokens[index]
+            if token.type == token_type:
+                self.index = index + 1
+                return token
+            if token.type != "NEWLINE":
+                return None
+
+            index += 1
+
+        return None
+
+    def parse_one_of(
+        self,
+        rules: Iterable[Callable[[], Optional[ast.Node]]],
+    ) -> Optional[ast.Node]:
+        """Returns the node of the first rule matching at the cursor.
+
+        Args:
+            rules (Iterable[Callable[[], Optional[ast.Node]]]): Rules to try.
+
+        Returns:
+            Optional[ast.Node]: Parsed node, None if no rule matches.
+        """
+
+        start = self.index
+
+        for rule in rules:
+            self.index = start
+            result = rule()
+
+            if result is not None:
+                return result
+
+        self.index = start
+
+        return None
+
+    def _recall(self, name: str, variant: int) -> Optional[ast.Node]:
+        """Returns the result of a rule at the cursor from the previous parse.
+
+        Reparse recalls the results of the statements it parses again, which only
+        depend on tokens the edit did not change. A hit moves the cursor past the
+        result. Once a rule was looked up memo_limit times, it is no longer
+        memoized if its hit rate is below MEMO_MIN_HIT_RATE.
+
+        Args:
+            name (str): Name of the rule.
+            variant (int): Variant of the rule, e.g. its list dimension.
+
+        Returns:
+            Optional[ast.Node]: Result, None if there is no valid result.
+        """
+
+        results = self.recalled.get(name)
+        stats = self.memo_stats.setdefault(name, MemoStats())
+
+        if not results or stats.disabled:
+            return None
+
+        key = (self.index, variant)
+        result = results.get(key)
+        stats.lookups += 1
+
+        if result is not None and result[1] <= self.end:
+            stats.hits += 1
+            node, self.index = result
+        else:
+            node = None
+
+        if not stats.lookups % self.memo_limit:
+            stats.disabled = stats.hit_rate < MEMO_MIN_HIT_RATE
+
+        return node
+
+    def _remember(self, name: str, variant: int, start: int, node: ast.Node) -> None:
+        """Memoizes the result of a rule for the current statement.
+
+        Only rules, which look at no token after their result, may be memoized, as
+        results are recalled as long as their own tokens did not change. Failures
+        are not memoized.
+
+        Args:
+            name (str): Name of the rule.
+            variant (int): Variant of the rule, e.g. its list dimension.
+            start (int): Index the rule was parsed at, the cursor is after it.
+            node (ast.Node): Result of the rule.
+        """
+
+        stats = self.memo_stats.setdefault(name, MemoStats())
+
+        if not stats.disabled:
+            self.memo.setdefault(name, {})[(start, variant)] = (node, self.index)
+            stats.entries += 1
+
+    def _recall_from(
+        self,
+        statement: ParsedStatement,
+        start: int,
+        old_end: int,
+        delta: int,
+    ) -> None:
+        """Makes the memoized results of a statement recallable after an edit.
+
+        Results before the edit are kept, results after it are shifted and results
+        overlapping it are dropped.
+
+        Args:
+            statement (ParsedStatement): Statement of the old tokens.
+            start (int): Index of the first changed token.
+            old_end (int): Index after the last changed token in the old tokens.
+            delta (int): Number of tokens the tokens after the edit moved by.
+        """
+
+        if statement.memo is None:
+            return
+
+        base, memo = statement.memo
+        shift = statement.first - base
+
+        for name, results in memo.items():
+            recalled = self.recalled.setdefault(name, {})
+
+            for (index, variant), (node, stop) in results.items():
+                index += shift
+                stop += shift
+                if stop <= start:
+                    recalled[(index, variant)] = (node, stop)
+                elif index >= old_end:
+                    recalled[(index + delta, variant)] = (node, stop + delta)
+
+    def parse(  # pylint: disable=R0913
+        self,
+        tokens: Optional[Sequence[Any]] = None,
+        start: Optional[ast.AST] = None,
+        local: int = 0,
+        start_line: int = 0,
+        recover: bool = False,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+    ) -> Union[ast.AST, ParseResult]:
+        """Parses all statements.
+
+        The context of the parser is the current context while parsing.
+
+        Args:
+            tokens (Optional[Sequence[Any]]): Tokens to parse instead of the tokens
+                                              of the parser.
+            start (Optional[ast.AST]): Node to add the statements to, defaults to a
+                                       new main node.
+            local (int): Block level of the tokens.
+            start_line (int): Line of the first token.
+            recover (bool): Return a parse result, which also contains all errors.
+                            Invalid statements are skipped up to their ';' and
+                            blocks end a statement at their '}', then parsing
+                            continues with the next statement.
+            max_errors (int): Number of errors to stop parsing at when recovering.
+
+        Returns:
+            Union[ast.AST, ParseResult]: The start node.
+
+        Raises:
+            ParserError: If a statement is invalid and no errors are recovered from.
+        """
+
+        if tokens is not None:
+            self.tokens = tokens
+
+        if start is None:
+            start = ast.Main()
+
+        result = ParseResult(start, [])
+
+        with self.context.activate():
+            for first, end, line in self._statements(start_line, recover):
+                try:
+                    node = self._parse_statement(first, end, line, local)
+                except ParserError as error:
+                    if not recover:
+                        raise
+                    result.add(self._parsed(first, end, line, None, error))
+                    if len(result.errors) >= max_errors:
+                        result.complete = False
+                        return result
+                else:
+                    if not recover:
+                        start.below.append(node)
+                        continue
+                    result.add(self._parsed(first, end, line, node))
+
+        return result if recover else start
+
+    def parse_parallel(  # pylint: disable=R0913, R0914
+        self,
+        jobs: Optional[int] = None,
+        start: Optional[ast.AST] = None,
+        recover: bool = False,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Union[ast.AST, ParseResult]:
+        """Parses all statements in parallel processes.
+
+        The statement boundaries are scanned first, then chunks of statements are
+        parsed in a process pool. The statements are merged in source order and the
+        definitions are checked in a serial pass, which enters and leaves the
+        blocks scanned before every statement, so the tree and the errors are the
+        same as of parse. Only worth it for large sources.
+
+        Args:
+            jobs (Optional[int]): Number of processes, defaults to the number of CPUs.
+            start (Optional[ast.AST]): Node to add the statements to, defaults to a
+                                       new main node.
+            recover (bool): Return a parse result, which also contains all errors.
+            max_errors (int): Number of errors to stop parsing at when recovering.
+            executor (Optional[concurrent.futures.Executor]): Process pool to parse
+                                                              in instead of a new
+                                                              pool of jobs processes.
+
+        Returns:
+            Union[ast.AST, ParseResult]: The start node.
+
+        Raises:
+            ParserError: If a statement is invalid and no errors are recovered from.
+        """
+
+        if start is None:
+            start = ast.Main()
+
+        jobs = max(1, jobs or os.cpu_count() or 1)
+        scopes: List[Tuple[int, int]] = []
+        statements = list(self._statements(0, recover, scopes=scopes))
+        tokens = self.tokens
+        size = max(1, len(tokens) // (jobs * CHUNKS_PER_JOB))
+        chunks = []
+
+        for _, group in itertools.groupby(statements, lambda bounds: bounds[0] // size):
+            bounds = list(group)
+            first, end = bounds[0][0], bounds[-1][1]  # Terminators are not read
+            chunks.append(
+                (
+                    [tokens[index].type for index in range(first, end)],
+                    [tokens[index].value for index in range(first, end)],
+                    [
+                        getattr(tokens[index], "offset", -1)
+                        for index in range(first, end)
+                    ],
+                    [
+                        (begin - first, stop - first, line)
+                        for begin, stop, line in bounds
+                    ],
+                )
+            )
+
+        if executor is None:
+            with concurrent.futures.ProcessPoolExecutor(jobs) as pool:
+                results = list(pool.map(_parse_chunk, chunks))
+        else:
+            results = list(executor.map(_parse_chunk, chunks))
+
+        parsed = ParseResult(start, [])
+
+        with self.context.activate():
+            for (first, end, line), (left, entered), result in zip(
+                statements, scopes, itertools.chain.from_iterable(results)
+            ):
+                self._replay_scopes(left, entered)
+                name = None
+                try:
+                    if isinstance(result, ParserError):
+                        raise result
+                    if isinstance(result, DEFINITIONS):
+                        name = result.name
+                        self.line = line
+                        self._check_overlap(name)
+                        self.symbols.define(result)
+                except ParserError as error:
+                    if not recover:
+                        raise
+                    parsed.add(ParsedStatement(first, end, line, None, error, name))
+                    if len(parsed.errors) >= max_errors:
+                        parsed.complete = False
+                        return parsed
+                else:
+                    if not recover:
+                        start.below.append(result)
+                        continue
+                    parsed.add(ParsedStatement(first, end, line, result, None, name))
+
+            self._replay_scopes(*scopes[-1])  # Blocks after the last statement
+
+        return parsed if recover else start
+
+    def _replay_scopes(self, left: int, entered: int) -> None:
+        """Leaves and enters the scopes of the blocks scanned before a statement.
+
+        Args:
+            left (int): Number of scopes to leave.
+            entered (int): Number of scopes to enter afterwards.
+        """
+
+        for _ in range(left):
+            self.symbols.pop()
+        for _ in range(entered):
+            self.symbols.push()
+
+    def reparse(  # pylint: disable=R0912, R0913, R0914
+        self,
+        previous: ParseResult,
+        tokens: Sequence[Any],
+        start: int,
+        old_end: int,
+        new_end: int,
+    ) -> ParseResult:
+        """Parses the statements changed by an edit again.
+
+        The tokens previous_tokens[start:old_end] were replaced by
+        tokens[start:new_end], e.g. by lexer.relex. Only the top level statements
+        overlapping the edit are parsed again, up to the first statement starting
+        at an unchanged token. All other statements keep their nodes and only the
+        variables defined by the changed statements are defined again, so the
+        statements defining or overlapping them are checked again as well. The
+        result is the same as of parsing all tokens again with recover.
+
+        The previous result is changed in place: the changed statements, nodes and
+        errors are replaced and the statements after are shifted by the chunks of
+        the statement list, so the time taken depends on the size of the edit, not
+        the number of statements. Only edits changing the number of lines update
+        every statement after them, as nodes and errors store their line.
+
+        Args:
+            previous (ParseResult): Result of parsing the old tokens with this
+                                    parser.
+            tokens (Sequence[Any]): Tokens after the edit.
+            start (int): Index of the first changed token.
+            old_end (int): Index after the last changed token in the old tokens.
+            new_end (int): Index after the last changed token in the new tokens.
+
+        Returns:
+            ParseResult: The previous result, which is the result of the new tokens.
+
+        Raises:
+            ValueError: If the previous result stopped at the maximum error count.
+        """
+
+        if not previous.complete:
+            raise ValueError("Incomplete parse results can not be reparsed")
+
+        statements = previous.statements
+        delta = new_end - old_end
+        # The statements before the first changed statement stay the same
+        changed = max(statements.bisect(start) - 1, 0)
+        origin = statements[changed].first if statements else 0
+
+        if changed == len(statements) - 1:  # The edit may follow the last statement
+            last = statements[changed]
+            following = last.end + (  # Block statements end after their '}'
+                last.end == last.first
+                or self.tokens[last.end - 1].type != "BLOCK_CLOSE"
+            )
+            if start >= following:
+                changed += 1
+                origin = following
+
+        self.tokens = tokens
+
+        before = statements[changed - 1].line if changed else 0  # Line at origin
+        resync = changed  # Index of the first old statement after the edit
+        old = statements.iterate(changed)
+        upcoming = next(old, None)  # Old statement at resync
+        memoized = statements.iterate(changed)
+        recallable = next(memoized, None)  # Next old statement to recall results of
+        parsed: List[ParsedStatement] = []
+        symbols = self.symbols
+        self.symbols = SymbolTable()  # Blocks scanned are not entered in the context
+
+        with self.context.activate():
+            for first, end, line in self._statements(before, True, origin):
+                if first >= new_end:
+                    while upcoming is not None and upcoming.first < first - delta:
+                        resync += 1
+                        upcoming = next(old, None)
+                    if upcoming is not None and upcoming.first == first - delta:
+                        break
+                while (
+                    self.memoize
+                    and recallable is not None
+                    and recallable.first < max(end - delta, old_end)
+                ):
+                    self._recall_from(recallable, start, old_end, delta)
+                    recallable = next(memoized, None)
+                parsed.append(self._parse_isolated(first, end, line))
+            else:
+                resync = len(statements)
+
+            self.symbols = symbols
+            self.recalled = {}
+            line_delta = (parsed[-1].line if parsed else before) - (
+                statements[resync - 1].line if resync else 0
+            )
+            removed = statements[changed:resync]
+
+            # Variables defined by the old or new statements are checked again
+            affected = {
+                item.name
+                for item in itertools.chain(removed, parsed)
+                if item.name is not None
+            }
+
+            for name in affected:
+                definition = previous.definitions.get(name)
+                if definition is not None and definition.first >= origin:
+                    self.symbols.undefine(name)
+                    del previous.definitions[name]
+
+            previous.replace(changed, resync, parsed, delta)
+
+            if line_delta:  # Nodes and errors store the lines of the statements
+                for item in statements.iterate(changed + len(parsed)):
+                    item.line += line_delta
+                    if isinstance(item.node, DEFINITIONS):
+                        item.node.line = item.line
+                    if item.error is None:
+                        continue
+                    item.error.line += line_delta
+                    if item.name is not None and item.name not in affected:
+                        # The line of the existing variable may have changed
+                        previous.change(
+                            item,
+                            None,
+                            _overlap_error(
+                                self.symbols.lookup(item.name),  # type: ignore
+                                item.line,
+                            ),
+                        )
+
+            for name in affected:
+                existing = self.symbols.lookup(name)
+                items = previous.named.get(name, [])
+                items = items[_count_before(items, origin) :]
+
+                if existing is None and items:
+                    winner = items.pop(0)
+                    if winner.node is None:  # It was overlapping before
+                        self._recall_from(winner, winner.end, winner.end, 0)
+                        reparsed = self._parse_isolated(
+                            winner.first, winner.end, winner.line
+                        )
+                        self.recalled = {}
+                        winner.memo = reparsed.memo
+                        previous.change(winner, reparsed.node)
+                    existing = self.symbols.define(winner.node)  # type: ignore
+                    previous.definitions[name] = winner
+
+                for item in items:
+                    previous.change(
+                        item, None, _overlap_error(existing, item.line)  # type: ignore
+                    )
+
+        return previous
+
+    def _parse_isolated(self, first: int, end: int, line: int) -> ParsedStatement:
+        """Parses a top level statement without checking for overlapping variables.
+
+        Args:
+            first (int): Index of the first token of the statement.
+            end (int): Index after the last token of the statement.
+            line (int): Line of the statement.
+
+        Returns:
+            ParsedStatement: The statement.
+        """
+
+        symbols = self.symbols
+        self.symbols = SymbolTable()
+
+        try:
+            node = self._parse_statement(first, end, line, 0)
+        except ParserError as error:
+            return self._parsed(first, end, line, None, error)
+        finally:
+            self.symbols = symbols
+
+        return self._parsed(first, end, line, node)
+
+    def _parsed(  # pylint: disable=R0913
+        self,
+        first: int,
+        end: int,
+        line: int,
+        node: Optional[ast.Node],
+        error: Optional[ParserError] = None,
+    ) -> ParsedStatement:
+        """Returns the statement parsed last with its memoized results.
+
+        Args:
+            first (int): Index of the first token of the statement.
+            end (int): Index after the last token of the statement.
+            line (int): Line of the statement.
+            node (Optional[ast.Node]): Parsed statement, None if it is invalid.
+            error (Optional[ParserError]): Error of the statement if it is invalid.
+
+        Returns:
+            ParsedStatement: The statement.
+        """
+
+        statement = ParsedStatement(first, end, line, node, error, self.declared)
+        if self.memo:
+            statement.memo = (first, self.memo)
+
+        return statement
+
+    def _statements(
+        self,
+        start_line: int = 0,
+        recover: bool = False,
+        first: int = 0,
+        scopes: Optional[List[Tuple[int, int]]] = None,
+    ) -> Iterator[Tuple[int, int, int]]:
+        """Scans the boundaries of the top level statements.
+
+        Blocks are entered and left in the symbol table while scanning.
+
+        Args:
+            start_line (int): Line of the first token.
+            recover (bool): End statements at the '}' of top level blocks as well,
+                            an unmatched '}' ends the statement before it.
+            first (int): Index of the token to start scanning at, which has to be
+                         the first token of a top level statement.
+            scopes (Optional[List[Tuple[int, int]]]): List to add the number of
+                scopes to leave and to enter before every statement to, instead
+                of entering and leaving them. The scopes after the last statement
+                are added last.
+
+        Yields:
+            Tuple[int, int, int]: Index of the first token, index after the last token
+                                  and line of every statement.
+        """
+
+        tokens = self.tokens
+        line = start_line
+        block = 0
+        left = entered = 0  # Scopes since the last statement, when recording them
+
+        for index in range(first, len(tokens)):
+            token_type = tokens[index].type
+
+            if token_type == "NEWLINE":
+                line += 1
+                continue
+            if token_type == "BLOCK_OPEN":
+                block += 1
+                if scopes is None:
+                    self.symbols.push()
+                else:
+                    entered += 1
+                continue
+            if token_type == "BLOCK_CLOSE":
+                block -= 1
+                if scopes is None:
+                    self.symbols.pop()
+                elif entered:  # Nothing was defined in the scope
+                    entered -= 1
+                else:
+                    left += 1
+                if not recover or block > 0:
+                    continue
+                block = 0
+                end = index + 1  # The block is part of the statement
+            elif block == 0 and token_type == "SEMICOLON":
+                end = index
+            else:
+                continue
+
+            if scopes is not None:
+                scopes.append((left, entered))
+                left = entered = 0
+
+            yield first, end, line
+            first = index + 1
+
+        if scopes is not None:
+            scopes.append((left, entered))
+
+    def _parse_statement(
+        self,
+        first: int,
+        end: int,
+        line: int,
+        level: int,
+    ) -> Optional[ast.Node]:
+        """Parses a single statement.
+
+        Args:
+            first (int): Index of the first token of the statement.
+            end (int): Index after the last token of the statement.
+            line (int): Line of the statement.
+            level (int): Block level of the statement.
+
+        Returns:
+            Optional[ast.Node]: Parsed statement, None if no rule matches.
+        """
+
+        tokens = self.tokens
+        while first < end and tokens[first].type == "NEWLINE":  # Only skipped once
+            first += 1
+
+        self.index, self.end = first, end
+        self.line, self.level = line, level
+        self.declared = None
+        if self.memo:
+            self.memo = {}
+        if self.recalled:  # Results still valid are kept for the next edit as well
+            self.memo = {
+                name: {
+                    key: result
+                    for key, result in results.items()
+                    if first <= key[0] < end
+                }
+                for name, results in self.recalled.items()
+            }
+
+        if self.peek() == "IMPORT":  # No other statement starts with an import
+            return self.parse_import()
+
+        return self.parse_define_variable()
+
+    def iter_statements(self, tokens: Iterable[Any]) -> Iterator[Optional[ast.Node]]:
+        """Parses the statements of a token stream lazily.
+
+        Only the tokens of the current statement are kept, every statement is
+        yielded as soon as its ';' is read. The statements are the same as the
+        statements parse adds to its start node.
+
+        Args:
+            tokens (Iterable[Any]): Tokens to parse, e.g. the tokens of iter_lex.
+
+        Yields:
+            Optional[ast.Node]: Parsed statements.
+
+        Raises:
+            ParserError: If a statement is invalid.
+        """
+
+        self.tokens = []
+        line = 0
+        block = 0
+
+        for token in tokens:
+            token_type = token.type
+            self.tokens.append(token)  # type: ignore[attr-defined]
+
+            if token_type == "NEWLINE":
+                line += 1
+            elif token_type == "BLOCK_OPEN":
+                block += 1
+                self.symbols.push()
+            elif token_type == "BLOCK_CLOSE":
+                block -= 1
+                self.symbols.pop()
+            elif block == 0 and token_type == "SEMICOLON":
+                with self.context.activate():  # Not while the statement is yielded
+                    statement = self._parse_statement(0, len(self.tokens) - 1, line, 0)
+
+                self.tokens = []
+                yield statement
+
+    def parse_import(self) -> Optional[ast.Node]:
+        """Parses an import at the cursor.
+
+        Returns:
+            Optional[ast.Node]: Import node, None if there is no import.
+
+        Raises:
+            ParserError: If the module name is missing.
+        """
+
+        if self.accept("IMPORT") is None:
+            return None
+
+        if self.peek() != "NAME":
+            raise ParserError(
+                "notaname", "Expected a module name after 'import'", self.line
+            )
+
+        return ast.Import(self.advance().value, self.level)
+
+    def parse_value(self, dimension: int = 0) -> Optional[ast.Node]:
+        """Parses a literal value or a list of values at the cursor.
+
+        Opened lists are kept on an explicit stack instead of recursing, so nesting
+        is only limited by memory. Lists are memoized, as they only look at their
+        own tokens.
+
+        Args:
+            dimension (int): Number of lists around the value.
+
+        Returns:
+            Optional[ast.Node]: Value node, None if there is no valid value.
+        """
+
+        lists: List[Tuple[ast.StaticList, int]] = []  # Opened lists and their start
+
+        while True:  # Value or opened list
+            token_type = self.peek()
+
+            if token_type in LITERAL_TYPES:
+                value: ast.Node = ast.StaticValue(
+                    LITERAL_TYPES[token_type], self.advance().value  # type: ignore
+                )
+            elif token_type == "BASETYPE":
+                start = self.index
+                if self.advance().value != "null":
+                    self.index = start
+                    return None
+                value = ast.StaticValue("null", "null")
+            elif token_type != "INDEX_OPEN":
+                return None
+            else:
+                depth = dimension + len(lists) + 1
+                recalled = self._recall("parse_value", depth) if self.recalled else None
+
+                if recalled is not None:
+                    value = recalled
+                else:
+                    start = self.index
+                    self.advance()
+                    value = ast.StaticList(None, [], depth)
+                    if self.accept("INDEX_CLOSE") is None:
+                        lists.append((value, start))  # type: ignore[arg-type]
+                        continue
+                    value.type = "emptylist"  # type: ignore[attr-defined]
+
+            while lists:  # Adds the value to the lists it ends
+                values, start = lists[-1]
+                if values.type is None:
+                    values.type = value.type  # type: ignore[attr-defined]
+                elif values.type != value.type:  # type: ignore[attr-defined]
+                    values.type = "dynamic"
+                values.values.append(value)
+
+                if self.accept("INDEX_CLOSE") is None:
+                    break
+                lists.pop()
+                if self.memoize:
+                    self._remember("parse_value", values.dimension, start, values)
+                value = values
+            else:
+                return value
+
+            if self.accept("COMMA") is None:
+                return None
+
+    def parse_postfix(self) -> Optional[List[Instruction]]:  # pylint: disable=R0912
+        """Parses an expression at the cursor into instructions in postfix order.
+
+        The operators are parsed by precedence climbing with BINDING_POWERS. Pending
+        operators are kept on an explicit stack instead of recursing, so nesting is
+        only limited by memory.
+
+        Returns:
+            Optional[List[Instruction]]: Instructions of the expression, None if there
+                                         is no valid expression.
+        """
+
+        output: List[Instruction] = []
+        # Pending operators with their number of operands, right binding power and
+        # offset, opened parentheses have no operands
+        operators: List[Tuple[str, int, int, int]] = []
+        opened = 0  # Number of parentheses on the stack
+
+        while True:  # Operand with its prefix operators
+            token_type = self.peek()
+
+            if token_type in PREFIX_BINDING_POWERS:
+                operators.append(
+                    (
+                        token_type,  # type: ignore[arg-type]
+                        1,
+                        PREFIX_BINDING_POWERS[token_type],  # type: ignore[index]
+                        getattr(self.advance(), "offset", -1),
+                    )
+                )
+                continue
+            if token_type == "CLAMP_OPEN":
+                self.advance()
+                operators.append(("CLAMP_OPEN", 0, 0, -1))
+                opened += 1
+                continue
+
+            if token_type == "NAME":
+                output.append(Instruction("NAME", self.advance().value))
+            else:
+                value = self.parse_value()
+                if value is None:
+                    return None
+                output.append(Instruction("VALUE", value))
+
+            while True:  # Operator after the operand
+                token_type = self.peek()
+
+                if token_type == "CLAMP_CLOSE" and opened:
+                    self.advance()
+                    while operators[-1][1]:
+                        operator, operands, _, offset = operators.pop()
+                        output.append(Instruction(operator, operands, offset))
+                    operators.pop()
+                    opened -= 1
+                    continue
+
+                powers = BINDING_POWERS.get(token_type)  # type: ignore[arg-type]
+                left = powers[0] if powers is not None else 0
+
+                while operators and operators[-1][1] and operators[-1][2] > left:
+                    operator, operands, _, offset = operators.pop()
+                    output.append(Instruction(operator, operands, offset))
+
+                if powers is None:  # End of the expression
+                    return None if opened else output
+
+                operators.append(
+                    (
+                        token_type,  # type: ignore[arg-type]
+                        2,
+                        powers[1],
+                        getattr(self.advance(), "offset", -1),
+                    )
+                )
+                break
+
+    def parse_expression(self) -> Optional[ast.Node]:
+        """Parses an expression at the cursor.
+
+        Literal values and lists are returned as they are, operations get the type
+        of their result. Variables are not resolved yet, so operations on them have
+        no known type.
+
+        Returns:
+            Optional[ast.Node]: Expression node, None if there is no valid expression.
+        """
+
+        instructions = self.parse_postfix()
+        if instructions is None:
+            return None
+
+        stack: List[ast.Node] = []
+
+        for opcode, argument, offset in instructions:
+            if opcode == "VALUE":
+                stack.append(argument)
+            elif opcode == "NAME":
+                stack.append(ast.Reference(argument, self.level))
+            elif argument == 1:
+                operand = stack.pop()
+                stack.append(
+                    ast.UnaryOperation(
+                        opcode,
+                        operand,
+                        _operation_type(opcode, operand.type),  # type: ignore
+                        self.level,
+                        offset=offset,
+                    )
+                )
+            else:
+                right = stack.pop()
+                left = stack.pop()
+                stack.append(
+                    ast.BinaryOperation(
+                        opcode,
+                        left,
+                        right,
+                        _operation_type(
+                            opcode, left.type, right.type  # type: ignore
+                        ),
+                        self.level,
+                        offset=offset,
+                    )
+                )
+
+        return stack[0]
+
+    def parse_define_variable(self) -> Optional[ast.Node]:  # pylint: disable=R0912
+        """Parses a variable or constant definition at the cursor.
+
+        Returns:
+            Optional[ast.Node]: Definition node, None if there is no definition.
+
+        Raises:
+            ParserError: If the definition is invalid.
+        """
+
+        constant = False
+        if self.peek() == "NAME":  # Only constants start with a name, 'const'
+            if self.advance().value != "const":
+                return None
+            constant = True
+
+        indefinite = self.accept("INDEFINITE") is not None
+        base_type = self.accept("BASETYPE")
+
+        if base_type is not None:
+            base_type = base_type.value
+        elif constant and not indefinite:
+            base_type = "dynamic"  # e.g. const pi = 3.14;
+        else:
+            if indefinite:
+                raise ParserError(
+                    "unusedindef",
+                    "The '?' in this line could not be used, this could be because"
+                    " the rest of the declaration is wrong.",
+                    self.line,
+                )
+            return None
+
+        list_dimension = 0
+        name = self.accept("NAME")
+
+        if name is None and self.peek() == "INDEX_OPEN":
+            while self.peek() == "INDEX_OPEN" and self.peek(1) == "INDEX_CLOSE":
+                self.advance()
+                self.advance()
+                list_dimension += 1
+
+            if not list_dimension:
+                raise ParserError(
+                    "unclosedindex",
+                    "In this line there is an unclosed '['. This is needed to have a"
+                    " working list",
+                    self.line,
+                )
+
+            name = self.accept("NAME")
+
+        if name is None:
+            return None
+
+        name = name.value
+
+        if self.accept("SET") is None:
+            if self.peek() is None and constant:
+                raise ParserError(
+                    "nosetvalue",
+                    "Constants can not be changed, so their value has to be set where"
+                    " they are defined.",
+                    self.line,
+                )
+            if self.peek() is None:  # e.g. ?int my_int;
+                self.declared = name
+                self._check_overlap(name)
+                return self.symbols.define(
+                    ast.DefineVariableNovalue(
+                        name,
+                        base_type,
+                        list_dimension,
+                        indefinite,
+                        self.level,
+                        self.line,
+                    )
+                )
+
+            raise ParserError(
+                "noendcmd",
+                "This Command seems to have no ';', which is required at the end of"
+                " every Command",
+                self.line,
+            )
+
+        token_type = self.peek()
+        if token_type is None:
+            raise ParserError(
+                "nosetvalue",
+                "It looks like you forgot to set a value here or you put in a '=' where"
+                " you didn't want it.",
+                self.line,
+            )
+
+        if token_type in LITERAL_TYPES and self.peek(1) is None:
+            # Most values are single literals, which need no operators parsed
+            value = ast.StaticValue(
+                LITERAL_TYPES[token_type], self.advance().value  # type: ignore
+            )
+        else:
+            value = self.parse_expression()
+            if self.peek() is not None:  # The value has to end the statement
+                value = None
+
+        if value is None or not (
+            value.type == base_type  # type: ignore[attr-defined]
+            or value.type is None  # type: ignore[attr-defined]
+            or base_type == "dynamic"
+            or (indefinite and value.type == "null")  # type: ignore[attr-defined]
+            or value.type == "emptylist"  # type: ignore[attr-defined]
+        ):
+            raise ParserError(
+                "unmatchingtype",
+                f"The return type of this variable ({value}) does not match the vars"
+                f" expected ({'?' * indefinite}{base_type}{'[]' * list_dimension})",
+                self.line,
+            )
+
+        self.declared = name
+        self._check_overlap(name)
+
+        if constant:
+            node = ast.Constant(
+                name,
+                value,
+                self.level,
+                CONSTANT_TYPES["list" if list_dimension else base_type],
+            )
+            node.line = self.line
+
+            return self.symbols.define(node)  # type: ignore[arg-type]
+
+        return self.symbols.define(
+            ast.DefineVariable(
+                name,
+                base_type,
+                list_dimension,
+                indefinite,
+                value,
+                self.level,
+                self.line,
+            )
+        )
+
+    def _check_overlap(self, name: str) -> None:
+        """Checks a variable is not defined yet.
+
+        Args:
+            name (str): Name of the variable.
+
+        Raises:
+            ParserError: If the variable is already defined.
+        """
+
+        existing = self.symbols.lookup(name)
+
+        if existing is not None:
+            raise _overlap_error(existing, self.line)
+
+
+def _count_before(
+    items: Sequence[Any],
+    index: Optional[int],
+    key: Callable[[Any], int] = lambda item: item.first,
+) -> int:
+    """Returns the number of statements starting before a token.
+
+    Args:
+        items (Sequence[Any]): Statements or chunks of statements in source order.
+        index (Optional[int]): Index of the token, None for the end of the tokens.
+        key (Callable[[Any], int]): Returns the index of the first token of an item.
+
+    Returns:
+        int: Number of items.
+    """
+
+    if index is None:
+        return len(items)
+
+    low, high = 0, len(items)
+
+    while low < high:
+        middle = (low + high) // 2
+        if key(items[middle]) < index:
+            low = middle + 1
+        else:
+            high = middle
+
+    return low
+
+
+def _operation_type(operator: str, *types: Optional[str]) -> Optional[str]:
+    """Returns the type of the result of an operation.
+
+    Args:
+        operator (str): Token type of the operator.
+        *types (Optional[str]): Types of the operands, None if they are unknown.
+
+    Returns:
+        Optional[str]: Type of the result, None if it is unknown.
+    """
+
+    if operator in BOOL_OPERATORS:
+        return "bool"
+    if None in types:
+        return None
+    if len(set(types)) == 1:
+        return types[0]
+    if set(types) == {"int", "float"}:
+        return "float"
+
+    return "dynamic"
+
+
+def _overlap_error(existing: ast.DefineVariable, line: int) -> ParserError:
+    """Returns the error of a variable overlapping with an existing one.
+
+    Args:
+        existing (ast.DefineVariable): Definition of the existing variable.
+        line (int): Line of the overlapping variable.
+
+    Returns:
+        ParserError: Error of the overlapping variable.
+    """
+
+    return ParserError(
+        "varoverlap",
+        "This variable seems overlapping with an already existing one"
+        f" ('{existing.name}', line {existing.line})",
+        line,
+    )
+
+
+# Token of a chunk parsed by a worker
+_ChunkToken = collections.namedtuple("_ChunkToken", ("type", "value", "offset"))
+
+
+def _parse_chunk(
+    chunk: Tuple[List[str], List[str], List[int], List[Tuple[int, int, int]]],
+) -> List[Union[Optional[ast.Node], ParserError]]:
+    """Parses a chunk of statements in a worker process of parse_parallel.
+
+    Definitions are not checked for overlaps, this is done while merging.
+
+    Args:
+        chunk (Tuple[List[str], List[str], List[int], List[Tuple[int, int, int]]]):
+            Types, values and start offsets of the tokens and boundaries of the
+            statements.
+
+    Returns:
+        List[Union[Optional[ast.Node], ParserError]]: Parsed statement or error of
+                                                      every statement.
+    """
+
+    types, values, offsets, statements = chunk
+    parser = Parser()
+    parser.tokens = list(map(_ChunkToken, types, values, offsets))
+    results: List[Union[Optional[ast.Node], ParserError]] = []
+
+    with parser.context.activate():
+        for first, end, line in statements:
+            parser.symbols = SymbolTable()
+
+            try:
+                statement = parser._parse_statement(  # pylint: disable=W0212
+                    first, end, line, 0
+                )
+            except ParserError as error:
+                results.append(error)
+            else:
+                results.append(statement)
+
+    return results
+
+
+#################
+# LEGACY PARSER #
+#################
+
+# The first parser, which copies the tokens of every statement. It is only kept to
+# compare the results and the speed of the parser with.
+
+
+class LegacyParser:
     def __init__(self, tokens):
         self.tokens = tokens
+        self.known_vars = {}  # Variables defined so far, by name
+
+    def delete_locals(self, level):
+        for name in [
+            name for name, node in self.known_vars.items() if node.level >= level
+        ]:
+            del self.known_vars[name]
 
     def tokens_to_list(self, tokens):
         l = []
@@ -68,7 +1899,6 @@ class Parser:
                 return ast.StaticValue(tokens[0].type.lower(), tokens[0].value)
             elif tokens[0].value == "null":
                 return ast.StaticValue("null", "null")
-        print(tokens)
         if tokens[0].type == "INDEX_OPEN" and tokens[-1].type == "INDEX_CLOSE":
             typ = None
             lis = ast.StaticList(None, [], list + 1)
@@ -76,7 +1906,7 @@ class Parser:
                 typ = "emptylist"
                 lis.type = typ
                 return lis
-            for buf in self.split_tokens(tokens[1:-1], "SEPERATOR"):
+            for buf in self.split_tokens(tokens[1:-1], "COMMA"):
                 tree = self.parse_one_of(buf, line, local, [self.parse_value])
                 if typ is None:
                     typ = tree.type
@@ -88,11 +1918,12 @@ class Parser:
             lis.type = typ
             return lis
 
-    def parse(self, tokens=None, start: ast.AST = ast.Main(), local=0, start_line=0):
+    def parse(self, tokens=None, start=None, local=0, start_line=0):
         line = start_line
+        if start is None:
+            start = ast.Main()
         if tokens is None:
             tokens = self.tokens
-            print("parsing...")
         index = 0
         buffer = []
         block = 0
@@ -106,8 +1937,8 @@ class Parser:
                 block += 1
             elif tokens[index].type == "BLOCK_CLOSE":
                 block -= 1
-                ast.delete_locals(block + 1)
-            if block == 0 and tokens[index].type == "END_CMD":
+                self.delete_locals(block + 1)
+            if block == 0 and tokens[index].type == "SEMICOLON":
                 tree = self.parse_one_of(
                     buffer,
                     line,
@@ -115,7 +1946,7 @@ class Parser:
                     [self.parse_define_variable, self.parse_import],
                 )
                 # if tree is None: pass
-                start.last().nexttask = tree
+                start.below.append(tree)
                 buffer = []
             index += 1
         return start
@@ -123,8 +1954,8 @@ class Parser:
     def parse_import(self, tokens, line, local):
         if tokens[0].type == "IMPORT":
             if tokens[1].type == "NAME":
-                # if len(tokens) == 3 and tokens[2].type == "END_CMD":
-                return ast.Import(tokens[1].value)
+                # if len(tokens) == 3 and tokens[2].type == "SEMICOLON":
+                return ast.Import(tokens[1].value, local)
 
             else:
                 raise ParserError(
@@ -158,38 +1989,35 @@ class Parser:
                 tokens = [tokens[0]] + tokens[i:]
 
             if tl[1] == "NAME":
-                if tl[2] == "END_CMD":  # e.g. ?int my_int;
-                    if not tokens[1].value in ast.known_vars:
-                        print("Variable found")
-                        ast.known_vars[tokens[1].value] = ast.Variable(
+                if tl[2] == "SEMICOLON":  # e.g. ?int my_int;
+                    if not tokens[1].value in self.known_vars:
+                        self.known_vars[tokens[1].value] = ast.DefineVariableNovalue(
                             tokens[1].value,
                             tokens[0].value,
-                            local,
                             listdimension,
-                            line,
                             indef,
+                            local,
+                            line,
                         )
-                        return ast.DefineVariableNovalue(
-                            tokens[1].value, tokens[0].value, listdimension, indef
-                        )
+                        return self.known_vars[tokens[1].value]
                     else:
                         raise ParserError(
                             "varoverlap",
                             "This variable seems overlapping with an already existing one ('"
-                            + str(ast.known_vars[tokens[1].value].name)
+                            + str(self.known_vars[tokens[1].value].name)
                             + "', line "
-                            + str(ast.known_vars[tokens[1].value].line)
+                            + str(self.known_vars[tokens[1].value].line)
                             + ")",
                             line,
                         )
                 elif tl[2] == "SET":
-                    if tl[3] == "END_CMD":
+                    if tl[3] == "SEMICOLON":
                         raise ParserError(
                             "nosetvalue",
                             "It looks like you forgot to set a value here or you put in a '=' where you didn't want it.",
                             line,
                         )
-                    elif tl[-1] == "END_CMD":
+                    elif tl[-1] == "SEMICOLON":
                         # print(tokens[3:-1])
                         tree = self.parse_one_of(
                             tokens[3:-1], line, local, [self.parse_value]
@@ -200,29 +2028,24 @@ class Parser:
                             or (indef and tree.type == "null")
                             or tree.type == "emptylist"
                         ):
-                            if not tokens[1].value in ast.known_vars:
-                                ast.known_vars[tokens[1].value] = ast.Variable(
-                                    tokens[1].value,
-                                    tokens[0].value,
-                                    local,
-                                    listdimension,
-                                    line,
-                                    indef,
-                                )
-                                return ast.DefineVariable(
+                            if not tokens[1].value in self.known_vars:
+                                self.known_vars[tokens[1].value] = ast.DefineVariable(
                                     tokens[1].value,
                                     tokens[0].value,
                                     listdimension,
                                     indef,
                                     tree,
+                                    local,
+                                    line,
                                 )
+                                return self.known_vars[tokens[1].value]
                             else:
                                 raise ParserError(
                                     "varoverlap",
                                     "This variable seems overlapping with an already existing one ('"
-                                    + str(ast.known_vars[tokens[1].value].name)
+                                    + str(self.known_vars[tokens[1].value].name)
                                     + "', line "
-                                    + str(ast.known_vars[tokens[1].value].line)
+                                    + str(self.known_vars[tokens[1].value].line)
                                     + ")",
                                     line,
                                 )
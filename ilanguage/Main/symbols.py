@@ -0,0 +1,163 @@
+"""
+I Language symbol table.
+Version: 0.1.1
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import dataclasses
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+from . import _ast as ast
+
+
+###########
+# SYMBOLS #
+###########
+
+
+@dataclasses.dataclass
+class Binding:
+    """
+    Represents a variable bound to a name in a scope.
+    """
+
+    node: ast.DefineVariable
+    scope: int  # Depth of the scope the variable is defined in
+    shadowed: Optional["Binding"] = None  # Binding of the name in an outer scope
+
+
+class SymbolTable:
+    """
+    Represents the variables known while parsing.
+
+    Every name maps to its innermost binding, which links to the binding it shadows.
+    Every scope is a frame of the names defined in it, so defining and looking up a
+    variable takes constant time and leaving a scope only touches the variables
+    defined in it.
+    """
+
+    def __init__(self) -> None:
+        """Initializes a symbol table with only the global scope."""
+
+        self.bindings: Dict[str, Binding] = {}
+        self.frames: List[List[str]] = [[]]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.bindings
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.bindings)
+
+    def __len__(self) -> int:
+        return len(self.bindings)
+
+    @property
+    def depth(self) -> int:
+        """
+        Depth of the current scope, 0 in the global scope.
+        """
+
+        return len(self.frames) - 1
+
+    def push(self) -> None:
+        """Enters a new scope."""
+
+        self.frames.append([])
+
+    def pop(self) -> None:
+        """Leaves the current scope and forgets the variables defined in it.
+
+        The global scope is never left, so an unmatched '}' can not remove it.
+        """
+
+        if len(self.frames) == 1:
+            return
+
+        bindings = self.bindings
+        depth = self.depth
+
+        for name in reversed(self.frames.pop()):
+            binding = bindings.get(name)
+
+            if binding is None or binding.scope != depth:  # Undefined before
+                continue
+            if binding.shadowed is None:
+                del bindings[name]
+            else:
+                bindings[name] = binding.shadowed
+
+    def define(self, node: ast.DefineVariable) -> ast.DefineVariable:
+        """Defines a variable in the current scope.
+
+        Args:
+            node (ast.DefineVariable): Definition of the variable.
+
+        Returns:
+            ast.DefineVariable: The definition.
+        """
+
+        self.bindings[node.name] = Binding(
+            node, self.depth, self.bindings.get(node.name)
+        )
+        self.frames[-1].append(node.name)
+
+        return node
+
+    def undefine(self, name: str) -> None:
+        """Forgets the innermost definition of a variable.
+
+        The definition it shadows is known again. The name stays in the frame of
+        its scope, which is skipped when leaving the scope, so this takes constant
+        time as well.
+
+        Args:
+            name (str): Name of the variable.
+        """
+
+        binding = self.bindings.pop(name, None)
+
+        if binding is not None and binding.shadowed is not None:
+            self.bindings[name] = binding.shadowed
+
+    def lookup(self, name: str) -> Optional[ast.DefineVariable]:
+        """Returns the innermost definition of a variable.
+
+        Args:
+            name (str): Name of the variable.
+
+        Returns:
+            Optional[ast.DefineVariable]: Definition, None if the variable is unknown.
+        """
+
+        binding = self.bindings.get(name)
+
+        return binding.node if binding is not None else None
@@ -0,0 +1,365 @@
+"""
+I Language AST visitors.
+Version: 0.1.2
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from typing_extensions import (
+    Final,
+)
+
+from . import _ast as ast
+
+
+#############
+# CONSTANTS #
+#############
+
+PRUNE: Final[object] = object()  # Returned by visit methods to skip the children
+
+# Attributes mirroring the children of nodes with a fixed number of children, which
+# are updated when the children are replaced
+CHILD_FIELDS: Final[Dict[Type[ast.Node], Tuple[str, ...]]] = {
+    ast.DefineVariable: ("value",),
+    ast.UnaryOperation: ("operand",),
+    ast.BinaryOperation: ("left", "right"),
+    ast.If: ("condition", "body", "orelse"),
+    ast.Return: ("value",),
+    ast.Constant: ("value",),
+    ast.Variable: ("value",),
+}
+# Nodes keeping other data than nodes in their list of children (the conditions of
+# constants and variables), their children are only the attributes above
+DETACHED: Final[Tuple[Type[ast.Node], ...]] = (ast.Constant, ast.Variable)
+
+Method = Optional[Callable[[Any, ast.Node], Any]]
+
+
+###########
+# HELPERS #
+###########
+
+
+def children(node: ast.Node) -> List[Optional[ast.Node]]:
+    """Returns the children of a node.
+
+    Args:
+        node (ast.Node): Parent of the children.
+
+    Returns:
+        List[Optional[ast.Node]]: Children of the node, the list of children itself
+                                  if it only contains nodes.
+    """
+
+    if isinstance(node, DETACHED):
+        return [node.value] if isinstance(node.value, ast.Node) else []
+
+    return node.below
+
+
+def walk(node: Optional[ast.Node]) -> Iterator[ast.Node]:
+    """Returns all nodes of a tree in preorder.
+
+    Args:
+        node (Optional[ast.Node]): Root of the tree.
+
+    Yields:
+        ast.Node: Nodes of the tree, missing nodes are left out.
+    """
+
+    stack = [node]
+
+    while stack:
+        node = stack.pop()
+        if node is not None:
+            yield node
+            stack.extend(reversed(children(node)))
+
+
+def _child_fields(node_class: Type[ast.Node]) -> Tuple[str, ...]:
+    """Returns the attributes mirroring the children of a class of nodes.
+
+    Args:
+        node_class (Type[ast.Node]): Class of the nodes.
+
+    Returns:
+        Tuple[str, ...]: Names of the attributes, empty for nodes with a list of
+                         children.
+    """
+
+    for base in node_class.__mro__:
+        if base in CHILD_FIELDS:
+            return CHILD_FIELDS[base]
+
+    return ()
+
+
+def _single(replacement: Any, place: str) -> Optional[ast.Node]:
+    """Returns the node replacing a node, which can only be replaced by one node.
+
+    Args:
+        replacement (Any): Replacing node, or list of replacing nodes.
+        place (str): Description of the node for the error message.
+
+    Returns:
+        Optional[ast.Node]: The replacement, None if the node was removed.
+
+    Raises:
+        TypeError: If the node is replaced by several nodes.
+    """
+
+    if not isinstance(replacement, list):
+        return replacement
+    if len(replacement) > 1:
+        raise TypeError(f"Can not replace {place} with several nodes")
+
+    return replacement[0] if replacement else None
+
+
+def _replace_children(
+    node: ast.Node,
+    replacements: List[Any],
+    fields: Tuple[str, ...],
+) -> None:
+    """Replaces the children of a node with the results of transforming them.
+
+    Args:
+        node (ast.Node): Parent of the children.
+        replacements (List[Any]): Replacing node, or list of replacing nodes, of
+                                  every child.
+        fields (Tuple[str, ...]): Attributes mirroring the children.
+
+    Raises:
+        TypeError: If a child is replaced by several nodes where only one is
+                   possible.
+    """
+
+    if all(
+        replacement is child
+        for replacement, child in zip(replacements, children(node))
+    ):
+        return
+
+    if isinstance(node, DETACHED):  # Only the attributes are children
+        for field, replacement in zip(fields, replacements):
+            setattr(
+                node,
+                field,
+                _single(replacement, f"a child of {type(node).__name__}"),
+            )
+    elif fields:
+        # Removed children leave a gap, so the remaining ones keep their meaning
+        node.below[:] = [
+            _single(replacement, f"a child of {type(node).__name__}")
+            for replacement in replacements
+        ]
+        for field, child in zip(fields, node.below):
+            setattr(node, field, child)
+    else:
+        # In place, as some nodes keep the list under another name
+        below: List[Optional[ast.Node]] = []
+        for replacement in replacements:
+            if isinstance(replacement, list):
+                below.extend(replacement)
+            else:
+                below.append(replacement)
+        node.below[:] = below
+
+
+############
+# VISITORS #
+############
+
+
+class NodeVisitor:
+    """
+    Base class of passes reading a tree.
+
+    Subclasses define visit_<class name> methods, which are called before the
+    children of a node, and leave_<class name> methods, which are called after
+    them. A node is handled by the methods of its nearest class with methods, so
+    visit_Node handles all nodes without more specific methods. Returning PRUNE
+    from a visit method skips the children and the leave method of the node.
+
+    The tree is traversed with an explicit stack, so trees of any depth can be
+    visited. The methods of every class of nodes are only looked up once per
+    visitor class.
+    """
+
+    _methods: ClassVar[Dict[Type[ast.Node], Tuple[Method, Method, Tuple[str, ...]]]]
+    _methods = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._methods = {}
+
+    @classmethod
+    def _lookup(
+        cls, node_class: Type[ast.Node]
+    ) -> Tuple[Method, Method, Tuple[str, ...]]:
+        """Returns the methods of a class of nodes, adding them to the table.
+
+        Args:
+            node_class (Type[ast.Node]): Class of the nodes.
+
+        Returns:
+            Tuple[Method, Method, Tuple[str, ...]]: The visit and leave methods and
+                                                    the child attributes.
+        """
+
+        methods: List[Method] = []
+
+        for prefix in ("visit_", "leave_"):
+            methods.append(
+                next(
+                    (
+                        getattr(cls, f"{prefix}{base.__name__}")
+                        for base in node_class.__mro__
+                        if hasattr(cls, f"{prefix}{base.__name__}")
+                    ),
+                    None,
+                )
+            )
+
+        cls._methods[node_class] = (methods[0], methods[1], _child_fields(node_class))
+
+        return cls._methods[node_class]
+
+    def visit(self, node: Optional[ast.Node]) -> None:
+        """Visits a tree.
+
+        Args:
+            node (Optional[ast.Node]): Root of the tree.
+        """
+
+        table = self._methods
+        # Nodes to visit, and nodes to leave wrapped in tuples
+        stack: List[Any] = [node]
+        pop, push, extend = stack.pop, stack.append, stack.extend
+
+        while stack:
+            node = pop()
+            if node is None:
+                continue
+            if type(node) is tuple:  # pylint: disable=C0123
+                node = node[0]
+                table[type(node)][1](self, node)  # type: ignore[misc]
+                continue
+
+            enter, leave, _ = table.get(type(node)) or self._lookup(type(node))
+            if enter is not None and enter(self, node) is PRUNE:
+                continue
+            if leave is not None:
+                push((node,))
+            below = children(node)
+            if below:
+                extend(reversed(below))
+
+
+class NodeTransformer(NodeVisitor):
+    """
+    Base class of passes changing a tree.
+
+    The methods are called like the methods of a NodeVisitor, but a leave method
+    returns the node replacing the node it was called with. Returning None removes
+    the node, a list of nodes replaces a node in a list of children with all of
+    them. Nodes without leave methods are kept.
+
+    The children of a node are replaced before its leave method is called, so
+    it sees the transformed children. Attributes mirroring the children (like the
+    left and right operand) are updated with them.
+    """
+
+    def visit(  # type: ignore[override]
+        self, node: Optional[ast.Node]
+    ) -> Optional[ast.Node]:
+        """Transforms a tree.
+
+        Args:
+            node (Optional[ast.Node]): Root of the tree.
+
+        Returns:
+            Optional[ast.Node]: New root of the tree.
+
+        Raises:
+            TypeError: If a node is replaced by several nodes where only one is
+                       possible.
+        """
+
+        table = self._methods
+        # Replacing nodes, lists if a node is removed or replaced by several nodes
+        results: List[Any] = []
+        # Nodes to visit, and nodes to leave with their number of children
+        stack: List[Any] = [node]
+        pop, push, extend = stack.pop, stack.append, stack.extend
+        result = results.append
+
+        while stack:
+            node = pop()
+            if node is None:
+                result(None)
+                continue
+
+            if type(node) is tuple:  # pylint: disable=C0123
+                node, count = node
+                _, leave, fields = table[type(node)]
+                if count:
+                    replacements = results[-count:]
+                    del results[-count:]
+                    _replace_children(node, replacements, fields)
+                if leave is not None:
+                    replacement = leave(self, node)
+                    result(replacement if replacement is not None else [])
+                else:
+                    result(node)
+                continue
+
+            enter, leave, _ = table.get(type(node)) or self._lookup(type(node))
+            if enter is not None and enter(self, node) is PRUNE:
+                result(node)
+                continue
+
+            below = children(node)
+            if below or leave is not None:
+                push((node, len(below)))
+                extend(reversed(below))
+            else:
+                result(node)
+
+        return _single(results[0], "the root")
@@ -0,0 +1,194 @@
+"""
+I Language arena test.
+Version: 0.1.1
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import _ast as ast  # pylint: disable=E0401, C0413
+from Main import _types, arena, lexer, parser  # pylint: disable=E0401, C0413
+
+
+##############
+# ARENA TEST #
+##############
+
+
+def tree(data: str) -> ast.Node:
+    """Parses the data for testing.
+
+    Args:
+        data (str): Data to parse.
+
+    Returns:
+        ast.Node: Parsed tree.
+    """
+
+    return parser.Parser(lexer.lex(data)).parse()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "",
+        "import math;",
+        "int a = 1;\nfloat b = 1.5;",
+        "?string[] a = [];",
+        "int[][] a = [[1, 2], [3]];",
+        "?int a;",
+        "int a = 1;\nbool b = !(a < 2) || a == -1;",
+    ],
+)
+def test_arena_round_trip(data: str) -> None:
+    """Tests converting trees to arenas and back.
+
+    Args:
+        data (str): Data to parse.
+    """
+
+    parsed = tree(data)
+    compact = arena.Arena.from_tree(parsed)
+
+    assert compact.to_tree() == parsed
+    assert compact.view().node() == parsed
+
+
+def test_arena_declarations() -> None:
+    """Tests storing constants, variables and the arguments of nodes."""
+
+    parsed = ast.Main(
+        [
+            ast.Constant("a", 1, 0, conditions=["a > 0"]),
+            ast.Variable(
+                "b",
+                ast.StaticValue("int", "2", arguments={"unit": "m"}),
+                1,
+                _types.Int("2"),
+                ["b < 3", "b != 0"],
+                {"mutable": "yes"},
+            ),
+            ast.Constant("c", "text", 0, _types.String, arguments={"public": "no"}),
+        ]
+    )
+    copy = arena.Arena.from_tree(parsed).to_tree()
+
+    assert copy == parsed
+    assert copy.below[0].value == 1  # type: ignore[union-attr]
+    assert copy.below[1].type.value == "2"  # type: ignore[union-attr]
+    assert copy.below[1].conditions == ["b < 3", "b != 0"]  # type: ignore
+    assert copy.below[2].type is _types.String  # type: ignore[union-attr]
+
+
+def test_arena_control_flow() -> None:
+    """Tests storing blocks, ifs and the statements ending them."""
+
+    parsed = ast.Main(
+        [
+            ast.If(
+                ast.Reference("a"),
+                ast.Block([ast.Return(ast.StaticValue("int", "1"), 1)], 1),
+                ast.If(ast.Reference("b"), ast.Block([ast.Break(1), ast.Continue(1)])),
+            ),
+            ast.Block([ast.Throw("Error", "cause", 1), ast.Throw("Error")]),
+            ast.Return(),
+        ]
+    )
+    copy = arena.Arena.from_tree(parsed).to_tree()
+
+    assert copy == parsed
+    assert copy.below[0].orelse.orelse is None  # type: ignore[union-attr]
+    assert copy.below[1].below[0].cause == "cause"  # type: ignore[union-attr]
+    assert copy.below[1].below[1].cause is None  # type: ignore[union-attr]
+
+
+def test_arena_offsets() -> None:
+    """Tests storing the offsets of operators."""
+
+    copy = arena.Arena.from_tree(tree("int a = -1 + 2;")).to_tree()
+    operation = copy.below[0].value  # type: ignore[union-attr]
+
+    assert (operation.offset, operation.left.offset) == (11, 8)  # type: ignore
+
+
+def test_arena_view() -> None:
+    """Tests the views of the nodes in an arena."""
+
+    compact = arena.Arena.from_tree(tree("import math;\nint a = 1 + 2;"))
+    root = compact.view()
+
+    assert len(compact) == 6
+    assert root.kind == "Main"
+    assert root.parent is None
+    assert [child.kind for child in root.children] == ["Import", "DefineVariable"]
+
+    definition = root.children[1]
+    assert (definition.name, definition.type, definition.line) == ("a", "int", 1)
+    assert definition.parent == root
+
+    operation = definition.children[0]
+    assert (operation.kind, operation.name) == ("BinaryOperation", "PLUS")
+    assert [child.value for child in operation.children] == ["1", "2"]
+    assert operation.children[0].parent == operation
+
+
+def test_arena_shared_strings() -> None:
+    """Tests that equal strings and values are only stored once."""
+
+    compact = arena.Arena.from_tree(tree("int a = 1;\nint b = 1;\nint c = 1;"))
+
+    assert compact.strings.count("int") == 1
+    assert compact.constants == ["1"]
+
+
+def test_arena_unsupported() -> None:
+    """Tests converting trees with unsupported nodes."""
+
+    with pytest.raises(TypeError):
+        arena.Arena.from_tree(ast.Main([ast.Node("a", "Custom")]))
+
+
+def test_arena_deep() -> None:
+    """Tests converting trees deeper than the recursion limit."""
+
+    depth = sys.getrecursionlimit() * 2
+    node: ast.Node = ast.StaticValue("int", "1")
+    for _ in range(depth):
+        node = ast.UnaryOperation("-", node, "int")
+
+    compact = arena.Arena.from_tree(ast.Main([node]))
+    view = compact.view()
+    for _ in range(depth + 1):
+        view = view.children[0]
+
+    assert len(compact) == depth + 2
+    assert view.value == "1"
+    assert compact.to_tree() is not None
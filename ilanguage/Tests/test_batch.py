@@ -0,0 +1,177 @@
+"""
+I Language batch test.
+Version: 0.1.4
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import batch, cache, lexer  # pylint: disable=E0401, C0413
+
+
+######################
+# COLLECT FILES TEST #
+######################
+
+
+def test_collect_files(tmp_path: pathlib.Path) -> None:
+    """Tests collecting files from files and directories.
+
+    Args:
+        tmp_path (pathlib.Path): Directory to write the files to.
+    """
+
+    (tmp_path / "b").mkdir()
+    for name in ["b/nested.ilang", "a.ilang", "b/ignored.txt", "c.ilang"]:
+        (tmp_path / name).write_text("int a = 1;", encoding="utf-8")
+
+    assert batch.collect_files([tmp_path / "c.ilang", tmp_path]) == [
+        str(tmp_path / "c.ilang"),
+        str(tmp_path / "a.ilang"),
+        str(tmp_path / "b" / "nested.ilang"),
+    ]
+
+
+##################
+# RUN BATCH TEST #
+##################
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_batch(jobs: int, tmp_path: pathlib.Path) -> None:
+    """Tests lexing several files in order.
+
+    Args:
+        jobs (int): Number of processes.
+        tmp_path (pathlib.Path): Directory to write the files to.
+    """
+
+    sources = [f"int number{index} = {index};\n" * index for index in range(12)]
+    for index, source in enumerate(sources):
+        (tmp_path / f"{index:02}.ilang").write_text(source, encoding="utf-8")
+
+    result = batch.run_batch([tmp_path, tmp_path / "missing.ilang"], jobs, True)
+
+    assert result.jobs == jobs
+    assert [file.tokens for file in result.files[:-1]] == [
+        [str(token) for token in lexer.lex(source)] for source in sources
+    ]
+    assert result.token_count == sum(len(lexer.lex(source)) for source in sources)
+    assert result.failed == [result.files[-1]]
+    assert "13 files" in result.summary()
+
+
+def test_run_batch_cache(tmp_path: pathlib.Path) -> None:
+    """Tests loading lexer and parser output from the cache.
+
+    Args:
+        tmp_path (pathlib.Path): Directory to write the files and the cache to.
+    """
+
+    storage = cache.Cache(tmp_path / "cache")
+    source = tmp_path / "source.ilang"
+    source.write_text("int number = 1;\nimport math;\n", encoding="utf-8")
+
+    lexed = batch.run_batch([source], 1, cache=storage)
+    parsed = batch.run_batch([source], 1, parse=True, cache=storage)
+    cached = batch.run_batch([source], 1, True, True, storage)
+
+    assert [len(result.cached) for result in (lexed, parsed, cached)] == [0, 0, 1]
+    assert cached.files[0].tokens == [
+        str(token) for token in lexer.lex(source.read_text(encoding="utf-8"))
+    ]
+
+    source.write_text("int number = 1;\nint number = 2;\n", encoding="utf-8")
+    failed = batch.run_batch([source], 1, parse=True, cache=storage)
+
+    assert failed.failed[0].error is None
+    assert "VAROVERLAP" in failed.failed[0].diagnostics[0]
+
+
+def test_run_batch_diagnostics(tmp_path: pathlib.Path) -> None:
+    """Tests reporting all lexer problems of all files.
+
+    Args:
+        tmp_path (pathlib.Path): Directory to write the files to.
+    """
+
+    (tmp_path / "a.ilang").write_text('int 1a = 1;\nstring b = "', encoding="utf-8")
+    (tmp_path / "b.ilang").write_text("int b = 1;", encoding="utf-8")
+
+    result = batch.run_batch([tmp_path], 1)
+
+    assert [file.diagnostics for file in result.files] == [
+        [
+            "Unrecognized Pattern: '1a' in line 1, column 5",
+            "Unclosed string in line 2, column 12",
+        ],
+        [],
+    ]
+    assert result.failed == result.files[:1]
+
+
+def test_run_batch_parser_errors(tmp_path: pathlib.Path) -> None:
+    """Tests reporting all parser errors of a file.
+
+    Args:
+        tmp_path (pathlib.Path): Directory to write the file to.
+    """
+
+    (tmp_path / "a.ilang").write_text(
+        "int a = 1;\nint a = 2;\nimport ;\nint b = 3;", encoding="utf-8"
+    )
+
+    result = batch.run_batch([tmp_path], 1, parse=True)
+    diagnostics = result.files[0].diagnostics
+
+    assert len(diagnostics) == 2
+    assert "VAROVERLAP" in diagnostics[0] and "(line 2)" in diagnostics[0]
+    assert "NOTANAME" in diagnostics[1] and "(line 3)" in diagnostics[1]
+
+
+def test_run_batch_parallel_parse(tmp_path: pathlib.Path) -> None:
+    """Tests parsing the statements of files in parallel.
+
+    Args:
+        tmp_path (pathlib.Path): Directory to write the files to.
+    """
+
+    (tmp_path / "a.ilang").write_text(
+        "int a = 1;\nint a = 2;\nimport ;\nint b = 3;", encoding="utf-8"
+    )
+    (tmp_path / "b.ilang").write_text("int b = 1;\nimport math;", encoding="utf-8")
+
+    serial = batch.run_batch([tmp_path], 1, parse=True)
+    parallel = batch.run_batch([tmp_path], 2, parse=True, parallel_parse=True)
+
+    assert [file.diagnostics for file in parallel.files] == [
+        file.diagnostics for file in serial.files
+    ]
@@ -0,0 +1,179 @@
+"""
+I Language binary AST format test.
+Version: 0.1.1
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import _ast as ast  # pylint: disable=E0401, C0413
+from Main import arena, binary, lexer, parser  # pylint: disable=E0401, C0413
+from Main import optimizer  # pylint: disable=E0401, C0413
+
+
+###############
+# BINARY TEST #
+###############
+
+SOURCE = (
+    'import math;\nint a = 1 + 2;\n?string[] b = ["ä", "c"];\nimport os;\nfloat d;'
+)
+
+
+def tree(data: str) -> ast.Node:
+    """Parses the data for testing.
+
+    Args:
+        data (str): Data to parse.
+
+    Returns:
+        ast.Node: Parsed tree.
+    """
+
+    return parser.Parser(lexer.lex(data)).parse()
+
+
+@pytest.mark.parametrize("data", ["", "import math;", SOURCE])
+def test_binary_round_trip(data: str) -> None:
+    """Tests encoding and decoding trees.
+
+    Args:
+        data (str): Data to parse.
+    """
+
+    parsed = tree(data)
+    encoded = binary.dumps(parsed)
+
+    assert encoded.startswith(binary.MAGIC)
+    assert binary.loads(encoded).to_tree() == parsed
+    assert binary.dumps(binary.loads(encoded)) == encoded
+    assert binary.dumps(arena.Arena.from_tree(parsed)) == encoded
+
+
+def test_binary_declarations() -> None:
+    """Tests encoding constants, variables and the offsets of operators."""
+
+    parsed = tree("int a = 1 + 2;")
+    parsed.below.append(ast.Constant("b", ast.Reference("a"), 0, conditions=["b"]))
+    parsed.below.append(ast.Variable("c", 1.5, 0, arguments={"unit": "m"}))
+    loaded = binary.loads(binary.dumps(parsed)).to_tree()
+
+    assert loaded == parsed
+    assert loaded.below[0].value.offset == 10  # type: ignore[union-attr]
+
+
+def test_binary_optimized() -> None:
+    """Tests encoding optimized trees with control flow and declarations."""
+
+    parsed = ast.Main(
+        [
+            ast.Constant("a", ast.StaticValue("int", "1"), 0, conditions=["a > 0"]),
+            ast.If(
+                ast.Reference("b"),
+                ast.Block([ast.Return(ast.Reference("a"))]),
+                ast.If(ast.StaticValue("bool", "false"), ast.Block([ast.Break()])),
+            ),
+            ast.Throw("Error", "cause"),
+        ]
+    )
+    optimized = optimizer.optimize(parsed).tree
+    loaded = binary.loads(binary.dumps(optimized)).to_tree()  # type: ignore
+
+    assert loaded == optimized
+    assert loaded.below[-1].cause == "cause"  # type: ignore[union-attr]
+
+
+def test_binary_file(tmp_path: pathlib.Path) -> None:
+    """Tests writing and mapping files.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+
+    parsed = tree(SOURCE)
+    path = tmp_path / "program.iast"
+    binary.dump(parsed, path)
+    loaded = binary.load(path)
+
+    assert [child.kind for child in loaded.view().children] == [
+        "Import",
+        "DefineVariable",
+        "DefineVariable",
+        "Import",
+        "DefineVariableNovalue",
+    ]
+    assert loaded.to_tree() == parsed
+
+
+def test_binary_imports() -> None:
+    """Tests that reading the imports only decodes their names."""
+
+    loaded = binary.loads(binary.dumps(tree(SOURCE)))
+
+    assert binary.imports(loaded) == ["math", "os"]
+    assert sorted(loaded.strings._strings.values()) == ["math", "os"]  # type: ignore
+    assert not loaded.constants._strings  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "change, message",
+    [
+        (lambda data: data[:10], "Truncated"),
+        (lambda data: data[:-20], "Truncated"),
+        (lambda data: b"XXXX" + data[4:], "Not an AST file"),
+        (lambda data: data[:4] + bytes([99]) + data[5:], "version 99"),
+        (lambda data: data[:5] + bytes([7]) + data[6:], "byte order"),
+    ],
+)
+def test_binary_invalid(change, message: str) -> None:
+    """Tests decoding invalid data.
+
+    Args:
+        change (Callable[[bytes], bytes]): Change of the valid data.
+        message (str): Part of the error message.
+    """
+
+    with pytest.raises(ValueError, match=message):
+        binary.loads(change(binary.dumps(tree(SOURCE))))
+
+
+def test_binary_empty_file(tmp_path: pathlib.Path) -> None:
+    """Tests mapping an empty file.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+
+    path = tmp_path / "empty.iast"
+    path.write_bytes(b"")
+
+    with pytest.raises(ValueError):
+        binary.load(path)
@@ -0,0 +1,150 @@
+"""
+I Language cache test.
+Version: 0.1.0
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import os
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import _ast as ast  # pylint: disable=E0401, C0413
+from Main import batch, cache, lexer  # pylint: disable=E0401, C0413
+
+
+##############
+# CACHE TEST #
+##############
+
+
+def test_cache(tmp_path: pathlib.Path) -> None:
+    """Tests storing and loading cache entries.
+
+    Args:
+        tmp_path (pathlib.Path): Directory of the cache.
+    """
+
+    source = 'import math;\nstring name = "Grüße";\nint[] numbers = [1, 2];\n'.encode()
+    entry = batch.process_source(source)
+    storage = cache.Cache(tmp_path)
+
+    assert storage.load(source) is None
+
+    storage.store(source, entry)
+    loaded = storage.load(source)
+
+    assert loaded is not None
+    assert list(loaded.tokens) == list(entry.tokens)
+    assert [token.offset for token in loaded.tokens] == [
+        token.offset for token in entry.tokens
+    ]
+    assert loaded.tree == entry.tree
+    assert storage.load(source + b" ") is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_cache_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests cache keys depend on the source and the versions.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Fixture to change the lexer version.
+    """
+
+    key = cache.Cache.key(b"int a = 1;")
+
+    assert cache.Cache.key(b"int a = 1;") == key
+    assert cache.Cache.key(b"int a = 2;") != key
+
+    monkeypatch.setattr(lexer, "__version__", "0.0.0")
+
+    assert cache.Cache.key(b"int a = 1;") != key
+
+    changed = cache.Cache.key(b"int a = 1;")
+    monkeypatch.setattr(ast, "__version__", "0.0.0")
+
+    assert cache.Cache.key(b"int a = 1;") != changed
+
+
+def test_cache_diagnostics(tmp_path: pathlib.Path) -> None:
+    """Tests storing the problems and errors of a source.
+
+    Args:
+        tmp_path (pathlib.Path): Directory of the cache.
+    """
+
+    source = b'int a = 1;\nint a = 2;\nstring b = "open'
+    entry = batch.process_source(source)
+    storage = cache.Cache(tmp_path)
+    storage.store(source, entry)
+    loaded = storage.load(source)
+
+    assert loaded is not None
+    assert loaded.diagnostics == entry.diagnostics
+    assert loaded.errors == entry.errors
+    assert loaded.tree == entry.tree
+    assert b"VAROVERLAP" in storage.path(storage.key(source)).read_bytes()
+
+
+def test_cache_corrupt(tmp_path: pathlib.Path) -> None:
+    """Tests corrupt entries are ignored.
+
+    Args:
+        tmp_path (pathlib.Path): Directory of the cache.
+    """
+
+    storage = cache.Cache(tmp_path)
+    storage.path(storage.key(b"int a = 1;")).write_bytes(b"corrupt")
+
+    assert storage.load(b"int a = 1;") is None
+
+
+def test_cache_evict(tmp_path: pathlib.Path) -> None:
+    """Tests evicting the least recently used entries.
+
+    Args:
+        tmp_path (pathlib.Path): Directory of the cache.
+    """
+
+    storage = cache.Cache(tmp_path)
+    sources = [f"int number = {index};".encode() for index in range(4)]
+
+    for index, source in enumerate(sources):
+        storage.store(source, batch.process_source(source, parse=False))
+        os.utime(storage.path(storage.key(source)), (index, index))
+
+    storage.load(sources[0])  # Uses the oldest entry
+    size = storage.path(storage.key(sources[0])).stat().st_size
+    storage.max_size = size * 2
+
+    assert storage.evict() == 2
+    assert storage.load(sources[0]) is not None
+    assert storage.load(sources[1]) is None
+    assert storage.load(sources[2]) is None
+    assert storage.load(sources[3]) is not None
@@ -0,0 +1,118 @@
+"""
+I Language compilation context test.
+Version: 0.1.1
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import concurrent.futures
+import pathlib
+import sys
+from typing import (
+    Any,
+)
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import _errors, batch, context, lexer, parser  # pylint: disable=E0401, C0413
+from Main.options import options  # pylint: disable=E0401, C0413
+
+
+################
+# CONTEXT TEST #
+################
+
+
+def compile_source(source: str) -> Any:
+    """Compiles a source with a new context.
+
+    Args:
+        source (str): Source to compile.
+
+    Returns:
+        Any: Parse tree and diagnostics of the source or the name of the error.
+    """
+
+    try:
+        entry = batch.process_source(source.encode())
+    except parser.ParserError as error:
+        return error.name
+
+    return entry.tree, entry.diagnostics
+
+
+def test_context_threads() -> None:
+    """Tests compiling in parallel threads returns the same results as serially."""
+
+    sources = [
+        f"int a{index} = {index};\n?string b;\nfloat[] c = [1.5, {index}.5];\n"
+        + ("int b = 1;" if index % 3 == 0 else "")  # Error
+        + ("/* unclosed" if index % 5 == 0 else "")  # Diagnostic
+        for index in range(200)
+    ]
+    expected = [compile_source(source) for source in sources]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(5):
+            assert list(executor.map(compile_source, sources)) == expected
+
+
+def test_context_isolated() -> None:
+    """Tests contexts do not share any state."""
+
+    first, second = context.CompilationContext(), context.CompilationContext()
+    first.options["exit_zero"] = True
+
+    assert not second.options["exit_zero"]
+    assert not options["exit_zero"]
+    assert first.symbols is not second.symbols
+
+
+def test_context_current() -> None:
+    """Tests errors use the options of the current context."""
+
+    compilation = context.CompilationContext()
+    compilation.options["exit_zero"] = True
+
+    with compilation.activate():
+        assert context.current() is compilation
+
+        with pytest.raises(SystemExit) as error:
+            _errors.Error("Test")
+
+    assert error.value.code == 0
+    assert context.current() is not compilation
+
+
+def test_parse_default_start() -> None:
+    """Tests every parse without a start node returns a new tree."""
+
+    first = parser.Parser(lexer.lex("int a = 1;")).parse()
+    second = parser.Parser(lexer.lex("int b = 1;")).parse()
+
+    assert first is not second
+    assert len(first.below) == len(second.below) == 1
@@ -0,0 +1,119 @@
+"""
+I Language grammar test.
+Version: 0.1.1
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import grammar, lexer  # pylint: disable=E0401, C0413
+
+
+################
+# GRAMMAR TEST #
+################
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ("import math;", "IMPORT"),
+        ("?int a = 1;", "VARIABLE"),
+        ("const pi = 3.14;", "CONSTANT"),
+        ("private function f(a = 1) {\nreturn a;\n};", "FUNCTION"),
+        ("if (a) {\nb;\n}", "IF"),
+        ("} else {\nb;\n};", "ELSE"),
+        ("try {\n} catch (e) {\n};", "TRY"),
+        ("while (a) {\n{\n}\n};", "WHILE"),
+        ("break;", "BREAK"),
+        ("if (a) {\nb;", None),
+        ("if (a) {\n}\n}", None),
+        ("a = 1;", None),
+        ("", None),
+    ],
+)
+def test_classify(data: str, expected: str) -> None:
+    """Tests classifying statements by their tokens.
+
+    Args:
+        data (str): Data to test.
+        expected (str): Expected kind.
+    """
+
+    assert grammar.classify(lexer.lex(data)) == expected
+    assert grammar.classify(lexer.lex(data, compact=True)) == expected
+
+
+@pytest.mark.parametrize(
+    "kind, data, expected",
+    [
+        ("IMPORT", "import a,,b;", False),
+        ("IMPORT", "import a,b from c as d;", True),
+        ("FUNCTION", "function f(a = 1, b = 2) {\nreturn;\n};", True),
+        ("IF", "if (a {b}) {\nc;\n}", True),
+        ("TRY", "try {\na;\n} b} catch (e) {\n}};", True),
+        ("TRY", "try {\na;\n} catch (e) {}", False),
+        ("TRY", "try {\na;\n} catch (e) {\nif (b) {\nc;\n}\n}", True),
+        ("TRY", "try {\na;\n} catch (e) {\n{\n}\n};", True),
+    ],
+)
+def test_match(kind: str, data: str, expected: bool) -> None:
+    """Tests matching statements with the patterns of their kind.
+
+    Args:
+        kind (str): Kind to match.
+        data (str): Data to test.
+        expected (bool): If the statement should match.
+    """
+
+    assert (grammar.match(kind, data) is not None) == expected
+
+
+def test_match_linear() -> None:
+    """Tests statements, which backtracked exponentially before, are matched."""
+
+    assert grammar.match("FUNCTION", "function f(" + "a=1" * 10_000 + " {") is None
+    assert grammar.match("IMPORT", "import " + "a" * 100_000 + "!") is None
+    assert grammar.match("IF", "if " + "{" * 100_000) is None
+    assert grammar.match("TRY", "try {" + "} catch x" * 100_000) is None
+
+
+def test_match_groups() -> None:
+    """Tests the groups of the patterns keep their numbers."""
+
+    statement = grammar.match("TRY", "try {\na;\n} catch (e) {\nif (b) {\nc;\n}\n};")
+
+    assert statement is not None
+    assert statement.group(1, 4, 7, 9) == ("\na;\n", "e) ", "\nif (b) {\nc;\n}\n", ";")
+    assert grammar.match("IF", "if (a) {\nb;\n};").group(5, 7) == (  # type: ignore
+        "\nb;\n",
+        ";",
+    )
@@ -1,6 +1,6 @@
 """
 I Language lexer test.
-Version: 0.1.1
+Version: 0.1.5
 
 Copyright (c) 2023-present I Language Development.
 
@@ -28,10 +28,12 @@ DEALINGS IN THE SOFTWARE.
 # IMPORTS #
 ###########
 
+import io
 import pathlib
 import sys
 from typing import (
     List,
+    Tuple,
 )
 
 import pytest
@@ -185,19 +187,332 @@ def test_lexer_token() -> None:
         ),
     ],
 )
-def test_lex(data: str, expected: List[lexer.LexerToken]) -> None:
+@pytest.mark.parametrize("legacy", [False, True])
+def test_lex(data: str, expected: List[lexer.LexerToken], legacy: bool) -> None:
     """Tests lexer function.
 
     Args:
         data (str): Data to test.
         expected (list[lexer.LexerToken]): Expected tokens.
+        legacy (bool): Whether to use the legacy lexer.
     """
 
-    assert [str(token) for token in lexer.lex(data)] == [
+    assert [str(token) for token in lexer.lex(data, legacy)] == [
         str(token) for token in expected
     ]
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        'string name = "Hello world";\nint number = 1;\n',
+        "/* a // b */ c\n*/ d",
+        "/*/ name",
+        'name"string" "http://example.com"\nnext',
+        "a&b && c | d || e",
+        "int integer = 1abc;",
+        "\n\nfloat number = 1.2;",
+        "?string[] names = [];",
+    ],
+)
+def test_lex_engines(data: str) -> None:
+    """Tests the table lexer creates the same tokens as the legacy lexer.
+
+    Args:
+        data (str): Data to test.
+    """
+
+    assert [str(token) for token in lexer.lex(data)] == [
+        str(token) for token in lexer.lex(data, legacy=True)
+    ]
+
+
+def test_lex_floats() -> None:
+    """Tests the table lexer keeps the order of several floats."""
+
+    assert [str(token) for token in lexer.lex("1.2 + 3.4;")] == [
+        str(lexer.LexerToken("FLOAT", "1.2")),
+        str(lexer.LexerToken("PLUS", "+")),
+        str(lexer.LexerToken("FLOAT", "3.4")),
+        str(lexer.LexerToken("SEMICOLON", ";")),
+    ]
+
+
+#################
+# ITER LEX TEST #
+#################
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64])
+@pytest.mark.parametrize(
+    "data",
+    [
+        'string name = "Hello world";\nint number = 1;\n',
+        "/* multiline\ncomment */ name && other; // comment\nfloat number = 1.2;",
+        "/* a // b */ c\n*/ d /*/ e",
+        'name"string" "http://example.com"\nnext',
+        "a&b && c | d || e == f != g <= h >= i++ j--",
+        "\n\n1.2 3.4 a.5",
+    ],
+)
+def test_iter_lex(data: str, chunk_size: int) -> None:
+    """Tests lexing a stream in chunks creates the same tokens as lexing a string.
+
+    Args:
+        data (str): Data to test.
+        chunk_size (int): Number of characters to read at once.
+    """
+
+    assert [str(token) for token in lexer.iter_lex(io.StringIO(data), chunk_size)] == [
+        str(token) for token in lexer.lex(data)
+    ]
+
+
+#####################
+# TOKEN BUFFER TEST #
+#####################
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        'string name = "Hello world";\nint number = 1;\n',
+        "/* multiline\ncomment */ name && other; // comment\nfloat number = 1.2;",
+        'name/* comment */other name"string" 1 . 2',
+        "",
+    ],
+)
+def test_token_buffer(data: str) -> None:
+    """Tests token buffers contain the same tokens as token lists.
+
+    Args:
+        data (str): Data to test.
+    """
+
+    buffer = lexer.lex(data, compact=True)
+
+    assert isinstance(buffer, lexer.TokenBuffer)
+    assert len(buffer) == len(lexer.lex(data))
+    assert list(buffer) == lexer.lex(data)
+    assert [str(token) for token in buffer] == [str(token) for token in lexer.lex(data)]
+
+
+def test_token_buffer_indexing() -> None:
+    """Tests indexing token buffers."""
+
+    buffer = lexer.lex('string name = "Hello";', compact=True)
+
+    assert buffer.kinds[0] == lexer.TOKEN_KINDS["BASETYPE"]  # type: ignore[union-attr]
+    assert buffer[3].value == "Hello"
+    assert buffer[-1].type == "SEMICOLON"
+
+    with pytest.raises(IndexError):
+        buffer[5]  # pylint: disable=W0104
+
+    with pytest.raises(ValueError):
+        lexer.lex("", legacy=True, compact=True)
+
+
+###################
+# LINE INDEX TEST #
+###################
+
+
+@pytest.mark.parametrize(
+    "offset, expected",
+    [(0, (1, 1)), (3, (1, 4)), (4, (2, 1)), (5, (3, 1)), (9, (3, 5)), (15, (4, 1))],
+)
+def test_line_index(offset: int, expected: Tuple[int, int]) -> None:
+    """Tests looking up lines and columns of offsets.
+
+    Args:
+        offset (int): Offset in the source.
+        expected (Tuple[int, int]): Expected line and column.
+    """
+
+    source = "int\n\nname = 1;\n"
+    chunked = lexer.LineIndex()
+    for character in source:
+        chunked.add(character)
+
+    assert lexer.LineIndex(source).position(offset) == expected
+    assert chunked.position(offset) == expected
+
+
+def test_token_positions() -> None:
+    """Tests the positions of lexed tokens."""
+
+    source = '/* comment\n */ int number = 1.5;\nstring name = "a";'
+    lines = lexer.LineIndex(source)
+    buffer = lexer.lex(source, compact=True)
+
+    assert [lines.position(token.offset) for token in lexer.lex(source)] == [
+        (2, 5),
+        (2, 9),
+        (2, 16),
+        (2, 18),
+        (2, 21),
+        (2, 22),
+        (3, 1),
+        (3, 8),
+        (3, 13),
+        (3, 15),
+        (3, 18),
+    ]
+    assert [(token.line, token.column) for token in buffer] == [
+        lines.position(token.offset) for token in lexer.lex(source)
+    ]
+
+
+##############
+# RELEX TEST #
+##############
+
+
+@pytest.mark.parametrize(
+    "data, offset, removed, inserted",
+    [
+        ("int a = 1;\nint b = 2;\nint c = 3;\n", 15, 1, "bc"),
+        ("int a = 1;\nint b = 2;\nint c = 3;\n", 0, 0, "\n"),
+        ("int a = 1;\nint b = 2;\nint c = 3;\n", 14, 0, '"'),
+        ('string a = "x\ny";\nint b = 2;\nint c = 3;', 12, 1, "/*"),
+        ("float a = 1 ;\nint b = 2;\nint c = 3;", 11, 1, ".5"),
+        ("name/* comment */ other;\nint b = 2;", 17, 1, "x"),
+        ("int a = 1;", 10, 0, "\nint b = 2;"),
+    ],
+)
+def test_relex(data: str, offset: int, removed: int, inserted: str) -> None:
+    """Tests re-lexing an edited token buffer.
+
+    Args:
+        data (str): Data to test.
+        offset (int): Offset of the edit.
+        removed (int): Number of removed characters.
+        inserted (str): Inserted text.
+    """
+
+    old = lexer.lex(data, compact=True)
+    source = data[:offset] + inserted + data[offset + removed :]
+    expected = lexer.lex(source, compact=True)
+    delta = len(inserted) - removed
+
+    assert isinstance(old, lexer.TokenBuffer)
+    assert isinstance(expected, lexer.TokenBuffer)
+
+    edit = lexer.relex(old, offset, removed, inserted)
+
+    assert edit.buffer.source == source
+    assert list(edit.buffer) == list(expected)
+    assert list(edit.buffer.starts) == list(expected.starts)
+    assert list(edit.buffer.ends) == list(expected.ends)
+    assert list(edit.buffer)[: edit.start] == list(old)[: edit.start]
+    assert list(edit.buffer.starts[edit.new_end :]) == [
+        start + delta for start in old.starts[edit.old_end :]
+    ]
+
+
+################
+# RECOVER TEST #
+################
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ("int a = 1;", []),
+        (
+            "int 1abc = 2;\n2x;",
+            [("UNRECOGNIZED_PATTERN", 4), ("UNRECOGNIZED_PATTERN", 14)],
+        ),
+        ('string a = "text', [("UNCLOSED_STRING", 11)]),
+        ("int a; /* comment", [("UNCLOSED_COMMENT", 7)]),
+        ("/* comment */ /* // */", [("UNCLOSED_COMMENT", 14)]),
+        ('"a /* b', [("UNCLOSED_STRING", 0), ("UNCLOSED_COMMENT", 3)]),
+        ("name/* comment", [("UNCLOSED_COMMENT", 4)]),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_lex_recover(
+    data: str,
+    expected: List[Tuple[str, int]],
+    chunk_size: int,
+) -> None:
+    """Tests collecting all problems while lexing.
+
+    Args:
+        data (str): Data to test.
+        expected (List[Tuple[str, int]]): Expected kinds and offsets of the problems.
+        chunk_size (int): Chunk size to lex the data with.
+    """
+
+    result = lexer.lex(data, recover=True)
+    diagnostics: List[lexer.Diagnostic] = []
+    tokens = list(lexer.iter_lex(io.StringIO(data), chunk_size, diagnostics))
+
+    assert isinstance(result, lexer.LexResult)
+    assert result.tokens == lexer.lex(data)
+    assert tokens == lexer.lex(data)
+    assert [(item.kind, item.offset) for item in result.diagnostics] == expected
+    assert diagnostics == result.diagnostics
+
+
+def test_lex_recover_format() -> None:
+    """Tests formatting problems found while lexing."""
+
+    result = lexer.lex("int a = 1;\nint 2b = 2;", compact=True, recover=True)
+
+    assert isinstance(result, lexer.LexResult)
+    assert isinstance(result.tokens, lexer.TokenBuffer)
+    assert [result.format(item) for item in result.diagnostics] == [
+        "Error: Unrecognized Pattern: '2b' in line 2, column 5"
+    ]
+    assert result.lines is result.lines  # Only indexed once
+
+    with pytest.raises(ValueError):
+        lexer.lex("", legacy=True, recover=True)
+
+
+#################
+# LEX FILE TEST #
+#################
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        'string name = "Grüße, 世界";\nint number = 1;\n',
+        "/* ümlaut\ncomment */ náme && other; // çomment\nfloat number = 1.2;",
+        'name/* comment */other name"string" 1 . 2 "',
+        "",
+    ],
+)
+def test_lex_file(data: str, tmp_path: pathlib.Path) -> None:
+    """Tests lexing memory-mapped files.
+
+    Args:
+        data (str): Data to test.
+        tmp_path (pathlib.Path): Directory to write the file to.
+    """
+
+    path = tmp_path / "test.ilang"
+    path.write_bytes(data.encode())
+    buffer = lexer.lex_file(path)
+    tokens = lexer.lex(data)
+
+    assert list(buffer) == tokens
+    offsets = [token.offset for token in tokens]  # type: ignore[union-attr]
+
+    assert [token.offset for token in buffer] == [
+        len(data[:offset].encode()) for offset in offsets
+    ]
+    assert [token.line for token in buffer] == [
+        lexer.LineIndex(data).position(offset)[0] for offset in offsets
+    ]
+
+    with pytest.raises(ValueError):
+        lexer.relex(buffer, 0, 0, " ")
+
+
 #################
 # GETTOKEN TEST #
 #################
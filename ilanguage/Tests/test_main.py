@@ -0,0 +1,95 @@
+"""
+I Language command line test.
+Version: 0.1.0
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import os
+import pathlib
+import subprocess
+import sys
+from typing import (
+    List,
+)
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import cache  # pylint: disable=E0401, C0413
+
+
+#############
+# CONSTANTS #
+#############
+
+ROOT = pathlib.Path(__file__).parent.parent.parent  # Directory of the package
+
+
+############
+# CLI TEST #
+############
+
+
+def run(*arguments: str) -> subprocess.CompletedProcess:
+    """Runs the command line interface.
+
+    Args:
+        *arguments (str): Arguments of the command.
+
+    Returns:
+        subprocess.CompletedProcess: The finished process with its output.
+    """
+
+    return subprocess.run(
+        [sys.executable, "-m", "ilanguage", *arguments],
+        cwd=ROOT,
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+
+
+def test_single_file_cache(tmp_path: pathlib.Path) -> None:
+    """Tests loading the output of a single file from the cache.
+
+    Args:
+        tmp_path (pathlib.Path): Directory to write the file and the cache to.
+    """
+
+    source = tmp_path / "source.ilang"
+    source.write_bytes(b"int a = 1;\nimport math;\nint 2b = 2;\n")
+    arguments: List[str] = [str(source), "--parse", "--cache-dir", str(tmp_path)]
+
+    stored = run(*arguments)
+    entry = cache.Cache(tmp_path).path(cache.Cache.key(source.read_bytes()))
+    status = entry.stat()
+    os.utime(entry, (0, 0))  # Loading marks the entry as recently used
+    loaded = run(*arguments)
+
+    assert (stored.returncode, loaded.returncode) == (1, 1)
+    assert loaded.stdout == stored.stdout == run(*arguments[:2], "--no-cache").stdout
+    assert "'2b' in line 3, column 5" in loaded.stdout
+    assert entry.stat().st_ino == status.st_ino  # Not stored again
+    assert entry.stat().st_mtime > 0
@@ -0,0 +1,425 @@
+"""
+I Language optimizer test.
+Version: 0.1.3
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import pathlib
+import sys
+from typing import (
+    List,
+    Optional,
+)
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import _ast as ast  # pylint: disable=E0401, C0413
+from Main import lexer, optimizer, parser  # pylint: disable=E0401, C0413
+
+
+##################
+# OPTIMIZER TEST #
+##################
+
+
+def folded(data: str) -> List[Optional[ast.Node]]:
+    """Parses the data and folds its constants.
+
+    Args:
+        data (str): Data to parse.
+
+    Returns:
+        List[Optional[ast.Node]]: Values of the definitions.
+    """
+
+    tree = parser.Parser(lexer.lex(data)).parse()
+    tree = optimizer.fold_constants(tree, lexer.LineIndex(data))
+
+    return [statement.value for statement in tree.below]  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "data, expected_type, expected",
+    [
+        ("int a = 1 + 2 * 3;", "int", "7"),
+        ("int a = (1 + 2) * 3;", "int", "9"),
+        ("int a = 7 / 2;", "int", "3"),
+        ("int a = -7 / 2;", "int", "-3"),
+        ("int a = -7 % 2;", "int", "-1"),
+        ("float a = 7 / 2.0;", "float", "3.5"),
+        ("float a = 5.5 % 2;", "float", "1.5"),
+        ("float a = -1.5;", "float", "-1.5"),
+        ("bool a = 1 < 2 && !false;", "bool", "true"),
+        ("bool a = 1 == 1.0;", "bool", "true"),
+        ("bool a = true || false == true;", "bool", "true"),
+        ('bool a = "a" < "b";', "bool", "true"),
+        ('string a = "a" + "b";', "string", "ab"),
+        ("int a = 9223372036854775806 + 1;", "int", "9223372036854775807"),
+    ],
+)
+def test_fold_constants(data: str, expected_type: str, expected: str) -> None:
+    """Tests folding operations on literals.
+
+    Args:
+        data (str): Data to parse.
+        expected_type (str): Expected type of the value.
+        expected (str): Expected text of the value.
+    """
+
+    value = folded(data)[0]
+
+    assert isinstance(value, ast.StaticValue)
+    assert (value.type, value.value) == (expected_type, expected)
+    assert optimizer.literal_value(value) == optimizer.CONVERTERS[expected_type](
+        expected
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "int a = 1;\nint b = a + 1;",
+        'dynamic a = 1 + "a";',
+        "dynamic a = true + 1;",
+        'string a = "a\\" + "b";',
+    ],
+)
+def test_fold_constants_unchanged(data: str) -> None:
+    """Tests keeping operations, which can not be evaluated at compile time.
+
+    Args:
+        data (str): Data to parse.
+    """
+
+    assert isinstance(folded(data)[-1], ast.BinaryOperation)
+
+
+def test_fold_constants_parsed() -> None:
+    """Tests replacing references to constants defined in the source."""
+
+    data = "const int c = 3;\nint a = (1 + 2) * c;\nint b = c;"
+
+    assert folded(data) == [
+        ast.StaticValue("int", "3"),
+        ast.StaticValue("int", "9"),
+        ast.StaticValue("int", "3"),
+    ]
+    assert optimizer.optimize(
+        parser.Parser(lexer.lex(data)).parse()
+    ).folded == 4  # 3 * c and both references
+
+
+def test_fold_constants_references() -> None:
+    """Tests replacing references to constants by their value."""
+
+    tree = ast.Main(
+        [
+            ast.Constant(
+                "a",
+                ast.BinaryOperation(
+                    "PLUS",
+                    ast.StaticValue("int", "1"),
+                    ast.StaticValue("int", "2"),
+                    "int",
+                ),
+                0,
+            ),
+            ast.DefineVariable(
+                "b",
+                "int",
+                0,
+                False,
+                ast.BinaryOperation(
+                    "MULTIPLY", ast.Reference("a"), ast.StaticValue("int", "2"), None
+                ),
+            ),
+            ast.DefineVariableNovalue("a", "int", 0, False),
+            ast.DefineVariable("c", "int", 0, False, ast.Reference("a")),
+        ]
+    )
+    folder = optimizer.ConstantFolder()
+    folder.visit(tree)
+
+    assert tree.below[0].value == ast.StaticValue("int", "3")  # type: ignore
+    assert tree.below[1].value == ast.StaticValue("int", "6")  # type: ignore
+    assert tree.below[3].value == ast.Reference("a")  # type: ignore
+    assert folder.folded == 3
+
+
+@pytest.mark.parametrize(
+    "data, code, message",
+    [
+        ("int a = 1;\nint b = (2 + 3) / (1 - 1);", 17, "in line 2 column 17"),
+        ("int a = 1 % 0;", 17, "in line 1 column 11"),
+        ("float a = 1.5 / 0.0;", 17, "in line 1 column 15"),
+        ("int a = 9223372036854775807 + 1;", 24, "in line 1 column 29"),
+        ("int a = -(-9223372036854775807 - 1);", 24, "in line 1 column 9"),
+        ("int a = 4294967296 * 4294967296;", 24, "in line 1 column 20"),
+    ],
+)
+def test_fold_constants_errors(
+    data: str, code: int, message: str, capsys: pytest.CaptureFixture
+) -> None:
+    """Tests reporting errors of operations at compile time.
+
+    Args:
+        data (str): Data to parse.
+        code (int): Expected exit code.
+        message (str): Expected position in the error message.
+        capsys (pytest.CaptureFixture): Captured output.
+    """
+
+    with pytest.raises(SystemExit) as error:
+        folded(data)
+
+    assert error.value.code == code
+    assert message in capsys.readouterr().out
+
+
+def test_fold_constants_scopes() -> None:
+    """Tests forgetting constants at the end of their block and when shadowed."""
+
+    tree = ast.Main(
+        [
+            ast.Variable("c", ast.StaticValue("int", "5"), 0),
+            ast.Block([ast.Constant("c", ast.StaticValue("int", "1"), 1)]),
+            ast.DefineVariable("y", "int", 0, False, ast.Reference("c")),
+            ast.Constant("d", ast.StaticValue("int", "2"), 0),
+            ast.Variable("d", ast.StaticValue("int", "3"), 0),
+            ast.DefineVariable("z", "int", 0, False, ast.Reference("d")),
+        ]
+    )
+    optimizer.fold_constants(tree)
+
+    assert tree.below[2].value == ast.Reference("c")  # type: ignore
+    assert tree.below[5].value == ast.Reference("d")  # type: ignore
+
+
+def test_optimize_unreachable_errors() -> None:
+    """Tests only reporting errors of operations, which may be executed."""
+
+    def tree() -> ast.Main:
+        return ast.Main(
+            [
+                ast.If(
+                    ast.StaticValue("bool", "false"),
+                    ast.Block(
+                        [
+                            ast.DefineVariable(
+                                "x",
+                                "int",
+                                0,
+                                False,
+                                ast.BinaryOperation(
+                                    "DIVIDE",
+                                    ast.StaticValue("int", "1"),
+                                    ast.StaticValue("int", "0"),
+                                    "int",
+                                ),
+                                1,
+                            )
+                        ]
+                    ),
+                )
+            ]
+        )
+
+    result = optimizer.optimize(tree())
+
+    assert result.tree.below == []  # type: ignore
+
+    with pytest.raises(SystemExit) as error:
+        optimizer.fold_constants(tree())
+
+    assert error.value.code == 17
+
+
+def definition(name: str, value: Optional[ast.Node] = None) -> ast.DefineVariable:
+    """Creates a variable definition for testing.
+
+    Args:
+        name (str): Name of the variable.
+        value (Optional[ast.Node]): Value of the variable.
+
+    Returns:
+        ast.DefineVariable: Definition node.
+    """
+
+    if value is None:
+        return ast.DefineVariableNovalue(name, "int", 0, False)
+
+    return ast.DefineVariable(name, "int", 0, False, value)
+
+
+def test_unused_declarations() -> None:
+    """Tests finding declarations, which can be removed."""
+
+    tree = parser.Parser(
+        lexer.lex(
+            "int a = 1;\nint b = a;\nint c = 2;\nint d = c + 1;\n?int e;\n"
+            "int[] f = [1, 2];\nimport m;"
+        )
+    ).parse()
+
+    assert sorted(
+        declaration.name for declaration in optimizer.unused_declarations(tree)
+    ) == ["a", "b", "e", "f"]
+
+    optimizer.eliminate_dead_code(tree)
+
+    assert [statement.name for statement in tree.below] == ["c", "d", "m"]
+
+
+def test_unused_declarations_constants() -> None:
+    """Tests finding unused constants, the values of which can be references."""
+
+    tree = ast.Main(
+        [
+            definition("a", ast.StaticValue("int", "1")),
+            ast.Constant("b", ast.Reference("a"), 0),
+            ast.Constant("c", ast.StaticValue("int", "2"), 0),
+            ast.Return(ast.Reference("c")),
+        ]
+    )
+
+    assert [
+        declaration.name for declaration in optimizer.unused_declarations(tree)
+    ] == ["b", "a"]
+
+
+@pytest.mark.parametrize(
+    "terminator",
+    [ast.Return(), ast.Break(), ast.Continue(), ast.Throw("error")],
+)
+def test_eliminate_unreachable(terminator: ast.Node) -> None:
+    """Tests removing statements after terminating statements.
+
+    Args:
+        terminator (ast.Node): Terminating statement.
+    """
+
+    block = ast.Block([ast.Import("m", 1), terminator, ast.Import("n", 1)])
+    tree = ast.Main([block, ast.Import("o", 0)])
+    eliminator = optimizer.DeadCodeEliminator()
+    eliminator.visit(tree)
+
+    assert block.below == [ast.Import("m", 1), terminator]
+    assert tree.below == [block]  # The block always terminates
+    assert eliminator.removed == 2
+
+
+def test_eliminate_if() -> None:
+    """Tests replacing ifs with literal conditions by the branch taken."""
+
+    taken = ast.Block([ast.Import("m", 1)])
+    unknown = ast.If(ast.Reference("a"), ast.Block(), ast.Block())
+    tree = ast.Main(
+        [
+            ast.If(ast.StaticValue("bool", "true"), taken, ast.Block([ast.Break()])),
+            ast.If(ast.StaticValue("bool", "false"), ast.Block()),
+            ast.If(
+                ast.StaticValue("bool", "false"),
+                ast.Block(),
+                ast.If(ast.StaticValue("bool", "true"), ast.Block([ast.Continue()])),
+            ),
+            unknown,
+            ast.Import("n", 0),
+        ]
+    )
+    eliminator = optimizer.DeadCodeEliminator()
+    eliminator.visit(tree)
+
+    # The taken else branch always continues, so the rest is unreachable
+    assert tree.below == [taken, ast.Block([ast.Continue()])]
+    assert eliminator.removed == 17
+
+
+def test_eliminate_terminating_if() -> None:
+    """Tests removing statements after ifs, which terminate in all branches."""
+
+    returning = ast.If(
+        ast.Reference("a"),
+        ast.Block([ast.Return()]),
+        ast.If(ast.Reference("b"), ast.Block([ast.Break()]), ast.Block([ast.Return()])),
+    )
+    partial = ast.If(ast.Reference("a"), ast.Block([ast.Return()]))
+
+    tree = ast.Main([partial, returning, ast.Import("m", 0)])
+    optimizer.eliminate_dead_code(tree)
+
+    assert tree.below == [partial, returning]
+
+
+def test_optimize_conditions() -> None:
+    """Tests optimizing constants and variables with conditions."""
+
+    tree = ast.Main(
+        [
+            ast.Constant("a", ast.StaticValue("int", "1"), 0, conditions=["a > 0"]),
+            ast.Variable("b", ast.Reference("a"), 0, conditions=["b < 2"]),
+            ast.Variable("c", ast.Reference("b"), 0, conditions=["c < 2"]),
+            ast.Return(ast.Reference("b")),
+        ]
+    )
+    result = optimizer.optimize(tree)
+
+    assert [statement.name for statement in tree.below] == ["b", "return"]
+    assert tree.below[0].value == ast.StaticValue("int", "1")  # type: ignore
+    assert tree.below[0].conditions == ["b < 2"]  # type: ignore[union-attr]
+    assert (result.folded, result.removed) == (1, 4)
+
+
+def test_optimize() -> None:
+    """Tests folding constants and removing the code made dead by it."""
+
+    tree = ast.Main(
+        [
+            definition("a", ast.StaticValue("int", "1")),
+            definition("b", ast.Reference("a")),
+            definition("c", ast.StaticValue("int", "2")),
+            ast.If(
+                ast.BinaryOperation(
+                    "LESS",
+                    ast.StaticValue("int", "1"),
+                    ast.StaticValue("int", "2"),
+                    "bool",
+                ),
+                ast.Block([ast.Return(ast.Reference("c")), definition("d")]),
+                ast.Block([ast.Return(ast.Reference("e"))]),
+            ),
+            definition("e", ast.StaticValue("int", "3")),
+        ]
+    )
+    result = optimizer.optimize(tree)
+
+    assert result.tree is tree
+    assert tree.below == [
+        definition("c", ast.StaticValue("int", "2")),
+        ast.Block([ast.Return(ast.Reference("c"))]),
+    ]
+    assert (result.folded, result.removed) == (1, 12)
@@ -0,0 +1,640 @@
+"""
+I Language parser test.
+Version: 0.1.16
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import concurrent.futures
+import io
+import pathlib
+import pickle
+import sys
+from typing import (
+    Any,
+    Iterator,
+    Tuple,
+)
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import _ast as ast  # pylint: disable=E0401, C0413
+from Main import _types, lexer, parser, visitor  # pylint: disable=E0401, C0413
+
+
+###############
+# PARSER TEST #
+###############
+
+
+def parse(source: str, parser_class: Any = parser.Parser) -> ast.Main:
+    """Parses a source.
+
+    Args:
+        source (str): Source to parse.
+        parser_class (Any): Parser to use.
+
+    Returns:
+        ast.Main: Parse tree of the source.
+    """
+
+    return parser_class(lexer.lex(source)).parse(start=ast.Main())
+
+
+def test_parse() -> None:
+    """Tests parsing definitions and imports."""
+
+    parser_ = parser.Parser(
+        lexer.lex('import math;\nint a = 1;\n?string b;\nfloat[] c = [1.5, 2.5];\n')
+    )
+    tree = parser_.parse(start=ast.Main())
+
+    assert [node.__class__.__name__ for node in tree.below] == [
+        "Import",
+        "DefineVariable",
+        "DefineVariableNovalue",
+        "DefineVariable",
+    ]
+    assert tree.below[0].name == "math"  # type: ignore[union-attr]
+    assert tree.below[1].value == ast.StaticValue("int", "1")  # type: ignore
+    assert tree.below[2].indefinite  # type: ignore[union-attr]
+    assert tree.below[3].list_dimension == 1  # type: ignore[union-attr]
+    assert [value.value for value in tree.below[3].value.values] == [  # type: ignore
+        "1.5",
+        "2.5",
+    ]
+    assert set(parser_.symbols) == {"a", "b", "c"}
+    assert parser_.symbols.lookup("a") is tree.below[1]
+
+
+def test_parse_constants() -> None:
+    """Tests parsing constant definitions."""
+
+    parser_ = parser.Parser(
+        lexer.lex("const int a = 1;\nconst pi = 3.14;\nconst int[] b = [1];\n")
+    )
+    tree = parser_.parse(start=ast.Main())
+
+    assert [node.__class__.__name__ for node in tree.below] == ["Constant"] * 3
+    assert [node.type for node in tree.below] == [  # type: ignore[union-attr]
+        _types.Int,
+        _types.Dynamic,
+        _types.List,
+    ]
+    assert tree.below[0].value == ast.StaticValue("int", "1")  # type: ignore
+    assert tree.below[1].value == ast.StaticValue("float", "3.14")  # type: ignore
+    assert tree.below[2].value.dimension == 1  # type: ignore[union-attr]
+    assert [node.line for node in tree.below] == [0, 1, 2]  # type: ignore
+    assert parser_.symbols.lookup("pi") is tree.below[1]
+
+
+def test_parse_independent() -> None:
+    """Tests parsers do not share their variables."""
+
+    for _ in range(2):
+        tree = parser.Parser(lexer.lex("int a = 1;")).parse(start=ast.Main())
+        assert tree.below[0].name == "a"  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize(
+    "data, name",
+    [
+        ("int a = 1;\nint a = 2;", "varoverlap"),
+        ('int a = "text";', "unmatchingtype"),
+        ("int a = ;", "nosetvalue"),
+        ("const int a;", "nosetvalue"),
+        ('const int a = "text";', "unmatchingtype"),
+        ("const int a = 1;\nint a = 2;", "varoverlap"),
+        ("import ;", "notaname"),
+    ],
+)
+def test_parse_errors(data: str, name: str) -> None:
+    """Tests errors while parsing.
+
+    Args:
+        data (str): Data to test.
+        name (str): Expected name of the error.
+    """
+
+    with pytest.raises(parser.ParserError) as error:
+        parse(data)
+
+    assert error.value.name == name
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "int a = 1;\nstring b = \"text\";\n\nbool c = true;",
+        "?float a;\n?int b = null;\nimport math;",
+        "int[] a = [1,\n2, 3];\ndynamic[] b = [1, \"a\"];\nhex[] c = [];",
+        "{\nint a = 1;\n}\nint a = 2;",
+    ],
+)
+def test_parse_legacy(data: str) -> None:
+    """Tests the parser returns the same tree as the legacy parser.
+
+    Args:
+        data (str): Data to test.
+    """
+
+    assert parse(data) == parse(data, parser.LegacyParser)
+
+
+def test_parse_legacy_isolated() -> None:
+    """Tests legacy parsers share no variables or start nodes."""
+
+    tokens = lexer.lex("int a = 1;")
+    legacy = parser.LegacyParser(tokens)
+    tree = legacy.parse()
+
+    assert parser.LegacyParser(tokens).parse() == tree
+    assert parser.LegacyParser(tokens).parse() is not tree
+
+    with pytest.raises(parser.ParserError) as error:
+        legacy.parse()  # The variable is known to this parser
+
+    assert error.value.name == "varoverlap"
+
+
+def test_parse_nested_lists() -> None:
+    """Tests parsing nested lists, which the legacy parser can not parse."""
+
+    tree = parse("int[][] a = [[1, 2], [3]];")
+
+    assert tree.below[0].value.dimension == 1  # type: ignore[union-attr]
+    assert [
+        [value.value for value in values.values]
+        for values in tree.below[0].value.values  # type: ignore[union-attr]
+    ] == [["1", "2"], ["3"]]
+
+
+def test_parse_nested_lists_deep() -> None:
+    """Tests parsing lists nested deeper than the recursion limit."""
+
+    depth = sys.getrecursionlimit() * 2
+    tree = parse("int[] a = " + "[" * depth + "1" + "]" * depth + ";")
+    value = tree.below[0].value  # type: ignore[union-attr]
+
+    for dimension in range(1, depth + 1):
+        assert (value.dimension, value.type) == (dimension, "int")
+        value = value.values[0]
+
+    assert (value.type, value.value) == ("int", "1")
+
+
+def postfix(source: str) -> str:
+    """Returns the instructions of an expression in postfix order as text.
+
+    Args:
+        source (str): Expression to parse.
+
+    Returns:
+        str: Instructions separated by spaces.
+    """
+
+    parser_ = parser.Parser(lexer.lex(source + ";"))
+    parser_.end = len(parser_.tokens) - 1
+    instructions = parser_.parse_postfix()
+
+    assert instructions is not None
+
+    return " ".join(
+        f"{opcode}/{argument}"
+        if opcode not in ("VALUE", "NAME")
+        else getattr(argument, "value", argument)
+        for opcode, argument, _ in instructions
+    )
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ("1", "1"),
+        ("a - b - c", "a b MINUS/2 c MINUS/2"),
+        ("a + b * c", "a b c MULTIPLY/2 PLUS/2"),
+        ("-a * b", "a MINUS/1 b MULTIPLY/2"),
+        ("!a && b || c", "a NOT/1 b AND/2 c OR/2"),
+        ("a < b == c != d", "a b LESS/2 c EQUAL/2 d NOT_EQUAL/2"),
+        ("a * (b - (c + d)) % e", "a b c d PLUS/2 MINUS/2 MULTIPLY/2 e MODULO/2"),
+        ("- -\n1", "1 MINUS/1 MINUS/1"),
+    ],
+)
+def test_parse_postfix(data: str, expected: str) -> None:
+    """Tests parsing expressions into instructions in postfix order.
+
+    Args:
+        data (str): Data to test.
+        expected (str): Expected instructions.
+    """
+
+    assert postfix(data) == expected
+
+
+def test_parse_postfix_nested() -> None:
+    """Tests parsing expressions nested deeper than the recursion limit."""
+
+    depth = sys.getrecursionlimit() * 2
+
+    assert postfix("(" * depth + "1" + ")" * depth) == "1"
+    assert postfix("- " * depth + "1") == "1" + " MINUS/1" * depth
+
+
+def test_parse_expression() -> None:
+    """Tests parsing definitions with expressions."""
+
+    tree = parse(
+        "int a = -1 + 2 * 3;\nfloat b = 1 / 2.5;\nbool c = 1 < 2 && !a;\n"
+        "int d = (a + b) % 2;\nstring e = \"a\" + \"b\";\n"
+    )
+    value = tree.below[0].value  # type: ignore[union-attr]
+
+    assert isinstance(value, ast.BinaryOperation)
+    assert (value.operator, value.type) == ("PLUS", "int")
+    assert isinstance(value.left, ast.UnaryOperation)
+    assert value.right.operator == "MULTIPLY"  # type: ignore[attr-defined]
+    assert [node.value.type for node in tree.below] == [  # type: ignore[union-attr]
+        "int",
+        "float",
+        "bool",
+        None,
+        "string",
+    ]
+
+    for source in ("int a = 1 + 1.5;", "int a = (1 + 2;", "int a = 1 +;"):
+        with pytest.raises(parser.ParserError) as error:
+            parse(source)
+
+        assert error.value.name == "unmatchingtype"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_statements(chunk_size: int) -> None:
+    """Tests parsing a token stream returns the statements of parsing all tokens.
+
+    Args:
+        chunk_size (int): Chunk size to lex the source with.
+    """
+
+    source = 'import math;\n{\nint a = 1;\n}\n?string b;\nint[] c = [1,\n2];\nint d'
+    statements = parser.Parser().iter_statements(
+        lexer.iter_lex(io.StringIO(source), chunk_size)
+    )
+
+    assert list(statements) == parse(source).below
+
+
+def test_iter_statements_lazy() -> None:
+    """Tests statements are parsed before the rest of the stream is read."""
+
+    read = []
+
+    def tokens() -> Iterator[lexer.LexerToken]:
+        for token in lexer.lex("int a = 1;\nint a = 2;"):
+            read.append(token)
+            yield token
+
+    statements = parser.Parser().iter_statements(tokens())
+
+    assert next(statements).name == "a"  # type: ignore[union-attr]
+    assert read[-1].type == "SEMICOLON" and len(read) == 5
+
+    with pytest.raises(parser.ParserError) as error:
+        next(statements)
+
+    assert error.value.name == "varoverlap"
+
+
+def reparse(
+    parser_: parser.Parser,
+    previous: parser.ParseResult,
+    tokens: lexer.TokenBuffer,
+    source: str,
+    old: str,
+    new: str,
+) -> Tuple[parser.ParseResult, lexer.TokenBuffer, str]:
+    """Replaces the first occurrence of a text in a source and parses it again.
+
+    Args:
+        parser_ (parser.Parser): Parser of the previous result.
+        previous (parser.ParseResult): Result of the source.
+        tokens (lexer.TokenBuffer): Tokens of the source.
+        source (str): Source to edit.
+        old (str): Text to replace.
+        new (str): Text to replace it with.
+
+    Returns:
+        Tuple[parser.ParseResult, lexer.TokenBuffer, str]: Result, tokens and source
+                                                           after the edit.
+    """
+
+    offset = source.index(old)
+    edit = lexer.relex(tokens, offset, len(old), new)
+    result = parser_.reparse(
+        previous, edit.buffer, edit.start, edit.old_end, edit.new_end  # type: ignore
+    )
+
+    return result, edit.buffer, source[:offset] + new + source[offset + len(old) :]
+
+
+def test_parse_memoize() -> None:
+    """Tests reparse reuses the lists an edit did not change."""
+
+    source = "int[][] a = [[1, 2], [3]];\nint[][] b = [[4], [5, 6]];\n"
+    tokens = lexer.lex(source, compact=True)
+    parser_ = parser.Parser(tokens, memoize=True)
+    result = parser_.parse(recover=True)
+    lists = result.tree.below[1].value  # type: ignore[union-attr]
+
+    stats = parser_.memo_stats["parse_value"]
+
+    assert (stats.lookups, stats.entries) == (0, 6)  # Nothing to recall yet
+
+    result, tokens, source = reparse(
+        parser_, result, tokens, source, "b =", "c ="  # type: ignore[arg-type]
+    )
+
+    assert result.tree == parse(source)
+    assert result.tree.below[1].value is lists  # The whole list is recalled
+    assert (stats.lookups, stats.hits) == (1, 1)
+
+    result, tokens, source = reparse(parser_, result, tokens, source, "4", "7")
+    values = result.tree.below[1].value.values  # type: ignore[union-attr]
+
+    assert result.tree == parse(source)
+    assert values[0] is not lists.values[0]
+    assert values[1] is lists.values[1]  # Only the lists after the edit
+    assert (stats.lookups, stats.hits) == (4, 2)
+    assert stats.hit_rate == 0.5
+    assert "parse_define_variable" not in parser_.memo_stats  # Defines variables
+
+
+def test_parse_memoize_limit() -> None:
+    """Tests rules hit too rarely are no longer memoized."""
+
+    source = "int[][] a = [[1], [2]];"
+    tokens = lexer.lex(source, compact=True)
+    parser_ = parser.Parser(tokens, memoize=True, memo_limit=1)
+    result = parser_.parse(recover=True)
+    stats = parser_.memo_stats["parse_value"]
+    entries = stats.entries
+
+    result, tokens, source = reparse(
+        parser_, result, tokens, source, "1", "3"  # type: ignore[arg-type]
+    )
+
+    assert result.tree == parse(source)
+    assert stats.disabled  # The list around the edit missed
+    assert (stats.lookups, stats.hits, stats.entries) == (1, 0, entries)
+
+
+def test_parse_recover() -> None:
+    """Tests collecting all errors while parsing."""
+
+    source = (
+        "int a = 1;\nint a = 2;\nimport ;\n{\nint b = 1\n}\n"
+        'int c = "text";\nstring d = "text";\n'
+    )
+    result = parser.Parser(lexer.lex(source)).parse(recover=True)
+
+    assert [error.name for error in result.errors] == [  # type: ignore[union-attr]
+        "varoverlap",
+        "notaname",
+        "unmatchingtype",
+    ]
+    assert [error.line for error in result.errors] == [2, 3, 7]  # type: ignore
+    assert result.complete  # type: ignore[union-attr]
+    assert [
+        node.name if node is not None else None
+        for node in result.tree.below  # type: ignore[union-attr]
+    ] == ["a", None, "d"]
+
+
+def test_parse_recover_max_errors() -> None:
+    """Tests parsing stops at the maximum number of errors."""
+
+    result = parser.Parser(lexer.lex("import ;\n" * 5 + "int a = 1;")).parse(
+        recover=True, max_errors=3
+    )
+
+    assert len(result.errors) == 3  # type: ignore[union-attr]
+    assert not result.complete  # type: ignore[union-attr]
+    assert not result.tree.below  # type: ignore[union-attr]
+
+
+def test_parse_recover_unmatched_block() -> None:
+    """Tests an unmatched '}' ends a statement when recovering."""
+
+    result = parser.Parser(lexer.lex("int a = 1;\n}\nint b = ;\nint c = 1;\n")).parse(
+        recover=True
+    )
+
+    assert [error.name for error in result.errors] == [  # type: ignore[union-attr]
+        "nosetvalue"
+    ]
+    assert [
+        node.name if node is not None else None
+        for node in result.tree.below  # type: ignore[union-attr]
+    ] == ["a", None, "c"]
+
+
+@pytest.mark.parametrize(
+    "data, offset, removed, inserted",
+    [
+        ("int a = 1;\nint b = 2;\nint c = 3;\n", 19, 1, "5"),
+        ("int a = 1;\nint b = 2;\nint c = 3;\n", 0, 0, "\n\nimport m;\n"),
+        ("int a = 1;\nint b = 2;\nint a = 3;\n", 0, 10, ""),
+        ("int a = 1;\nint b = 2;\nint a = 3;\n", 4, 1, "c"),
+        ("int a = 1;\nint b = 2;\nint c = 3;\n", 15, 1, "a"),
+        ("int a = 1;\n{\nint b = 2;\n}\nint c = 3;\n", 11, 1, ""),
+        ("int a = 1;\nint b = 2;\nimport ;\nint b = 4;\n", 9, 1, "\n\n;"),
+        ("int a = 1;", 10, 0, "\nint a = 2;"),
+    ],
+)
+def test_reparse(data: str, offset: int, removed: int, inserted: str) -> None:
+    """Tests parsing the statements changed by an edit again.
+
+    Args:
+        data (str): Data to test.
+        offset (int): Offset of the edit.
+        removed (int): Number of removed characters.
+        inserted (str): Inserted text.
+    """
+
+    old = lexer.lex(data, compact=True)
+    parser_ = parser.Parser(old)
+    previous = parser_.parse(recover=True)
+    nodes = list(previous.tree.below)  # type: ignore[union-attr]
+    edit = lexer.relex(old, offset, removed, inserted)
+
+    result = parser_.reparse(
+        previous, edit.buffer, edit.start, edit.old_end, edit.new_end  # type: ignore
+    )
+
+    source = data[:offset] + inserted + data[offset + removed :]
+    expected_parser = parser.Parser(lexer.lex(source))
+    expected = expected_parser.parse(recover=True)
+
+    assert result.tree == expected.tree  # type: ignore[union-attr]
+    assert [str(error) for error in result.errors] == [
+        str(error) for error in expected.errors  # type: ignore[union-attr]
+    ]
+    assert [
+        (statement.first, statement.end, statement.line)
+        for statement in result.statements
+    ] == [
+        (statement.first, statement.end, statement.line)
+        for statement in expected.statements  # type: ignore[union-attr]
+    ]
+    assert sorted(parser_.symbols) == sorted(expected_parser.symbols)
+    assert result.definitions.keys() == expected.definitions.keys()  # type: ignore
+    assert all(  # The statements before the edit are not parsed again
+        any(statement.node is node for node in nodes)
+        for statement in result.statements
+        if statement.end < edit.start and statement.error is None
+    )
+
+
+def test_reparse_reuse() -> None:
+    """Tests only the edited statement is parsed again."""
+
+    source = "".join(f"int a{index} = {index};\n" for index in range(100))
+    old = lexer.lex(source, compact=True)
+    parser_ = parser.Parser(old)
+    previous = parser_.parse(recover=True)
+    nodes = list(previous.tree.below)  # type: ignore[union-attr]
+    edit = lexer.relex(old, source.index("50;"), 2, "1.5")
+
+    result = parser_.reparse(
+        previous, edit.buffer, edit.start, edit.old_end, edit.new_end  # type: ignore
+    )
+
+    assert [error.name for error in result.errors] == ["unmatchingtype"]
+    assert [node for node in result.tree.below if node not in nodes] == []
+    assert len(result.tree.below) == 99
+    assert "a50" not in parser_.symbols
+
+    with pytest.raises(ValueError):
+        parser_.reparse(parser.ParseResult(ast.Main(), [], False), old, 0, 0, 0)
+
+
+def test_reparse_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests edits across the chunks of the statements change the result in place.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Fixture to make the chunks small.
+    """
+
+    monkeypatch.setattr(parser, "STATEMENT_CHUNK", 2)
+    source = "".join(f"int a{index} = {index};\n" for index in range(10))
+    tokens = lexer.lex(source, compact=True)
+    parser_ = parser.Parser(tokens)
+    result = parser_.parse(recover=True)
+    tree = result.tree  # type: ignore[union-attr]
+
+    for offset, removed, inserted in (
+        (source.index("a3 ="), 0, "\n"),  # Shifts the lines of the chunks after
+        (source.index("int a5"), 0, "int a8 = 1;\n{\nint b = 2;\n}\n"),
+        (source.index("int a7"), len("int a7 = 7;\n"), ""),
+        (source.index("int a8"), len("int a8 = 8;\nint a9"), "int a0"),
+    ):
+        edit = lexer.relex(tokens, offset, removed, inserted)
+        result = parser_.reparse(
+            result, edit.buffer, edit.start, edit.old_end, edit.new_end  # type: ignore
+        )
+        source = source[:offset] + inserted + source[offset + removed :]
+        tokens = edit.buffer
+        expected_parser = parser.Parser(lexer.lex(source))
+        expected = expected_parser.parse(recover=True)
+
+        assert result.tree is tree  # type: ignore[union-attr]
+        assert tree == expected.tree  # type: ignore[union-attr]
+        assert [str(error) for error in result.errors] == [
+            str(error) for error in expected.errors  # type: ignore[union-attr]
+        ]
+        assert [
+            (statement.first, statement.end, statement.line)
+            for statement in result.statements
+        ] == [
+            (statement.first, statement.end, statement.line)
+            for statement in expected.statements  # type: ignore[union-attr]
+        ]
+        assert sorted(parser_.symbols) == sorted(expected_parser.symbols)
+
+
+def test_parse_parallel() -> None:
+    """Tests parsing in parallel processes returns the same tree and errors."""
+
+    source = "".join(
+        f"int a{index} = {index};\nstring b{index} = \"text\";\n" for index in range(50)
+    )
+    broken = source + "int a3 = 1;\nimport ;\nint c = 1.5;\n?int a3;\n"
+    blocks = "}{;int a;}{;int a;\n{int b;}"  # Scopes change between statements
+    operations = "int a = 1;\nint b = -a + 2 * 3;\n"
+    block = "int a = 1;\n{ int b = 2; }"  # No ';' follows the last statement
+
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        tree = parser.Parser(lexer.lex(source)).parse_parallel(2, executor=executor)
+        result = parser.Parser(lexer.lex(broken)).parse_parallel(
+            2, recover=True, executor=executor
+        )
+
+        with pytest.raises(parser.ParserError) as error:
+            parser.Parser(lexer.lex(broken)).parse_parallel(2, executor=executor)
+
+        scoped = parser.Parser(lexer.lex(blocks)).parse_parallel(2, executor=executor)
+        operated = parser.Parser(lexer.lex(operations)).parse_parallel(
+            2, executor=executor
+        )
+        trailing = parser.Parser(lexer.lex(block)).parse_parallel(
+            2, recover=True, executor=executor
+        )
+
+    expected = parser.Parser(lexer.lex(broken)).parse(recover=True)
+
+    assert tree == parse(source)
+    assert result.tree == expected.tree  # type: ignore[union-attr]
+    assert [str(item) for item in result.errors] == [  # type: ignore[union-attr]
+        str(item) for item in expected.errors  # type: ignore[union-attr]
+    ]
+    assert (error.value.name, error.value.line) == ("varoverlap", 101)
+    assert scoped == parse(blocks)
+    assert trailing.tree == parser.Parser(  # type: ignore[union-attr]
+        lexer.lex(block)
+    ).parse(recover=True).tree
+    assert [  # Offsets are not compared with the nodes
+        getattr(node, "offset", None) for node in visitor.walk(operated)
+    ] == [getattr(node, "offset", None) for node in visitor.walk(parse(operations))]
+
+
+def test_parser_error_pickle() -> None:
+    """Tests parser errors can be sent to other processes."""
+
+    error = parser.ParserError("notaname", "Expected a module name", 2)
+    loaded = pickle.loads(pickle.dumps(error))
+
+    assert (loaded.name, loaded.help, loaded.line) == ("notaname", error.help, 3)
@@ -0,0 +1,111 @@
+"""
+I Language symbol table test.
+Version: 0.1.1
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import _ast as ast  # pylint: disable=E0401, C0413
+from Main import symbols  # pylint: disable=E0401, C0413
+
+
+#####################
+# SYMBOL TABLE TEST #
+#####################
+
+
+def variable(name: str) -> ast.DefineVariable:
+    """Returns a definition of an integer variable.
+
+    Args:
+        name (str): Name of the variable.
+
+    Returns:
+        ast.DefineVariable: Definition of the variable.
+    """
+
+    return ast.DefineVariable(name, "int", 0, False, ast.StaticValue("int", "1"))
+
+
+def test_symbol_table() -> None:
+    """Tests defining and looking up variables in nested scopes."""
+
+    table = symbols.SymbolTable()
+    outer, inner, local = variable("a"), variable("a"), variable("b")
+
+    assert table.define(outer) is outer
+    table.push()
+    table.define(inner)
+    table.define(local)
+
+    assert table.depth == 1
+    assert table.lookup("a") is inner
+    assert table.bindings["a"].shadowed.node is outer  # type: ignore[union-attr]
+    assert set(table) == {"a", "b"}
+
+    table.pop()
+
+    assert table.depth == 0
+    assert table.lookup("a") is outer
+    assert table.lookup("b") is None
+    assert len(table) == 1
+
+
+def test_symbol_table_pop_global() -> None:
+    """Tests the global scope is never left."""
+
+    table = symbols.SymbolTable()
+    table.define(variable("a"))
+    table.pop()
+
+    assert "a" in table
+    assert table.depth == 0
+
+
+def test_symbol_table_undefine() -> None:
+    """Tests forgetting a variable restores the variable it shadows."""
+
+    table = symbols.SymbolTable()
+    outer, inner = variable("a"), variable("a")
+    table.define(outer)
+    table.push()
+    table.define(inner)
+    table.undefine("a")
+
+    assert table.lookup("a") is outer
+
+    table.pop()  # Skips the forgotten variable
+
+    assert table.lookup("a") is outer
+
+    table.undefine("a")
+    table.undefine("b")
+
+    assert "a" not in table
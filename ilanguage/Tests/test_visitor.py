@@ -0,0 +1,254 @@
+"""
+I Language visitor test.
+Version: 0.1.0
+
+Copyright (c) 2023-present I Language Development.
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the 'Software'),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+###########
+# IMPORTS #
+###########
+
+import pathlib
+import sys
+from typing import (
+    List,
+    Optional,
+)
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from Main import _ast as ast  # pylint: disable=E0401, C0413
+from Main import lexer, parser, visitor  # pylint: disable=E0401, C0413
+
+
+################
+# VISITOR TEST #
+################
+
+
+def tree(data: str) -> ast.Node:
+    """Parses the data for testing.
+
+    Args:
+        data (str): Data to parse.
+
+    Returns:
+        ast.Node: Parsed tree.
+    """
+
+    return parser.Parser(lexer.lex(data)).parse()
+
+
+class Recorder(visitor.NodeVisitor):
+    """
+    Records the visited nodes.
+    """
+
+    def __init__(self) -> None:
+        self.events: List[str] = []
+
+    def visit_Node(self, node: ast.Node) -> None:  # pylint: disable=C0103
+        """Records entering a node."""
+
+        self.events.append(f"+{type(node).__name__}")
+
+    def visit_DefineVariable(self, node: ast.Node) -> object:  # pylint: disable=C0103
+        """Records entering a definition, skipping its value."""
+
+        self.events.append(f"+{node.name}")
+
+        return visitor.PRUNE if node.name == "skip" else None
+
+    def leave_BinaryOperation(self, node: ast.Node) -> None:  # pylint: disable=C0103
+        """Records leaving an operation."""
+
+        self.events.append(f"-{node.name}")
+
+
+def test_walk() -> None:
+    """Tests walking all nodes of a tree."""
+
+    assert [type(node).__name__ for node in visitor.walk(tree("int a = 1 + 2;"))] == [
+        "Main",
+        "DefineVariable",
+        "BinaryOperation",
+        "StaticValue",
+        "StaticValue",
+    ]
+    assert not list(visitor.walk(None))
+
+
+def test_node_visitor() -> None:
+    """Tests the order, dispatch and pruning of visitors."""
+
+    recorder = Recorder()
+    recorder.visit(tree("int a = 1 + 2;\nint skip = 3 * 4;\n?int b;\nimport m;"))
+
+    assert recorder.events == [
+        "+Main",
+        "+a",
+        "+BinaryOperation",
+        "+StaticValue",
+        "+StaticValue",
+        "-PLUS",
+        "+skip",
+        "+b",  # The subclass is handled by the definition method
+        "+Import",
+    ]
+    assert set(Recorder._methods) == {  # pylint: disable=W0212
+        ast.Main,
+        ast.DefineVariable,
+        ast.BinaryOperation,
+        ast.StaticValue,
+        ast.DefineVariableNovalue,
+        ast.Import,
+    }
+    assert not visitor.NodeVisitor._methods  # pylint: disable=W0212
+
+
+def test_node_visitor_deep() -> None:
+    """Tests visiting trees deeper than the recursion limit."""
+
+    depth = sys.getrecursionlimit() * 2
+    node: ast.Node = ast.StaticValue("int", "1")
+    for _ in range(depth):
+        node = ast.UnaryOperation("MINUS", node, "int")
+
+    recorder = Recorder()
+    recorder.visit(node)
+
+    assert len(recorder.events) == depth + 1
+
+
+class Folder(visitor.NodeTransformer):
+    """
+    Adds integer literals and removes imports.
+    """
+
+    def leave_BinaryOperation(  # pylint: disable=C0103
+        self, node: ast.BinaryOperation
+    ) -> ast.Node:
+        """Adds literal operands."""
+
+        if isinstance(node.left, ast.StaticValue) and isinstance(
+            node.right, ast.StaticValue
+        ):
+            total = int(node.left.value) + int(node.right.value)
+            return ast.StaticValue("int", str(total))
+
+        return node
+
+    def leave_Import(  # pylint: disable=C0103
+        self, node: ast.Node
+    ) -> Optional[ast.Node]:
+        """Removes imports, except of one duplicating itself."""
+
+        return [node, node] if node.name == "twice" else None  # type: ignore
+
+    def visit_UnaryOperation(self, node: ast.Node) -> object:  # pylint: disable=C0103
+        """Keeps unary operations unchanged."""
+
+        return visitor.PRUNE
+
+
+def test_node_transformer() -> None:
+    """Tests replacing, removing and keeping nodes."""
+
+    transformed = Folder().visit(
+        tree("import m;\nint a = 1 + 2 + 3;\nint b = -(1 + 2) + a;\nimport twice;")
+    )
+
+    assert [node.name for node in transformed.below] == ["a", "b", "twice", "twice"]
+
+    definition = transformed.below[0]
+    assert definition.value == ast.StaticValue("int", "6")
+    assert definition.value is definition.below[0]
+
+    operation = transformed.below[1].value
+    assert isinstance(operation.left, ast.UnaryOperation)
+    assert isinstance(operation.left.operand, ast.BinaryOperation)  # Pruned
+    assert (operation.left, operation.right) == tuple(operation.below)
+
+
+def test_node_transformer_errors() -> None:
+    """Tests replacing nodes by several nodes where only one is possible."""
+
+    class Splitter(visitor.NodeTransformer):
+        """
+        Duplicates all literals.
+        """
+
+        def leave_StaticValue(  # pylint: disable=C0103
+            self, node: ast.Node
+        ) -> List[ast.Node]:
+            """Duplicates a literal."""
+
+            return [node, node]
+
+    with pytest.raises(TypeError):
+        Splitter().visit(tree("int a = 1 + 2;"))
+    with pytest.raises(TypeError):
+        Splitter().visit(ast.StaticValue("int", "1"))
+    assert Splitter().visit(tree("int[] a = [1];")).below[0].value.values == [
+        ast.StaticValue("int", "1"),
+        ast.StaticValue("int", "1"),
+    ]
+
+
+def test_node_transformer_root() -> None:
+    """Tests replacing and removing the root."""
+
+    assert Folder().visit(ast.Import("m", 0)) is None
+    assert Folder().visit(tree("int a = 1 + 2;").below[0].value) == ast.StaticValue(
+        "int", "3"
+    )
+
+
+def test_declarations() -> None:
+    """Tests the children of constants and variables are their values."""
+
+    value = ast.BinaryOperation(
+        "PLUS", ast.StaticValue("int", "1"), ast.StaticValue("int", "2"), "int"
+    )
+    constant = ast.Constant("a", value, 0, conditions=["a > 0"])
+    variable = ast.Variable("b", 1, 0, conditions=["b > 0"])
+    root = ast.Main([constant, variable])
+
+    assert [type(node).__name__ for node in visitor.walk(root)] == [
+        "Main",
+        "Constant",
+        "BinaryOperation",
+        "StaticValue",
+        "StaticValue",
+        "Variable",
+    ]
+
+    recorder = Recorder()
+    recorder.visit(root)
+
+    assert recorder.events[-2:] == ["-PLUS", "+Variable"]
+    assert Folder().visit(root) is root
+    assert constant.value == ast.StaticValue("int", "3")
+    assert (constant.conditions, constant.below) == (["a > 0"], ["a > 0"])
+    assert variable.value == 1
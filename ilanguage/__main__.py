@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 """
 I Language python package runner.
-Version: 0.1.1
+Version: 0.1.8
 
 Copyright (c) 2023-present I Language Development.
 
@@ -29,6 +29,8 @@ DEALINGS IN THE SOFTWARE.
 # IMPORTS #
 ###########
 
+import concurrent.futures
+import os
 import platform
 import sys
 
@@ -54,15 +56,154 @@ if (
 # EXECUTE #
 ###########
 
-if len(sys.argv[1:]) > 0:
-    try:
-        with open(sys.argv[1:][0], "r", encoding="utf-8") as file:
-            print("\n".join([str(token) for token in Main.lexer.lex(file.read())]))
-    except FileNotFoundError:
-        print("Error: The specified file does not exist.")
-    except UnicodeEncodeError:
-        print("Error: Can not read the specified file.")
-
-else:
-    print("Error: No file was specified.")
-    sys.exit(1)
+if __name__ == "__main__":  # pylint: disable=R1260
+    options = {
+        "jobs": 0,
+        "tokens": False,
+        "parse": False,
+        "parallel-parse": False,
+        "cache": True,
+        "cache-dir": Main.cache.DEFAULT_DIRECTORY,
+    }
+    paths = []
+    arguments = iter(sys.argv[1:])
+
+    for argument in arguments:
+        if argument.lower() in ["-h", "--help"]:
+            print(
+                "Usage: ilanguage [PATH ...] [-h] [-j N] [--tokens] [--parse]"
+                " [--parallel-parse] [--no-cache] [--cache-dir DIR]"
+            )
+            print("Lexes I sources. Directories are searched recursively.")
+            print("Options:")
+            print("    -h, --help             Shows this help and exits.")
+            print("    -j, --jobs N           Number of processes, defaults to the CPUs.")
+            print("    --tokens               Prints the tokens of every file.")
+            print("    --parse                Also parses the files.")
+            print("    --parallel-parse       Parses the statements of every file")
+            print("                           in parallel instead of several files.")
+            print("    --no-cache             Does not load or store cached output.")
+            print("    --cache-dir DIR        Directory of the cache.")
+            sys.exit(0)
+
+        elif argument.lower() in ["-j", "--jobs"]:
+            jobs = next(arguments, "")
+            if not jobs.isdigit() or int(jobs) < 1:
+                print(f"Error: Invalid number of jobs: {jobs!r}")
+                sys.exit(1)
+            options["jobs"] = int(jobs)
+
+        elif argument.lower() == "--tokens":
+            options["tokens"] = True
+
+        elif argument.lower() == "--parse":
+            options["parse"] = True
+
+        elif argument.lower() == "--parallel-parse":
+            options["parse"] = True
+            options["parallel-parse"] = True
+
+        elif argument.lower() == "--no-cache":
+            options["cache"] = False
+
+        elif argument.lower() == "--cache-dir":
+            options["cache-dir"] = next(arguments, "")
+            if not options["cache-dir"]:
+                print("Error: No cache directory was specified.")
+                sys.exit(1)
+
+        else:
+            paths.append(argument)
+
+    if not paths:
+        print("Error: No file was specified.")
+        sys.exit(1)
+
+    cache = Main.cache.Cache(options["cache-dir"]) if options["cache"] else None
+    single = len(paths) == 1 and not os.path.isdir(paths[0]) and not options["jobs"]
+
+    if single and cache is not None:
+        # The output of single files is loaded from and stored in the cache like in
+        # batches, so the tokens are only printed after the file is processed
+        if options["parallel-parse"]:
+            with concurrent.futures.ProcessPoolExecutor() as executor:
+                result = Main.batch.process_file(paths[0], True, True, cache, executor)
+        else:
+            result = Main.batch.process_file(paths[0], True, options["parse"], cache)
+        cache.evict()
+
+        if result.error is not None:
+            print(f"Error: {result.error}")
+            sys.exit(1)
+
+        for token in result.tokens:
+            print(token)
+        for error in result.diagnostics:
+            print(f"Error: {error}")
+        sys.exit(1 if result.diagnostics else 0)
+
+    if single:
+        # Without a cache, single files are lexed as a stream, so every token is printed when it is
+        # read. Only the tokens of parsed files are kept.
+        diagnostics = []
+        tokens = [] if options["parse"] else None
+        try:
+            with open(paths[0], "r", encoding="utf-8") as file:
+                for token in Main.lexer.iter_lex(file, diagnostics=diagnostics):
+                    print(token)
+                    if tokens is not None:
+                        tokens.append(token)
+
+            if diagnostics:  # Lines are only indexed to locate the problems
+                lines = Main.lexer.LineIndex()
+                with open(paths[0], "r", encoding="utf-8") as file:
+                    for chunk in iter(
+                        lambda: file.read(Main.lexer.DEFAULT_CHUNK_SIZE), ""
+                    ):
+                        lines.add(chunk)
+        except FileNotFoundError:
+            print("Error: The specified file does not exist.")
+            sys.exit(1)
+        except (OSError, UnicodeDecodeError):
+            print("Error: Can not read the specified file.")
+            sys.exit(1)
+
+        errors = []
+        for diagnostic in diagnostics:
+            line, column = lines.position(diagnostic.offset)
+            errors.append(f"{diagnostic.message} in line {line}, column {column}")
+        if tokens is not None:
+            parser = Main.parser.Parser(tokens)
+            result = (
+                parser.parse_parallel(recover=True)
+                if options["parallel-parse"]
+                else parser.parse(recover=True)
+            )
+            errors.extend(str(error) for error in result.errors)
+
+        for error in errors:
+            print(f"Error: {error}")
+        sys.exit(1 if errors else 0)
+
+    batch = Main.batch.run_batch(
+        paths,
+        options["jobs"],
+        options["tokens"],
+        options["parse"],
+        cache,
+        options["parallel-parse"],
+    )
+
+    for result in batch.files:
+        if result.error is not None:
+            print(f"{result.path}: Error: {result.error}")
+            continue
+
+        print(f"{result.path}: {result.token_count} tokens in {result.seconds:.3f}s")
+        for diagnostic in result.diagnostics:
+            print(f"{result.path}: Error: {diagnostic}")
+        if result.tokens is not None:
+            print("\n".join(result.tokens))
+
+    print(batch.summary())
+    sys.exit(1 if batch.failed else 0)